@@ -19,7 +19,8 @@ SU_NUM_START=0
 SU_NUM_STOP=SU_NUM_START+1
 SU_NUM_ALL=False
 PRINT_FLAG=True
-MAX_GUESS_NUM=50
+MAX_GUESS_NUM=500
+RANDOM_GUESS=False
 USE_SOLVER2=True
 SU_FILE_NAME="sudoku_1.txt"
 
@@ -64,6 +65,8 @@ if len(sys.argv)>=2:
             SU_NUM_ALL=True
         if "-noprint" in actArg:
             PRINT_FLAG=False
+        if "-random" in actArg:
+            RANDOM_GUESS=True
         if "-h" in actArg:
             print("Optional arguments for sudoku_ex1:")
             print("    -h               ... print help")
@@ -73,24 +76,22 @@ if len(sys.argv)>=2:
             print("    -start=3 -stop=8 ... solve SUDOKU #3 to #8")
             print("    -all             ... solve all SUDOKUs read from input file")
             print("    -noprint         ... no print of SUDOKU solution, just print PASS/FAIL results")
+            print("    -random          ... solver2 with random guesses instead of the systematic guess tree")
             print("    -f=sudoku_1.txt  ... read SUDOKUs from file sudoku_1.txt")
             sys.exit()
         if "-v" in actArg:
             print(f"    Welcome to sudoku_ex1, this is version {VERSION} from {VERSION_DATE}")
             sys.exit()
 
-# read the input file into arrays suText, suComment
+# the input file is read lazily, one SUDOKU at a time (constant memory also for very large files)
 myIo = sudoku_io()
 print(f"... reading file name {SU_FILE_NAME}")
-numRead = myIo.readFile(SU_FILE_NAME)
-suText, suComment = myIo.getSudokuList()
 
 # now create a sudoku class and provide SUDOKU to that class
 mySudoku = sudoku_np1()
 
 if SU_NUM_ALL:
     SU_NUM_START=0
-    SU_NUM_STOP=SU_NUM_START+numRead
 
 solver1Count = 0
 solved1List = []
@@ -98,11 +99,15 @@ solver2Count = 0
 solved2List = []
 notSolvedCount = 0
 notSolvedList = []
-for i in range(SU_NUM_START,SU_NUM_STOP):
+for i, suText, suComment in myIo.iterFile(SU_FILE_NAME):
+    if i<SU_NUM_START:
+        continue
+    if not SU_NUM_ALL and i>=SU_NUM_STOP:
+        break
     # set the sudoku by providing it in string/text form
     print(f"Reading sudoku number: {i+1}")
-    mySudoku.setSuArray(suText[i])
-    mySudoku.setComment(suComment[i])
+    mySudoku.setSuArray(suText)
+    mySudoku.setComment(suComment)
     # print the unsolved SUDOKU
     if PRINT_FLAG:
         print(f"\nInput SUDOKU array #{i+1}")
@@ -121,7 +126,7 @@ for i in range(SU_NUM_START,SU_NUM_STOP):
             solved1List.append(i+1)
 
     if not solved1 and USE_SOLVER2:
-        solved2, num_guesses = mySudoku.solver2(MAX_GUESS_NUM,DEBUG_FLAG)
+        solved2, num_guesses = mySudoku.solver2(MAX_GUESS_NUM,DEBUG_FLAG,RANDOM_GUESS)
         if solved2:
             if mySudoku.checkSudokuIsValid()==False:
                 print(f"\n=====> ERROR in solver2 solution for SUDOKU array #{i+1}: SUDOKU is not valid",end="")
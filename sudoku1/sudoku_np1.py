@@ -1,5 +1,7 @@
 """ sudoku_np1 sudoku class
 A class implementing algorithms based on algorithms used by humans to solve SUDOKUs
+The candidates are kept in a (9,9,9) boolean numpy tensor (row, col, value-1) that is
+updated in place when a cell is set, singles and hidden singles are sums over its axes
 Version 0.11, WSC, 3-Jan-2025"""
 
 import numpy as np
@@ -11,6 +13,30 @@ import time
 from sudoku_p import *
 
 USE_RANDOM_SEED = False
+# values 1..9 along the last axis of the candidate tensor
+VALUES = np.arange(1, 10)
+# number of preallocated snapshots for push/pop (every guess fills a cell, so 81 nested guesses at most)
+MAX_SNAPSHOT_DEPTH = 82
+# flat cell indices (row*9+col) of the 27 houses: rows 0-8, columns 9-17 and blocks 18-26
+_CELLS = np.arange(81).reshape(9,9)
+HOUSE_INDEX = np.concatenate([_CELLS, _CELLS.T, _CELLS.reshape(3,3,3,3).transpose(0,2,1,3).reshape(9,9)])
+# first bincount bin of each house (10 bins per house for the values 0 to 9)
+HOUSE_OFFSETS = 10 * np.arange(27)[:, None]
+# house membership matrix (27,81), a product with a (81,9) cell/value array sums the cells of every house
+HOUSE_MATRIX = np.zeros((27,81), dtype=np.float32)
+HOUSE_MATRIX[np.arange(27)[:, None], HOUSE_INDEX] = 1
+
+def countHouseValues(suArrays):
+    """number of cells with value 0 to 9 (0: undefined) in every house of one SUDOKU (9,9) or of N SUDOKUs (N,9,9),
+    all houses are gathered with HOUSE_INDEX and counted by one bincount, array (N,27,10)"""
+    flat = np.asarray(suArrays, dtype=np.intp).reshape(-1, 81)
+    n = flat.shape[0]
+    bins = flat[:, HOUSE_INDEX] + HOUSE_OFFSETS + 270 * np.arange(n)[:, None, None]
+    return np.bincount(bins.reshape(-1), minlength=270 * n).reshape(n, 27, 10)
+
+def checkSudokusAreValid(suArrays):
+    """batch check of N SUDOKUs (N,9,9), True for each SUDOKU with every value 1 to 9 exactly one time in every house"""
+    return np.all(countHouseValues(suArrays)[:, :, 1:] == 1, axis=(1, 2))
 
 class sudoku_np1:
     """python class to solve SUDOKUs in a human way (without backtracking)"""
@@ -22,9 +48,19 @@ class sudoku_np1:
         # arrays containing sudoku information
         self.suArray = np.zeros((9,9), dtype=np.int8)
         self.suArrayType = np.zeros((9,9), dtype=suElemT)
-        # arrays for store/recall
-        self.suArrayStore = np.zeros((9,9), dtype=np.int8)
-        self.suArrayTypeStore = np.zeros((9,9), dtype=suElemT)
+        # candidate tensor: candidates[row, col, val-1] is True if val is a candidate of cell row, col
+        self.candidates = np.zeros((9,9,9), dtype=bool)
+        # preallocated snapshot stack for push/pop (nested guesses) and store/recall,
+        # a snapshot holds the SUDOKU, the element types and the candidate tensor
+        self.suArrayStack = np.zeros((MAX_SNAPSHOT_DEPTH,9,9), dtype=np.int8)
+        self.suArrayTypeStack = np.zeros((MAX_SNAPSHOT_DEPTH,9,9), dtype=suElemT)
+        self.candidatesStack = np.zeros((MAX_SNAPSHOT_DEPTH,9,9,9), dtype=bool)
+        self.stackDepth = 0
+        # store/recall buffer is the bottom snapshot of the stack
+        self.suArrayStore = self.suArrayStack[0]
+        self.suArrayTypeStore = self.suArrayTypeStack[0]
+        # True if the last solver1 run stopped at a contradiction
+        self.contradiction = False
         if USE_RANDOM_SEED:
             t = int(time.time()*1000)
             rs = ((t & 0xff000000) >> 24) + \
@@ -59,35 +95,90 @@ class sudoku_np1:
                 col+=1
         self.calcAllCandidateList()
 
+    def push(self):
+        """Push a snapshot of the SUDOKU (values, types and candidates) to the snapshot stack"""
+        if self.stackDepth >= MAX_SNAPSHOT_DEPTH:
+            raise IndexError(f"snapshot stack is full ({MAX_SNAPSHOT_DEPTH} snapshots)")
+        np.copyto(self.suArrayStack[self.stackDepth], self.suArray)
+        np.copyto(self.suArrayTypeStack[self.stackDepth], self.suArrayType)
+        np.copyto(self.candidatesStack[self.stackDepth], self.candidates)
+        self.stackDepth += 1
+
+    def restoreTop(self):
+        """Restore the SUDOKU from the top snapshot of the stack, the snapshot is kept"""
+        if self.stackDepth == 0:
+            raise IndexError("snapshot stack is empty")
+        np.copyto(self.suArray, self.suArrayStack[self.stackDepth-1])
+        np.copyto(self.suArrayType, self.suArrayTypeStack[self.stackDepth-1])
+        np.copyto(self.candidates, self.candidatesStack[self.stackDepth-1])
+
+    def pop(self):
+        """Restore the SUDOKU from the top snapshot of the stack and remove the snapshot"""
+        self.restoreTop()
+        self.stackDepth -= 1
+
     def store(self):
-        """Store SUDOKU to buffer suArrayTypeStore"""
-        for row in range(0,9):
-            for col in range(0,9):
-                self.suArrayStore[row][col] =self.suArray[row][col]
-                self.suArrayTypeStore[row][col] = self.suArrayType[row][col]
+        """Store SUDOKU to buffer suArrayTypeStore (single level: the snapshot stack is cleared first)"""
+        self.stackDepth = 0
+        self.push()
 
     def recall(self):
         """Restore SUDOKU from buffer suArrayTypeStore"""
-        for row in range(0,9):
-            for col in range(0,9):
-                self.suArray[row][col] = self.suArrayStore[row][col]
-                self.suArrayType[row][col] = self.suArrayTypeStore[row][col]
+        np.copyto(self.suArray, self.suArrayStore)
+        np.copyto(self.suArrayType, self.suArrayTypeStore)
+        np.copyto(self.candidates, self.candidatesStack[0])
 
     def getSuArray(self):
         return self.suArray
     
     def calcAllCandidateList(self):
-        """central calculation of the self.allCandidateList"""
-        self.allCandidateList = []
-        for row in range(0,9):
-            for col in range(0,9):
-                if self.suArrayType[row][col] == suElemT.UNDEFINED:
-                    cl = candidateList(row,col,self.calcCandidateList(row,col))
-                    #cl.row = row
-                    #cl.col = col
-                    #cl.block = self.getBlockNum(row,col)
-                    #cl.list = self.calcCandidateList(row,col)
-                    self.allCandidateList.append(cl)  
+        """central calculation of the candidate tensor self.candidates from suArray
+        (needed after suArray was changed without setCell, e.g. after recall)"""
+        oneHot = self.suArray[:, :, None] == VALUES
+        rowUsed = oneHot.any(axis=1)                                # (row, value)
+        colUsed = oneHot.any(axis=0)                                # (col, value)
+        blockUsed = oneHot.reshape(3,3,3,3,9).any(axis=(1,3))       # (block row, block col, value)
+        blockUsed = np.repeat(np.repeat(blockUsed, 3, axis=0), 3, axis=1)
+        self.candidates = (self.suArray == 0)[:, :, None] & ~rowUsed[:, None, :] & ~colUsed[None, :, :] & ~blockUsed
+
+    @property
+    def allCandidateList(self):
+        """list of candidateList objects for all undefined cells (built from the candidate tensor)"""
+        return [candidateList(row, col, self.getCandidateList(row, col)) for row, col in np.argwhere(self.suArray == 0).tolist()]
+
+    def setCell(self, row, col, val, elemType):
+        """set value val at row, col and remove it from the candidates of the cell, row, col and block"""
+        self.suArray[row][col] = val
+        self.suArrayType[row][col] = elemType
+        self.candidates[row, col, :] = False
+        self.candidates[row, :, val-1] = False
+        self.candidates[:, col, val-1] = False
+        rOffset = 3 * (row // 3)
+        cOffset = 3 * (col // 3)
+        self.candidates[rOffset:rOffset+3, cOffset:cOffset+3, val-1] = False
+
+    def houseCounts(self, tensor, houseType):
+        """sum of a (row, col, value-1) tensor over the cells of each house, array (house number, value-1)"""
+        if houseType == self.HOUSE_T_ROW:
+            return tensor.sum(axis=1)
+        if houseType == self.HOUSE_T_COL:
+            return tensor.sum(axis=0)
+        return tensor.reshape(3,3,3,3,9).sum(axis=(1,3)).reshape(9,9)
+
+    def houseCandidateCounts(self, houseType):
+        """number of cells of each house that have a value as candidate, array (house number, value-1)"""
+        return self.houseCounts(self.candidates, houseType)
+
+    def checkNoPlaceLeft(self):
+        """check for an undefined cell without candidates or a value that is neither set nor a candidate
+        in a row, col or block (reductions of the candidate tensor only, solver1 runs it before every pass)"""
+        covered = (self.candidates | (self.suArray[:, :, None] == VALUES)).reshape(81,9)
+        return not (covered.any(axis=1).all() and (HOUSE_MATRIX @ covered.astype(np.float32)).all())
+
+    def checkContradiction(self):
+        """check if the actual SUDOKU can not be solved any more: a value that is set twice in a house,
+        an undefined cell without candidates or a value that is neither set nor a candidate in a house"""
+        return bool((countHouseValues(self.suArray)[0, :, 1:] > 1).any()) or self.checkNoPlaceLeft()
 
     def calcCandidateList(self,row,col):
         """calculate the candidate list for specific cell at row, col"""
@@ -105,10 +196,7 @@ class sudoku_np1:
     
     def getCandidateList(self,row,col):
         """get the candidates of specific row, col"""
-        for elem in self.allCandidateList:
-            if elem.row==row and elem.col==col:
-                return elem.list
-        return []
+        return (np.flatnonzero(self.candidates[row, col]) + 1).tolist()
     
     def getValListInRow(self,num):
         valList = []
@@ -209,13 +297,10 @@ class sudoku_np1:
     
     def solveSingles(self):
         numSolvedSinglesFound = 0
-        self.calcAllCandidateList()
-        for elem in self.allCandidateList:
-            row = elem.row
-            col = elem.col
-            if self.suArrayType[row][col] == suElemT.UNDEFINED and len(elem.list)==1:
-                self.suArrayType[row][col] = suElemT.SOLVED_SINGLE
-                self.suArray[row][col] = int(elem.list[0])
+        for row, col in np.argwhere(self.candidates.sum(axis=2) == 1).tolist():
+            # the candidate may have been removed by a single set before (only in an invalid SUDOKU)
+            if self.candidates[row, col].any():
+                self.setCell(row, col, int(np.argmax(self.candidates[row, col])) + 1, suElemT.SOLVED_SINGLE)
                 numSolvedSinglesFound+=1
         return numSolvedSinglesFound
 
@@ -260,49 +345,15 @@ class sudoku_np1:
     def solveHiddenSingles(self,debug=False):
         """solve hidden singles
         hidden singles are elements that appear just once in a row, col or block list"""
-        self.calcAllCandidateList()
         hiddenSinglesFound = 0
-        for row in range(0,9):
-            cc = []
-            # create list cc with all elements inside of row
-            for col in (range(0,9)):
-                for elem in  self.getCandidateList(row,col):
-                    cc.append(elem)
-            cc.sort()
-            count, hsList = self.findSingle(cc)
-            if count>0:
+        for houseType, houseName in ((self.HOUSE_T_ROW, "row"), (self.HOUSE_T_COL, "col"), (self.HOUSE_T_BLOCK, "block")):
+            # counts of the values in all houses of this type at once
+            counts = self.houseCandidateCounts(houseType)
+            for num in np.flatnonzero((counts == 1).any(axis=1)).tolist():
+                hsList = (np.flatnonzero(counts[num] == 1) + 1).tolist()
                 if (debug):
-                    print(f"Found hidden singles {hsList} in row {row}")
-                self.setHiddenSingles(0, row, hsList)
-                hiddenSinglesFound += len(hsList)
-        for col in range(0,9):
-            cc = []
-            # create list cc with all elements inside of col
-            for row in (range(0,9)):
-                for elem in  self.getCandidateList(row,col):
-                    cc.append(elem)
-            cc.sort()
-            count, hsList = self.findSingle(cc)
-            if count>0:
-                if (debug):
-                    print(f"Found hidden singles {hsList} in col {col}")
-                self.setHiddenSingles(1, col, hsList)
-                hiddenSinglesFound += len(hsList)
-        for block in range(0,9):
-            cc = []
-            # create list cc with all elements inside of block
-            for blockElem in self.blockIndexList(block):
-                row, col = blockElem
-                for elem in  self.getCandidateList(row,col):
-                    cc.append(elem)
-            cc.sort()
-            count, hsList = self.findSingle(cc)
-            if count>0:
-                if (debug):
-                    print(f"Found hidden singles {hsList} in block {block}")
-                self.setHiddenSingles(2, block, hsList)
-                hiddenSinglesFound += len(hsList)
-        
+                    print(f"Found hidden singles {hsList} in {houseName} {num}")
+                hiddenSinglesFound += self.setHiddenSingles(houseType, num, hsList)
         return hiddenSinglesFound
     
     def blockIndexList(self,block):
@@ -343,29 +394,22 @@ class sudoku_np1:
     def setHiddenSingles(self, type, num, singleList):
         """type: row=0, col=1, block=2
         num ... row/block/col number (0-8)
-        singleList ... list of hidden singles (found with findHiddenSingles)"""
+        singleList ... list of hidden singles (found with findHiddenSingles)
+        return value is the number of values set"""
         if type==0:
-            for elem in singleList:
-                row = num
-                for col in range(0,9):
-                    if self.suArray[row,col]==0 and elem in self.getCandidateList(row,col):
-                        self.suArray[row,col] = elem
-                        self.suArrayType[row,col] = suElemT.SOLVED_HIDDEN_SINGLE
+            indexList = self.rowIndexList(num)
         elif type==1:
-            for elem in singleList:
-                col = num
-                for row in range(0,9):
-                    if self.suArray[row,col]==0 and elem in self.getCandidateList(row,col):
-                        self.suArray[row,col] = elem
-                        self.suArrayType[row,col] = suElemT.SOLVED_HIDDEN_SINGLE
-        elif type==2:
-            for elem in singleList:
-                block = num
-                for blockElem in self.blockIndexList(block):
-                    row, col = blockElem
-                    if self.suArray[row,col]==0 and elem in self.getCandidateList(row,col):
-                        self.suArray[row,col] = elem
-                        self.suArrayType[row,col] = suElemT.SOLVED_HIDDEN_SINGLE
+            indexList = self.colIndexList(num)
+        else:
+            indexList = self.blockIndexList(num)
+        numSet = 0
+        for elem in singleList:
+            for row, col in indexList:
+                if self.candidates[row, col, elem-1]:
+                    self.setCell(row, col, elem, suElemT.SOLVED_HIDDEN_SINGLE)
+                    numSet += 1
+                    break
+        return numSet
 
     def checkDuplicates(self, ll):
         """check if there are duplicates in the list ll"""
@@ -379,12 +423,19 @@ class sudoku_np1:
    
     def solver1(self, debug=False):
         """solver algorithm to solve SUDOKU just with "paper & pencil" methods
+        the solver stops as soon as a contradiction is found (self.contradiction is True, see checkContradiction)
         return value is True if sudoku is solved"""
         i=m=0
         n=1
         while n>0 or m>0:
+            # the set values are checked once (the passes only set candidates), then every pass
+            # checks for an undefined cell without candidates or a value without place in a house
+            self.contradiction = self.checkContradiction() if i==0 else self.checkNoPlaceLeft()
+            if self.contradiction:
+                if debug:
+                    print(f"i={i}: contradiction found, SUDOKU can not be solved")
+                return False
             n = self.solveSingles()
-            self.calcAllCandidateList()
             m = self.solveHiddenSingles(debug)
             if debug and (n>0 or m>0):
                 print(f"i={i}: ",end="")
@@ -397,9 +448,13 @@ class sudoku_np1:
             i+=1
         return self.checkSolved()
     
-    def solver2(self, max_guess_num, debug=False):
+    def solver2(self, max_guess_num, debug=False, randomGuess=False):
         """ solver algorithm doing guesses and run solver 1 with that guess
+        randomGuess ... False: systematic guess tree (see solveGuessTree), True: up to max_guess_num
+                        independent random guesses on double candidates (see doAGuess)
         return value is True if sudoku is solved + number of guesses"""
+        if not randomGuess:
+            return self.solveGuessTree(max_guess_num, debug)
         self.store()
         solved = False
         i=0
@@ -417,25 +472,62 @@ class sudoku_np1:
                 print(f"...found solution with SOLVER2 after {i} guesses")
                 return True, i
             else:
+                # restores the candidates as well
                 self.recall()
-                # recalc the candidate list after restored
-                self.calcAllCandidateList()       
         return False, i
 
+    def solveGuessTree(self, max_guess_num, debug=False):
+        """ systematic guess tree: branch on the undefined cell with the fewest candidates (a double candidate
+        if there is one), propagate with solver1 and go back through the snapshot stack as soon as a
+        contradiction is found, so no guess is repeated and the result does not depend on random numbers
+        max_guess_num ... maximum number of guesses (bounds the run time)
+        return value is True if sudoku is solved + number of guesses"""
+        baseDepth = self.stackDepth
+        self.push()
+        branches = []   # per tree level: row, col and the candidates not tried yet (snapshot on the stack)
+        guesses = 0
+        solved = self.solver1()
+        dead = self.contradiction
+        while not solved:
+            if not dead:
+                # branch on the next cell
+                counts = np.where(self.suArray == 0, self.candidates.sum(axis=2), 10)
+                row, col = divmod(int(np.argmin(counts)), 9)
+                self.push()
+                branches.append([row, col, self.getCandidateList(row, col)])
+            # next untried candidate, levels without candidates left are removed
+            while len(branches) > 0 and len(branches[-1][2]) == 0:
+                branches.pop()
+                self.pop()
+            if len(branches) == 0 or guesses >= max_guess_num:
+                break
+            row, col, untried = branches[-1]
+            val = untried.pop(0)
+            self.restoreTop()
+            self.setCell(row, col, val, suElemT.GUESS)
+            guesses += 1
+            if debug:
+                print(f"... guess number {guesses}: value at row={row} col={col} set to {val} (level {len(branches)})")
+            solved = self.solver1()
+            dead = self.contradiction
+        if solved:
+            print(f"...found solution with SOLVER2 after {guesses} guesses")
+            self.stackDepth = baseDepth
+            return True, guesses
+        # no solution (or too many guesses): back to the SUDOKU before the first guess
+        self.stackDepth = baseDepth + 1
+        self.pop()
+        return False, guesses
+
     def numDoubleCandidates(self):
-        self.calcAllCandidateList()
-        n = 0
-        for elem in self.allCandidateList:
-            if len(elem.list)==2:
-                n+=1
-        return n
+        return int(np.count_nonzero(self.candidates.sum(axis=2) == 2))
 
     def doAGuess(self, debug=False):
         """doAGuess: first trial implementation, works not bad, but can be improved a lot (TBD)
         return value: True if guess is done, false means no guess was found"""
         # and do a new guess out of the candidate list
-        self.calcAllCandidateList()
-        numDoubleCandidates=self.numDoubleCandidates()
+        doubleCandidates = np.argwhere(self.candidates.sum(axis=2) == 2).tolist()
+        numDoubleCandidates=len(doubleCandidates)
         if numDoubleCandidates>0:
             randDoubleCandNum=random.randrange(0,numDoubleCandidates)
         else:
@@ -443,74 +535,30 @@ class sudoku_np1:
         if debug:
             print(f"Number of double candidates: {numDoubleCandidates}")
             print(f"Randomized double candidate num: {randDoubleCandNum}")
-        randDoubleCandAct=0
-        for elem in self.allCandidateList:
-            row = elem.row
-            col = elem.col
-            # guess is done on elements with 2 entries in list
-            if len(elem.list)==2 and randDoubleCandAct==randDoubleCandNum:
-                # select one of the two elements in candidateList
-                index = random.randrange(0,2)
-                val = elem.list[index]
-                self.suArray[row][col] = val
-                self.suArrayType [row][col] = suElemT.GUESS
-                if debug:
-                    print(f"doAGuess: value at row={elem.row} col={elem.col} set to {val} (index={index})")
-                return True
-            elif len(elem.list)==2:
-                randDoubleCandAct+=1
-        return False
+        # guess is done on elements with 2 entries in list, select one of the two candidates
+        row, col = doubleCandidates[randDoubleCandNum]
+        index = random.randrange(0,2)
+        val = self.getCandidateList(row,col)[index]
+        self.setCell(row, col, val, suElemT.GUESS)
+        if debug:
+            print(f"doAGuess: value at row={row} col={col} set to {val} (index={index})")
+        return True
             
 
-    def checkValidHouse(self, houseList):
-        """check if the house list is valid (each value from 1 to 9 shall be exactly one time within the list)"""
-        validList=[1,2,3,4,5,6,7,8,9]
-        if len(houseList)!=9:
-            return False
-        for i in range(0,9):
-            if houseList[i]<1 or  houseList[i]>9:
-                return False
-            if houseList[i] in validList:
-                validList.remove(houseList[i])
-        if len(validList)==0:
-            return True
-        return False       
-
     def checkSudokuIsValid(self,printFlag=False):
         """check if the actual sudoku is valid by checking all rows, columns and blocks of SUDOKU
-        for values 1 to 9 (each one shall exist exactly one time)"""
-        retVal = True
-        for i in range(0,9):
-            actList=self.getValListInRow(i)
-            checkResult=self.checkValidHouse(actList)
-            if (checkResult==False) and printFlag:
-                print(f"Check result for row  {i} failed: {checkResult}")
-                return False
-        for i in range(0,9):
-            actList=self.getValListInCol(i)
-            checkResult=self.checkValidHouse(actList)
-            if (checkResult==False) and printFlag:
-                print(f"Check result for col  {i} failed: {checkResult}")
-                return False
-        for i in range(0,9):
-            actkList=self.getValListInBlock(i)
-            checkResult=self.checkValidHouse(actList)
-            if (checkResult==False) and printFlag:
-                print(f"Check result for block {i} failed: {checkResult}")
-                return False
-        # if no error was found up to this point, the SUDOKU is valid
-        return True
+        for values 1 to 9 (each one shall exist exactly one time)
+        printFlag ... if true, print the houses that fail the check"""
+        houseValid = np.all(countHouseValues(self.suArray)[0, :, 1:] == 1, axis=1)
+        if printFlag:
+            for house in np.flatnonzero(~houseValid).tolist():
+                houseName = ("row  ", "col  ", "block")[house // 9]
+                print(f"Check result for {houseName} {house % 9} failed: False")
+        return bool(houseValid.all())
     
     def checkSudokuIsSolved(self):
         """check that SUDOKU is valid and no element is 0 (unsolved)"""
-        if not self.checkSudokuIsValid():
-            return False
-        for row in range(0,9):
-            for col in range(0,9):
-                if self.suArray[row][col]==0:
-                    return False
-        # if no error was found up to this point, the SUDOKU is solved
-        return True
+        return bool((self.suArray != 0).all()) and self.checkSudokuIsValid()
 
 
     def print(self, printType=0):
@@ -1,34 +1,48 @@
 # sudoku_io sudoku class
 # SUDOKU IO class for input/output functions in sudoku
-# Version 0.00, WSC, 7-Nov-2024
+# Version 0.01, WSC, 27-Nov-2025
+# iterFile reads the file lazily (one line at a time), suText/suComment are instance lists
 
 import re
 
 class sudoku_io:
-    suText=[]
-    suComment=[]
+
+    def __init__(self):
+        # lists filled by readFile (per instance, a new readFile replaces the content)
+        self.suText=[]
+        self.suComment=[]
+
+    def iterFile(self, fileName):
+        """iterFile(filename) generator that reads SUDOKU strings from file line by line
+        yields (index, suText, suComment) for each SUDOKU, index is counted from 0
+        nothing is stored, so the memory use does not depend on the file size"""
+        i=0
+        with open(fileName,"r") as fp:
+            for elem in fp:
+                elem = re.sub(r" *\/\/ *","//",elem)
+                elem = elem.replace("\n","")
+                if elem=="STOP":
+                    print(f"sudoku_io: found STOP on line {i}, stopping file read there (skipping lines after STOP)")
+                    break
+                lineTokens = elem.split("//")
+                suStr=lineTokens[0]
+                if len(lineTokens)>1:
+                    comStr=lineTokens[1]
+                else:
+                    comStr=""
+                if len(suStr)==81:
+                    yield i, suStr, comStr
+                    i+=1
 
     def readFile(self, fileName):
-        """readFile(filename) read SUDOKU strings from file line by line
+        """readFile(filename) read SUDOKU strings from file line by line into the lists suText, suComment
         return value: of lines that were read from the file"""
-        i=0
-        fp = open(fileName,"r")
-        for elem in fp:
-            elem = re.sub(r" *\/\/ *","//",elem)
-            elem = elem.replace("\n","")
-            if elem=="STOP":
-                print(f"sudoku_io: found STOP on line {i}, stopping file read there (skipping lines after STOP)")
-                break
-            lineTokens = elem.split("//")
-            suStr=lineTokens[0]
-            if len(lineTokens)>1:
-                comStr=lineTokens[1]
-            else:
-                comStr=""
-            if len(suStr)==81:
-                self.suText.append(suStr)
-                self.suComment.append(comStr)
-                i+=1
+        self.suText=[]
+        self.suComment=[]
+        for i, suStr, comStr in self.iterFile(fileName):
+            self.suText.append(suStr)
+            self.suComment.append(comStr)
+        i=len(self.suText)
         print(f"sudoku_io: Total of {i} lines read from file {fileName}")
         return i
  
@@ -38,6 +38,8 @@ class sudoku():
         self.loopCount = 0
         self.numUniqueCandidatesFound = 0
         self.numHiddenSinglesFound = 0
+        # description of the contradiction that stopped the last solve() (None: no contradiction)
+        self.contradiction = None
 
     def __str__(self):
         """return the SUDOKU in a string format"""
@@ -203,6 +205,25 @@ class sudoku():
                         pairList.append(elem)
         return pairList
 
+    def findContradiction(self, houseName, houseElements, aCandidateList):
+        """return a description of a contradiction in a house (None if there is none):
+        a value used twice, an empty cell without candidates or a value that has no place left
+        houseElements ... all elements of the house, aCandidateList ... candidate list of the house (or None)"""
+        values = [elem for elem in houseElements if elem != 0]
+        if len(values) != len(set(values)):
+            return f"{houseName}: value used twice"
+        placeValues = set(values)
+        if aCandidateList != None:
+            for cc in aCandidateList.candidateList:
+                if cc == None:
+                    continue
+                if len(cc) == 0:
+                    return f"{houseName}: no candidate left for cell [{cc.row}, {cc.col}]"
+                placeValues.update(cc.possibleValueList)
+        if len(placeValues) < 9:
+            return f"{houseName}: no place left for value {min(set(range(1,10)) - placeValues)}"
+        return None
+
     def isSolved(self):
         """check if the SUDOKU is solved"""
         for i in range(0,9):    # check that there are no empty cells in the board
@@ -242,6 +263,7 @@ class sudoku():
     def solve(self):
         """solve SUDOKU """
         foundNewCandidate = True
+        self.contradiction = None
         i = 0
         while foundNewCandidate:
             foundNewCandidate = False
@@ -252,27 +274,48 @@ class sudoku():
             for type in range(0,3):   # loop to run algo on row, col and box candidate lists
                 self.solvePrintHeader(type)
                 for n in range(0,9):
-                    if   type==0:   aCandidateList = self.getAllRowCandidates(n)
-                    elif type==1:   aCandidateList = self.getAllColCandidates(n)
-                    elif type==2:   aCandidateList = self.getAllBoxCandidates(n)
+                    if   type==0:   aCandidateList, houseName, houseElements = self.getAllRowCandidates(n), f"row[{n}]", self.getRow(n)
+                    elif type==1:   aCandidateList, houseName, houseElements = self.getAllColCandidates(n), f"col[{n}]", self.getCol(n)
+                    elif type==2:   aCandidateList, houseName, houseElements = self.getAllBoxCandidates(n), f"box[{n}]", self.getBox((n // 3) * 3, (n % 3) * 3)
+                    # stop as soon as a house can not be solved any more (e.g. after a wrong guess)
+                    self.contradiction = self.findContradiction(houseName, houseElements, aCandidateList)
+                    if self.contradiction != None:
+                        self.myPrint(f"... contradiction found: {self.contradiction}")
+                        return False
                     if aCandidateList != None:
                         self.myPrint(aCandidateList)
                         numSingles, aSinges = aCandidateList.getSingles()
                         if numSingles>0:
                             for single in aSinges:
                                 self.myPrint(f"... found single: {single}")
-                                self.setElem(single.row,single.col,single.possibleValueList[0])
+                                if not self.setSingle(houseName, single):
+                                    return False
                                 self.numUniqueCandidatesFound += 1
                                 foundNewCandidate = True                        
                         numHiddenSingles, aHiddenSingles = aCandidateList.getHiddenSingles()
                         if numHiddenSingles>0:
                             for hiddenSingle in aHiddenSingles:
                                 self.myPrint(f"... found hidden single: {hiddenSingle}")
-                                self.setElem(hiddenSingle.row,hiddenSingle.col,hiddenSingle.possibleValueList[0])
+                                if not self.setSingle(houseName, hiddenSingle):
+                                    return False
                                 self.numHiddenSinglesFound += 1
                                 foundNewCandidate = True
             i += 1
         return False
+
+    def setSingle(self, houseName, single):
+        """set a (hidden) single found in the candidate list of a house, the singles of a list are set one after
+        the other, so an earlier single of the same list may have taken the cell or the value (contradiction)
+        return value is False in case of a contradiction (stored in self.contradiction)"""
+        row, col, value = single.row, single.col, single.possibleValueList[0]
+        if self.board[row][col] == value:
+            return True
+        if self.board[row][col] != 0 or value not in self.getCandidate(row, col).possibleValueList:
+            self.contradiction = f"{houseName}: no place left for value {value} at [{row}, {col}]"
+            self.myPrint(f"... contradiction found: {self.contradiction}")
+            return False
+        self.setElem(row, col, value)
+        return True
     
     def storeBoard(self):
         """STORE the actual board in stoBoard"""
@@ -288,6 +331,9 @@ class sudoku():
         """solve SUDOKU, in case that no analytic solution is found start randomized trials"""
         if self.solve():
             return True
+        elif self.contradiction != None:
+            print(f"... SUDOKU has no solution: {self.contradiction}")
+            return False
         else:
             print("... no analytic solution found, randomized trials will start here")
             self.storeBoard()
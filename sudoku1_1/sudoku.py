@@ -84,32 +84,30 @@ def getBoard(sudokuText):
 # ------------------------------------------------------------------------------------------------
 if __name__ == "__main__":
     suSolvedInfo = {}
-    # read the input file into arrays suText, suComment
+    # the input file is read lazily, one SUDOKU at a time (constant memory also for very large files)
     myIo = sudoku_io()
-   
-    numRead = myIo.readFile(SU_FILE_NAME)
-    print(f"... total of {numRead} lines read from file name {SU_FILE_NAME}")
- 
-    # correct numbers above the number of sudokus defined in file
-    for i, elem in enumerate(SU_NUM_LIST):
-        if SU_NUM_LIST[i]>numRead:
-            SU_NUM_LIST[i]=numRead
 
-    suTextList, suCommentList = myIo.getSudokuList()
-    # number of the SUDOKU that should be solved
-    suNumber = 1
+    if not SOLVE_ALL:
+        # correct numbers above the number of sudokus defined in file (needs one counting pass over the file)
+        numRead = sum(1 for _ in myIo.iterFile(SU_FILE_NAME))
+        print(f"... total of {numRead} lines read from file name {SU_FILE_NAME}")
+        for i, elem in enumerate(SU_NUM_LIST):
+            if SU_NUM_LIST[i]>numRead:
+                SU_NUM_LIST[i]=numRead
+
     # loop over all SUDOKUs
-    for index, su in enumerate(suTextList):
-        comment = suCommentList[suNumber-1]
+    for index, su, comment in myIo.iterFile(SU_FILE_NAME):
+        # number of the SUDOKU that should be solved
+        suNumber = index + 1
         # if not all sudokus should be solved, execute only number defined in SU_NUM_LIST
         if not SOLVE_ALL and not (suNumber in SU_NUM_LIST):
-            suNumber += 1
+            if suNumber > max(SU_NUM_LIST):
+                break
             continue
         board =  getBoard(su)
         # create a sudoku object
         if board is None:
             print(f"Error: SUDOKU {suNumber} is not valid")
-            suNumber += 1
             continue
         print("\n")
         print(f"===== SUDOKU: {suNumber} ({comment}) =====")
@@ -131,7 +129,6 @@ if __name__ == "__main__":
             # for each sudoku some info is stored for summary later on
         suSolvedInfo[suNumber] = {"solved":s.isSolved(), "unique":s.numUniqueCandidatesFound, "hidden": s.numHiddenSinglesFound, \
                                 "loops":s.loopCount, "elapsedTime_ms":elapsedTime_ms, "comment":s.comment, "randCount":s.randCount}
-        suNumber += 1
 
     solvedCount = 0
     notSolvedCount = 0
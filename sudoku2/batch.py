@@ -0,0 +1,153 @@
+# batch.py
+
+# batch solver for many Sudokus at once
+# all puzzles are kept in one (N,9,9) grid array and one (N,9,9,9) boolean candidate tensor
+# (last axis: value-1), naked and hidden singles are found with vectorized reductions over
+# all puzzles at once, only the puzzles that are not solved by singles are handed to
+# the per-puzzle search of the Sudoku class
+# blocks are taken from a compiled block layout (see block.py), so jiggsaw puzzles
+# use exactly the same code path as standard ones
+
+# Werner Schoegler, 21-Nov-2025
+
+# pylint: disable=invalid-name
+
+import numpy as np
+from sudoku2 import Sudoku
+from block import get_block_layout, BlockLayout
+from solution_cache import SolutionCache
+
+VALUES = np.arange(1, 10, dtype=np.int8)
+
+
+def _get_layout(layout: str | BlockLayout | None) -> BlockLayout:
+    """Get the compiled block layout (default: standard 3x3 blocks)."""
+    if layout is None:
+        return get_block_layout()
+    return get_block_layout(layout) if isinstance(layout, str) else layout
+
+
+def _block_sum(values: np.ndarray, layout: BlockLayout) -> np.ndarray:
+    """Sum a (N,9,9,9) tensor over the cells of each block, result (N,block,value)."""
+    n = values.shape[0]
+    return values.reshape(n, 81, 9)[:, layout.blockCells].sum(axis=2, dtype=np.int8)
+
+
+def _per_cell(blockValues: np.ndarray, layout: BlockLayout) -> np.ndarray:
+    """Expand a (N,block,value) array to (N,row,col,value), each cell gets the entry of its block."""
+    return blockValues[:, layout.cellBlock]
+
+
+def candidates_batch(grids: np.ndarray, layout: str | BlockLayout | None = None) -> np.ndarray:
+    """Get the (N,9,9,9) candidate tensor of a (N,9,9) grid array, True if value-1 is a candidate."""
+    layout = _get_layout(layout)
+    placed = grids[..., None] == VALUES  # (N,row,col,value)
+    rowUsed = placed.any(axis=2)  # (N,row,value)
+    colUsed = placed.any(axis=1)  # (N,col,value)
+    blockUsed = _block_sum(placed, layout) > 0  # (N,block,value)
+    used = rowUsed[:, :, None, :] | colUsed[:, None, :, :]
+    used |= _per_cell(blockUsed, layout)
+    return ~used & (grids == 0)[..., None]
+
+
+def _house_candidate_counts(candidates: np.ndarray, layout: BlockLayout) -> np.ndarray:
+    """Number of cells of each house that have a value as candidate, (N,house,value) in the
+    house order of the layout (rows, columns, blocks)."""
+    return np.concatenate([candidates.sum(axis=2, dtype=np.int8), candidates.sum(axis=1, dtype=np.int8),
+                           _block_sum(candidates, layout)], axis=1)
+
+
+def _hidden_singles(candidates: np.ndarray, houseCounts: np.ndarray, layout: BlockLayout) -> np.ndarray:
+    """Get a (N,9,9) array with the values of all hidden singles in rows, columns and blocks (0: none),
+    houseCounts: candidate counts per house, see _house_candidate_counts()."""
+    hidden = np.zeros(candidates.shape[:3], dtype=np.int8)
+    once = houseCounts == 1  # a value that is candidate in exactly one cell of a house
+    # rows, columns, blocks
+    single = candidates & once[:, :9, None, :]
+    single |= candidates & once[:, None, 9:18, :]
+    single |= candidates & _per_cell(once[:, 18:], layout)
+    found = single.any(axis=3)
+    hidden[found] = single[found].argmax(axis=1) + 1
+    return hidden
+
+
+def propagate_batch(grids: np.ndarray, enableHiddenSingles: bool = True,
+                    layout: str | BlockLayout | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Apply naked (and hidden) singles to all puzzles until no more progress is made.
+    Returns the filled grids and a boolean array that marks puzzles with a contradiction
+    (an empty cell without any candidate, a value that is neither placed nor a candidate in a house,
+    or singles of one pass that place a value twice in a house; the singles of that pass are not placed)."""
+    layout = _get_layout(layout)
+    grids = np.array(grids, dtype=np.int8)  # small dtype keeps the tensors compact
+    dead = np.zeros(grids.shape[0], dtype=bool)
+    active = np.arange(grids.shape[0])
+    while len(active) > 0:
+        work = grids[active]
+        candidates = candidates_batch(work, layout)
+        counts = candidates.sum(axis=3, dtype=np.int8)
+        empty = work == 0
+        deadNow = ((counts == 0) & empty).any(axis=(1, 2))
+        # a value without place in a house: neither placed nor a candidate
+        houseCounts = _house_candidate_counts(candidates, layout)
+        deadNow |= np.any(houseCounts + layout.houseCounts(work)[:, :, 1:] == 0, axis=(1, 2))
+        # naked singles
+        naked = (counts == 1) & empty
+        new = np.where(naked, candidates.argmax(axis=3) + 1, 0).astype(np.int8)
+        if enableHiddenSingles:
+            new = np.where(new == 0, _hidden_singles(candidates, houseCounts, layout), new)
+        new[deadNow] = 0
+        progress = (new != 0).any(axis=(1, 2))
+        work += new
+        # singles of one pass that place a value twice in a house: the puzzle has no solution
+        conflict = np.any(layout.houseCounts(work)[:, :, 1:] > 1, axis=(1, 2))
+        work[conflict] -= new[conflict]
+        deadNow |= conflict
+        progress &= ~conflict
+        grids[active] = work
+        dead[active[deadNow]] = True
+        active = active[progress]
+    return grids.astype(int), dead
+
+
+def valid_batch(grids: np.ndarray, layout: str | BlockLayout | None = None) -> np.ndarray:
+    """Check for each grid of a (N,9,9) array that no row, column or block contains a value twice (zeros ignored)."""
+    return np.all(_get_layout(layout).houseCounts(grids)[:, :, 1:] <= 1, axis=(1, 2))
+
+
+def solved_batch(grids: np.ndarray, layout: str | BlockLayout | None = None) -> np.ndarray:
+    """Check for each grid of a (N,9,9) array that every row, column and block contains the values 1-9."""
+    return np.all(_get_layout(layout).houseCounts(grids)[:, :, 1:] == 1, axis=(1, 2))
+
+
+def solve_batch(grids: np.ndarray, enableSearch: bool = True,
+                layout: str | BlockLayout | None = None,
+                cache: SolutionCache | None = None) -> tuple[np.ndarray, np.ndarray]:
+    """Solve a (N,9,9) array of Sudokus: singles for all puzzles at once, then a per-puzzle
+    search (exact cover) for the residual unsolved ones (only if enableSearch is True).
+    With a solution cache the cached puzzles are taken from the cache and the new solutions are stored.
+    Returns the (N,9,9) result grids and a boolean array that marks the solved puzzles."""
+    layout = _get_layout(layout)
+    if cache is not None:
+        puzzles = np.array(grids, dtype=int).reshape(-1, 9, 9)
+        results = puzzles.copy()
+        cached = np.zeros(len(puzzles), dtype=bool)
+        for i, puzzle in enumerate(puzzles):
+            solution = cache.get(puzzle, layout.key)
+            if solution is not None:
+                results[i] = solution
+                cached[i] = True
+        solved = cached.copy()
+        if not np.all(cached):
+            results[~cached], solved[~cached] = solve_batch(puzzles[~cached], enableSearch, layout)
+            for i in np.flatnonzero(solved & ~cached):
+                cache.put(puzzles[i], results[i], layout.key)
+        return results, solved
+    grids, dead = propagate_batch(grids, layout=layout)
+    solved = solved_batch(grids, layout)
+    if enableSearch:
+        for i in np.flatnonzero(~solved & ~dead):
+            sudoku = Sudoku(grids[i].copy(), layout)
+            if sudoku.solveExactCover():
+                grids[i] = sudoku.grid
+                solved[i] = True
+    return grids, solved
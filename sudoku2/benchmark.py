@@ -0,0 +1,254 @@
+# benchmark.py
+
+# benchmark of all solver generations over the bundled datasets
+# - generations: sudoku1/sudoku_np1, sudoku1_1/sudoku_p.sudoku and sudoku2.Sudoku,
+#   each is solved with the cascade of its own command line script
+# - datasets: the puzzle files in sudoku1/ (the same files are used for all generations)
+# - every puzzle is solved repeats times (after warmup puzzles), the time of a puzzle is the
+#   median of its runs; per dataset the median, p95, p99 and max over the puzzles are reported
+# - the results are written as JSON and can be compared against a stored baseline
+# command line (same style as sudoku1/sudoku.py):
+#   python benchmark.py -o=benchmark.json -baseline=baseline.json -tolerance=0.2
+#   python benchmark.py -generations=sudoku2 -datasets=top95,hardest -repeats=5 -max=20
+
+# Werner Schoegler, 26-Nov-2025
+
+# pylint: disable=invalid-name
+
+import contextlib
+import importlib
+import json
+import os
+import platform
+import random
+import re
+import sys
+import time
+
+import numpy as np
+
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+DATA_DIR = os.path.join(REPO_DIR, "sudoku1")
+DATASETS = ["easy_50", "sudoku_1", "sudoku_2", "top95", "hardest", "su25_short", "su30_short"]
+GENERATIONS = ["sudoku_np1", "sudoku_p", "sudoku2"]
+METRICS = ["median_ms", "p95_ms", "p99_ms", "max_ms"]
+# module names used by more than one generation, removed from sys.modules before loading a generation
+SHARED_MODULE_NAMES = ["sudoku_p", "sudoku_io", "candidate_p"]
+# number of guesses of sudoku_np1.solver2 (as in sudoku1/sudoku.py)
+MAX_GUESS_NUM = 500
+
+
+def load_dataset(name: str, dataDir: str = DATA_DIR) -> list[str]:
+    """Read the puzzles of a dataset file (comments start with //, reading stops at a STOP line)."""
+    puzzles = []
+    with open(os.path.join(dataDir, name + ".txt"), "r") as fp:
+        for line in fp:
+            if line.strip() == "STOP":
+                break
+            puzzle = re.split(r"//|#", line, maxsplit=1)[0].strip()
+            if len(puzzle) == 81:
+                puzzles.append(puzzle)
+    return puzzles
+
+
+def _load_module(directory: str, moduleName: str):
+    """Import a module of a generation directory, the shared module names are loaded fresh."""
+    for name in SHARED_MODULE_NAMES:
+        sys.modules.pop(name, None)
+    sys.path.insert(0, directory)
+    try:
+        return importlib.import_module(moduleName)
+    finally:
+        sys.path.remove(directory)
+        for name in SHARED_MODULE_NAMES:
+            sys.modules.pop(name, None)
+
+
+def _solver_sudoku_np1():
+    module = _load_module(os.path.join(REPO_DIR, "sudoku1"), "sudoku_np1")
+    sudoku = module.sudoku_np1()
+
+    def solve(puzzle: str) -> bool:
+        sudoku.setSuArray(puzzle)
+        if not sudoku.solver1():
+            sudoku.solver2(MAX_GUESS_NUM)
+        return bool(sudoku.checkSudokuIsSolved() and sudoku.checkSudokuIsValid())
+    return solve
+
+
+def _solver_sudoku_p():
+    module = _load_module(os.path.join(REPO_DIR, "sudoku1_1"), "sudoku_p")
+
+    def solve(puzzle: str) -> bool:
+        board = [[int(ch) if ch.isdigit() else 0 for ch in puzzle[row * 9:row * 9 + 9]] for row in range(9)]
+        sudoku = module.sudoku(board)
+        sudoku.solveRand()
+        return bool(sudoku.isSolved())
+    return solve
+
+
+def _solver_sudoku2():
+    from runner import solve_puzzle
+
+    def solve(puzzle: str) -> bool:
+        return solve_puzzle("benchmark", puzzle)["solved"]
+    return solve
+
+
+SOLVER_FACTORIES = {
+    "sudoku_np1": _solver_sudoku_np1,
+    "sudoku_p": _solver_sudoku_p,
+    "sudoku2": _solver_sudoku2,
+}
+
+
+def time_stats(times_ms: list[float]) -> dict:
+    """Median, p95, p99, max and mean of per puzzle times in milliseconds."""
+    times = np.asarray(times_ms, dtype=float)
+    if len(times) == 0:
+        return {metric: 0.0 for metric in ["mean_ms"] + METRICS}
+    return {
+        "mean_ms": float(times.mean()),
+        "median_ms": float(np.percentile(times, 50)),
+        "p95_ms": float(np.percentile(times, 95)),
+        "p99_ms": float(np.percentile(times, 99)),
+        "max_ms": float(times.max()),
+    }
+
+
+def benchmark_dataset(solve, puzzles: list[str], repeats: int = 3, warmup: int = 3) -> dict:
+    """Time a solver over the puzzles of a dataset, the output of the solver is discarded.
+    The random generator is reseeded for every run, so guessing solvers are reproducible."""
+    times_ms = []
+    solved = 0
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        for puzzle in puzzles[:warmup]:
+            random.seed(0)
+            solve(puzzle)
+        for puzzle in puzzles:
+            runs = []
+            for _ in range(max(1, repeats)):
+                random.seed(0)
+                start_time = time.perf_counter()
+                ok = solve(puzzle)
+                runs.append((time.perf_counter() - start_time) * 1000.0)
+            times_ms.append(float(np.median(runs)))
+            solved += int(ok)
+    result = {"count": len(puzzles), "solved": solved}
+    result.update(time_stats(times_ms))
+    return result
+
+
+def run_benchmark(generations: list[str] | None = None, datasets: list[str] | None = None,
+                  repeats: int = 3, warmup: int = 3, maxPuzzles: int | None = None, verbose: bool = True) -> dict:
+    """Run the benchmark for all generations and datasets and return the JSON result dict."""
+    generations = GENERATIONS if generations is None else generations
+    datasets = DATASETS if datasets is None else datasets
+    report = {
+        "meta": {
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "repeats": repeats,
+            "warmup": warmup,
+            "maxPuzzles": maxPuzzles,
+        },
+        "results": {},
+    }
+    for generation in generations:
+        solve = SOLVER_FACTORIES[generation]()
+        report["results"][generation] = {}
+        for dataset in datasets:
+            puzzles = load_dataset(dataset)[:maxPuzzles]
+            result = benchmark_dataset(solve, puzzles, repeats, warmup)
+            report["results"][generation][dataset] = result
+            if verbose:
+                print(f"{generation:12} | {dataset:12} | {result['solved']:4}/{result['count']:<4} | "
+                      + " | ".join(f"{metric[:-3]} {result[metric]:9.3f}" for metric in METRICS))
+    return report
+
+
+def compare_reports(report: dict, baseline: dict, tolerance: float = 0.2) -> list[str]:
+    """Compare a report against a baseline report, returns the list of regressions:
+    a time metric that is more than tolerance (relative) above the baseline, or fewer solved puzzles."""
+    regressions = []
+    for generation, datasets in report["results"].items():
+        for dataset, result in datasets.items():
+            base = baseline.get("results", {}).get(generation, {}).get(dataset)
+            if base is None:
+                continue
+            if result["solved"] < base["solved"]:
+                regressions.append(f"{generation}/{dataset}: solved {result['solved']} < baseline {base['solved']}")
+            for metric in METRICS:
+                if result[metric] > base[metric] * (1.0 + tolerance):
+                    regressions.append(f"{generation}/{dataset}: {metric} {result[metric]:.3f} > "
+                                       f"baseline {base[metric]:.3f} (+{tolerance * 100:.0f}%)")
+    return regressions
+
+
+def print_comparison(report: dict, baseline: dict) -> None:
+    """Print the ratio current/baseline of all time metrics."""
+    print(f"{'Generation':12} | {'Dataset':12} | " + " | ".join(f"{metric[:-3]:>8}" for metric in METRICS))
+    print("-"*80)
+    for generation, datasets in report["results"].items():
+        for dataset, result in datasets.items():
+            base = baseline.get("results", {}).get(generation, {}).get(dataset)
+            if base is None:
+                continue
+            ratios = [result[metric] / base[metric] if base[metric] > 0 else float("inf") for metric in METRICS]
+            print(f"{generation:12} | {dataset:12} | " + " | ".join(f"{ratio:7.2f}x" for ratio in ratios))
+
+
+if __name__ == '__main__':
+    # default settings, overwritten by the command line arguments
+    generations = GENERATIONS
+    datasets = DATASETS
+    repeats = 3
+    warmup = 3
+    maxPuzzles = None
+    outputFile = "benchmark.json"
+    baselineFile = None
+    tolerance = 0.2
+
+    for actArg in sys.argv[1:]:
+        if actArg.startswith("-generations="):
+            generations = actArg.replace("-generations=", "").split(",")
+        elif actArg.startswith("-datasets="):
+            datasets = actArg.replace("-datasets=", "").split(",")
+        elif actArg.startswith("-repeats="):
+            repeats = int(actArg.replace("-repeats=", ""))
+        elif actArg.startswith("-warmup="):
+            warmup = int(actArg.replace("-warmup=", ""))
+        elif actArg.startswith("-max="):
+            maxPuzzles = int(actArg.replace("-max=", ""))
+        elif actArg.startswith("-o="):
+            outputFile = actArg.replace("-o=", "")
+        elif actArg.startswith("-baseline="):
+            baselineFile = actArg.replace("-baseline=", "")
+        elif actArg.startswith("-tolerance="):
+            tolerance = float(actArg.replace("-tolerance=", ""))
+        else:
+            print("Optional arguments for benchmark:")
+            print(f"    -generations=sudoku2,sudoku_np1 ... solver generations (default: {','.join(GENERATIONS)})")
+            print(f"    -datasets=top95,hardest         ... datasets in sudoku1/ (default: all)")
+            print("    -repeats=3 -warmup=3            ... runs per puzzle, warmup puzzles per dataset")
+            print("    -max=20                         ... use only the first 20 puzzles of each dataset")
+            print("    -o=benchmark.json               ... output JSON file")
+            print("    -baseline=baseline.json         ... compare against a baseline JSON file")
+            print("    -tolerance=0.2                  ... allowed relative slowdown against the baseline")
+            sys.exit()
+
+    report = run_benchmark(generations, datasets, repeats, warmup, maxPuzzles)
+    with open(outputFile, "w") as fp:
+        json.dump(report, fp, indent=2)
+    print(f"Results written to {outputFile}")
+    if baselineFile is not None:
+        with open(baselineFile, "r") as fp:
+            baseline = json.load(fp)
+        print_comparison(report, baseline)
+        regressions = compare_reports(report, baseline, tolerance)
+        for regression in regressions:
+            print(f"REGRESSION: {regression}")
+        if len(regressions) > 0:
+            sys.exit(1)
+        print(f"No regressions against {baselineFile} (tolerance {tolerance * 100:.0f}%)")
@@ -110,10 +110,85 @@ block_alt1_index_8: List[Tuple[int, int]] = [
     (8, 6), (8, 7), (8, 8)      
 ]
 
+# all known block layouts, selected by the name prefix of the block lists above
+BLOCK_LAYOUTS: dict[str, List[List[Tuple[int, int]]]] = {
+    "block_norm_index_": [block_norm_index_0, block_norm_index_1, block_norm_index_2,
+                          block_norm_index_3, block_norm_index_4, block_norm_index_5,
+                          block_norm_index_6, block_norm_index_7, block_norm_index_8],
+    "block_alt1_index_": [block_alt1_index_0, block_alt1_index_1, block_alt1_index_2,
+                          block_alt1_index_3, block_alt1_index_4, block_alt1_index_5,
+                          block_alt1_index_6, block_alt1_index_7, block_alt1_index_8],
+}
+
 def get_block_indices(block_number, block_index_selection: str) -> List[Tuple[int, int]]:   
     '''Returns the list of (row, column) indices for the specified block number and block index selection.'''
-    blocks = eval(f"{block_index_selection}{block_number}")
-    return blocks
+    return BLOCK_LAYOUTS[block_index_selection][block_number]
+
+
+class BlockLayout:
+    '''Lookup tables of a block layout, compiled once so that all block lookups are array indexing.
+    Cells are numbered row*9 + col (flat index), houses 0-8 are rows, 9-17 columns and 18-26 blocks.'''
+
+    def __init__(self, blocks: List[List[Tuple[int, int]]], name: str = ""):
+        self.name = name
+        if len(blocks) != 9 or any(len(block) != 9 for block in blocks):
+            raise ValueError(f"Block layout {name} must have 9 blocks with 9 cells each.")
+        # cell -> block number
+        self.cellBlock = np.full((9, 9), -1, dtype=int)
+        for block_number, block in enumerate(blocks):
+            for row, col in block:
+                if self.cellBlock[row, col] != -1:
+                    raise ValueError(f"Cell ({row}, {col}) is used in more than one block of layout {name}.")
+                self.cellBlock[row, col] = block_number
+        # key of the layout in the solution cache, search engine and exact cover matrix caches:
+        # the name, unnamed layouts are keyed by their block of every cell
+        self.key = name if name else "blocks:" + "".join(str(block) for block in self.cellBlock.reshape(81).tolist())
+        # block -> flat cell indices (sorted, so row by row like the standard blocks)
+        self.blockCells = np.array([sorted(row * 9 + col for row, col in block) for block in blocks], dtype=int)
+        cells = np.arange(81).reshape(9, 9)
+        # house -> flat cell indices (rows, columns, blocks)
+        self.houses = np.concatenate([cells, cells.T, self.blockCells])
+        # cell -> (row house, column house, block house)
+        flat = np.arange(81)
+        self.cellHouses = np.stack([flat // 9, 9 + flat % 9, 18 + self.cellBlock.reshape(81)], axis=1)
+        # cell -> sorted flat indices of all other cells in the same row, column or block
+        # (20 peers for the standard layout, jiggsaw layouts can have more)
+        self.peers = [np.array(sorted(set(self.houses[self.cellHouses[cell]].reshape(-1).tolist()) - {cell}), dtype=int)
+                      for cell in range(81)]
+        # house -> 81-bit int with bit cell set for its cells (per-digit bitboard techniques)
+        self.houseBits = [sum(1 << cell for cell in house.tolist()) for house in self.houses]
+        # (block house, line house, intersection bits) of every block and row/column that share cells
+        self.intersections = [(block, line, self.houseBits[block] & self.houseBits[line])
+                              for block in range(18, 27) for line in range(18)
+                              if self.houseBits[block] & self.houseBits[line]]
+        # house -> first bincount bin of the house (10 bins per house: values 0-9), see houseCounts()
+        self.houseOffsets = 10 * np.arange(27)[:, None]
+
+    def getBlockNumber(self, row: int, col: int) -> int:
+        '''Returns the block number of a cell.'''
+        return int(self.cellBlock[row, col])
+
+    def houseCounts(self, grids: np.ndarray) -> np.ndarray:
+        '''Returns the (N,27,10) number of cells with value 0-9 (0: empty) in every house of one (9,9)
+        grid or of N grids, all houses are gathered through the (27,9) house index array and counted by one bincount.'''
+        flat = np.asarray(grids, dtype=np.intp).reshape(-1, 81)
+        n = flat.shape[0]
+        bins = flat[:, self.houses] + self.houseOffsets + 270 * np.arange(n)[:, None, None]
+        return np.bincount(bins.reshape(-1), minlength=270 * n).reshape(n, 27, 10)
+
+    def getBlockIndices(self, block_number: int) -> List[Tuple[int, int]]:
+        '''Returns the list of (row, column) indices of a block.'''
+        return [divmod(int(cell), 9) for cell in self.blockCells[block_number]]
+
+
+# compiled layouts, each layout is compiled only once
+_compiled_layouts: dict[str, BlockLayout] = {}
+
+def get_block_layout(block_index_selection: str = "block_norm_index_") -> BlockLayout:
+    '''Returns the compiled BlockLayout for a block index selection (compiled on first use).'''
+    if block_index_selection not in _compiled_layouts:
+        _compiled_layouts[block_index_selection] = BlockLayout(BLOCK_LAYOUTS[block_index_selection], block_index_selection)
+    return _compiled_layouts[block_index_selection]
 
 def print_block_indices(block_index_selection) -> None:
     '''Prints a visual representation of the Sudoku blocks based on the provided block index selection.'''
@@ -126,14 +201,7 @@ def print_block_indices(block_index_selection) -> None:
     LIGHT_GRAY = "\033[97m"
     WHITE = "\033[98m"
     RESET_COLOR = "\033[0m"
-    cell = np.zeros((9,9), dtype=int)
-
-    for row in range(9):
-        for col in range(9):
-            found_in_some_block = False
-            for i in range(9):
-                if (row, col) in eval(f"{block_index_selection}{i}"):
-                    cell[row, col] = i
+    cell = get_block_layout(block_index_selection).cellBlock
 
 
     for row in range(9):
@@ -0,0 +1,189 @@
+# canonical.py
+
+# canonical form of classic Sudoku puzzles (standard 3x3 blocks) under the full symmetry group:
+# transposition, band and row-in-band permutations, stack and column-in-stack permutations
+# and relabeling of the values
+# - the canonical form is the lexicographically smallest grid (row by row, 0: empty cell) where the
+#   values are relabeled 1, 2, 3, ... in order of their first appearance
+# - the search chooses the rows one after the other for all 2*1296 transposition/column permutation
+#   states at once (numpy), after each row only the states with the smallest relabeled row are kept
+# - puzzles that are equal under the symmetry group get the same canonical form and hash,
+#   the transform maps the puzzle (and its solution) to the canonical form and back
+# - canonicalize_batch runs the search for many puzzles at once
+# - grid_hash and puzzle_hash are the stable raw hashes of a grid and of a puzzle string
+# - very sparse grids (e.g. an empty grid) tie in almost all states, a puzzle with more than
+#   MAX_CANONICAL_STATES tied states is not canonicalized, it keeps its raw grid (identity transform);
+#   the number of tied states is the same for all puzzles of a symmetry class, so such a raw grid
+#   never equals the canonical form of another class
+
+# Werner Schoegler, 28-Nov-2025
+
+# pylint: disable=invalid-name
+
+import hashlib
+from itertools import permutations
+
+import numpy as np
+
+from util.string2array import string2array, strings2array
+
+# 1296 column permutations: 6 stack permutations x 6^3 column permutations inside the stacks
+_PERM3 = list(permutations(range(3)))
+COLUMN_PERMUTATIONS = np.array([[3 * stack + col for stack, inner in zip(stacks, inners) for col in inner]
+                                for stacks in _PERM3 for inners in
+                                [(a, b, c) for a in _PERM3 for b in _PERM3 for c in _PERM3]], dtype=np.intp)
+NUM_COLUMN_PERMUTATIONS = len(COLUMN_PERMUTATIONS)
+_ROW_KEY_WEIGHTS = 10 ** np.arange(8, -1, -1, dtype=np.int64)
+# number of puzzles searched at once (memory: about 23k states per puzzle in the first row)
+BATCH_CHUNK_SIZE = 16
+# tied states per puzzle above which the search gives up (puzzles have at most a few thousand,
+# an empty or one-clue grid hundreds of thousands), bounds time and memory of every search
+MAX_CANONICAL_STATES = 20000
+
+
+class Transform:
+    """Symmetry transform: canonical = relabel[grid(.T)[rowPerm][:, colPerm]]."""
+
+    def __init__(self, transpose: bool, rowPerm: np.ndarray, colPerm: np.ndarray, relabel: np.ndarray):
+        self.transpose = transpose
+        self.rowPerm = rowPerm
+        self.colPerm = colPerm
+        self.relabel = relabel   # value -> canonical value (index 0: empty cell stays 0)
+
+    def apply(self, grid: np.ndarray) -> np.ndarray:
+        """Map a grid (e.g. the puzzle or its solution) to the canonical orientation and labels."""
+        grid = np.asarray(grid)
+        if self.transpose:
+            grid = grid.T
+        return self.relabel[grid[self.rowPerm][:, self.colPerm]]
+
+    def invert(self, grid: np.ndarray) -> np.ndarray:
+        """Map a canonical grid (e.g. the solution of the canonical puzzle) back to the original puzzle."""
+        inverse = np.argsort(self.relabel)
+        result = np.empty((9, 9), dtype=int)
+        result[np.ix_(self.rowPerm, self.colPerm)] = inverse[np.asarray(grid)]
+        return result.T if self.transpose else result
+
+    def __repr__(self) -> str:
+        return (f"Transform(transpose={self.transpose}, rowPerm={self.rowPerm.tolist()}, "
+                f"colPerm={self.colPerm.tolist()}, relabel={self.relabel.tolist()})")
+
+
+def _canonicalize_chunk(grids: np.ndarray) -> tuple[np.ndarray, list[Transform]]:
+    """Canonical forms and transforms of (N,9,9) grids (identity transform for too many tied states)."""
+    n = len(grids)
+    oriented = np.stack([grids, grids.transpose(0, 2, 1)], axis=1).astype(np.int8)  # (N,2,9,9)
+    # initial states: puzzle x transposition x column permutation, no row chosen yet
+    states = n * 2 * NUM_COLUMN_PERMUTATIONS
+    pid = np.repeat(np.arange(n), 2 * NUM_COLUMN_PERMUTATIONS)
+    trans = np.tile(np.repeat(np.arange(2), NUM_COLUMN_PERMUTATIONS), n)
+    colp = np.tile(np.arange(NUM_COLUMN_PERMUTATIONS), 2 * n)
+    labels = np.zeros((states, 10), dtype=np.int8)
+    nextLabel = np.ones(states, dtype=np.int8)
+    rows = np.zeros((states, 0), dtype=np.intp)
+    used = np.zeros((states, 9), dtype=bool)
+    for depth in range(9):
+        # allowed next rows: a row of an unused band at the start of a band, else the rest of the band
+        if depth % 3 == 0:
+            allowed = ~used
+        else:
+            band = rows[:, -1] // 3
+            allowed = (np.arange(9)[None, :] // 3 == band[:, None]) & ~used
+        parent, row = np.nonzero(allowed)
+        pid, trans, colp = pid[parent], trans[parent], colp[parent]
+        labels, nextLabel = labels[parent], nextLabel[parent]
+        rows = np.concatenate([rows[parent], row[:, None]], axis=1)
+        used = used[parent]
+        used[np.arange(len(row)), row] = True
+        # relabel the chosen row, values seen for the first time get the next free label
+        values = oriented[pid, trans, row][np.arange(len(row))[:, None], COLUMN_PERMUTATIONS[colp]]
+        index = np.arange(len(row))
+        relabeled = np.empty_like(values)
+        for col in range(9):
+            value = values[:, col]
+            label = labels[index, value]
+            new = (value != 0) & (label == 0)
+            label[new] = nextLabel[new]
+            labels[index[new], value[new]] = nextLabel[new]
+            nextLabel[new] += 1
+            relabeled[:, col] = label
+        # keep only the states with the smallest relabeled row of their puzzle
+        key = relabeled.astype(np.int64) @ _ROW_KEY_WEIGHTS
+        smallest = np.full(n, np.iinfo(np.int64).max)
+        np.minimum.at(smallest, pid, key)
+        keep = key == smallest[pid]
+        tooMany = np.bincount(pid[keep], minlength=n) > MAX_CANONICAL_STATES
+        keep &= ~tooMany[pid]
+        pid, trans, colp, labels, nextLabel, rows, used = (
+            pid[keep], trans[keep], colp[keep], labels[keep], nextLabel[keep], rows[keep], used[keep])
+    # first remaining state of each puzzle (all remaining states give the same canonical form)
+    first = np.unique(pid, return_index=True)[1]
+    canonical = np.array(grids, dtype=int)
+    identity = np.arange(9)
+    transforms = [Transform(False, identity.copy(), identity.copy(), np.arange(10)) for _ in range(n)]
+    for state in first:
+        relabel = labels[state].astype(int)
+        # values that do not appear in the puzzle get the remaining labels in increasing order
+        missing = [value for value in range(1, 10) if relabel[value] == 0]
+        free = [label for label in range(1, 10) if label not in relabel[1:]]
+        relabel[missing] = free
+        transform = Transform(bool(trans[state]), rows[state].copy(), COLUMN_PERMUTATIONS[colp[state]].copy(), relabel)
+        canonical[pid[state]] = transform.apply(grids[pid[state]])
+        transforms[pid[state]] = transform
+    return canonical, transforms
+
+
+def canonicalize(grid: np.ndarray | str) -> tuple[np.ndarray, Transform]:
+    """Return the canonical form of a 9x9 grid (or 81 character string) and the transform to it."""
+    if isinstance(grid, str):
+        grid = string2array(grid)
+    canonical, transforms = _canonicalize_chunk(np.asarray(grid).reshape(1, 9, 9))
+    return canonical[0], transforms[0]
+
+
+def canonicalize_batch(grids: np.ndarray | list[str]) -> tuple[np.ndarray, list[Transform]]:
+    """Return the canonical forms (N,9,9) and transforms of (N,9,9) grids or a list of puzzle strings."""
+    if isinstance(grids, list):
+        grids = strings2array(grids) if len(grids) > 0 else np.zeros((0, 9, 9), dtype=int)
+    grids = np.asarray(grids).reshape(-1, 9, 9)
+    canonical = np.empty(grids.shape, dtype=int)
+    transforms = []
+    for start in range(0, len(grids), BATCH_CHUNK_SIZE):
+        chunk, chunkTransforms = _canonicalize_chunk(grids[start:start + BATCH_CHUNK_SIZE])
+        canonical[start:start + BATCH_CHUNK_SIZE] = chunk
+        transforms.extend(chunkTransforms)
+    return canonical, transforms
+
+
+def grid_hash(grid: np.ndarray) -> str:
+    """Stable hash (16 hex digits) of a 9x9 grid."""
+    text = "".join(map(str, np.asarray(grid).reshape(81).tolist()))
+    return hashlib.sha1(text.encode("ascii")).hexdigest()[:16]
+
+
+def puzzle_hash(grid_str: str) -> str:
+    """Return a stable hash of a puzzle string ('.' and '0' are the same empty cell)."""
+    digits = "".join(ch if ch.isdigit() else "0" for ch in grid_str.strip())
+    return hashlib.sha1(digits.encode("ascii")).hexdigest()[:16]
+
+
+def canonical_hash(grid: np.ndarray | str) -> str:
+    """Stable hash of the canonical form, equal for all puzzles that are equal under the symmetry group."""
+    return grid_hash(canonicalize(grid)[0])
+
+
+def canonical_hash_batch(grids: np.ndarray | list[str]) -> list[str]:
+    """Canonical hashes of (N,9,9) grids or a list of puzzle strings."""
+    return [grid_hash(grid) for grid in canonicalize_batch(grids)[0]]
+
+
+def dedupe_puzzles(puzzles: dict[str, str]) -> dict[str, str]:
+    """Return the puzzles of a dict (like data/test_data.py) without symmetric duplicates,
+    the first puzzle of each canonical form is kept."""
+    result = {}
+    seen = set()
+    for (level, grid_str), key in zip(puzzles.items(), canonical_hash_batch(list(puzzles.values()))):
+        if key not in seen:
+            seen.add(key)
+            result[level] = grid_str
+    return result
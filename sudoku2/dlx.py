@@ -0,0 +1,221 @@
+# dlx.py
+
+# Dancing Links (Algorithm X, D. Knuth) exact cover solver for Sudoku
+# the Sudoku is encoded as the standard exact cover matrix with 729 rows and 324 columns:
+# - row (cell, value): value placed in cell, cell = row*9 + col, value 1-9
+# - columns 0-80: each cell holds exactly one value
+# - columns 81-161: each row holds each value exactly once
+# - columns 162-242: each column holds each value exactly once
+# - columns 243-323: each block holds each value exactly once (blocks from the block layout)
+# the links are kept in flat python lists (index based) instead of node objects,
+# the full Sudoku matrix is built once per block layout and copied for each solve
+
+# Werner Schoegler, 20-Nov-2025
+
+# pylint: disable=invalid-name
+
+from collections import OrderedDict
+
+import numpy as np
+from block import get_block_layout, BlockLayout
+
+NUM_COLUMNS = 324
+
+class DancingLinks:
+    """Exact cover matrix with dancing links, node 0 is the root, nodes 1..numColumns are the column headers."""
+
+    def __init__(self, numColumns: int):
+        self.numColumns = numColumns
+        n = numColumns + 1
+        self.L = [i - 1 for i in range(n)]
+        self.R = [i + 1 for i in range(n)]
+        self.L[0] = numColumns
+        self.R[numColumns] = 0
+        self.U = list(range(n))
+        self.D = list(range(n))
+        self.C = list(range(n))  # column header of each node
+        self.rowId = [-1] * n    # matrix row of each node
+        self.size = [0] * n      # number of nodes in each column
+        self.rowStart = {}       # first node of each matrix row
+
+    def addRow(self, rowId: int, columns: list[int]) -> None:
+        """Add a matrix row that has a 1 in each of the given columns (0-based column numbers)."""
+        first = -1
+        for column in columns:
+            header = column + 1
+            node = len(self.C)
+            # insert node at the bottom of the column
+            self.U.append(self.U[header])
+            self.D.append(header)
+            self.D[self.U[header]] = node
+            self.U[header] = node
+            self.C.append(header)
+            self.rowId.append(rowId)
+            self.size[header] += 1
+            # insert node at the end of the row
+            if first < 0:
+                first = node
+                self.L.append(node)
+                self.R.append(node)
+            else:
+                self.L.append(self.L[first])
+                self.R.append(first)
+                self.R[self.L[first]] = node
+                self.L[first] = node
+        self.rowStart[rowId] = first
+
+    def copy(self) -> "DancingLinks":
+        """Return an independent copy of the matrix (the links are flat lists, so this is cheap)."""
+        other = DancingLinks.__new__(DancingLinks)
+        other.numColumns = self.numColumns
+        other.L, other.R = self.L.copy(), self.R.copy()
+        other.U, other.D = self.U.copy(), self.D.copy()
+        other.C = self.C          # never modified by the search
+        other.rowId = self.rowId  # never modified by the search
+        other.size = self.size.copy()
+        other.rowStart = self.rowStart
+        return other
+
+    def cover(self, header: int) -> None:
+        """Remove a column and all rows that have a 1 in it."""
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        R[L[header]] = R[header]
+        L[R[header]] = L[header]
+        i = D[header]
+        while i != header:
+            j = R[i]
+            while j != i:
+                D[U[j]] = D[j]
+                U[D[j]] = U[j]
+                size[C[j]] -= 1
+                j = R[j]
+            i = D[i]
+
+    def uncover(self, header: int) -> None:
+        """Undo cover(header), the nodes are relinked in reverse order."""
+        L, R, U, D, C, size = self.L, self.R, self.U, self.D, self.C, self.size
+        i = U[header]
+        while i != header:
+            j = L[i]
+            while j != i:
+                size[C[j]] += 1
+                D[U[j]] = j
+                U[D[j]] = j
+                j = L[j]
+            i = U[i]
+        R[L[header]] = header
+        L[R[header]] = header
+
+    def selectRow(self, rowId: int) -> bool:
+        """Pre-select a matrix row (e.g. a given clue) by covering all of its columns.
+        Returns False if one of the columns was already covered (conflicting rows)."""
+        node = self.rowStart[rowId]
+        j = node
+        while True:
+            header = self.C[j]
+            if self.L[self.R[header]] != header:
+                return False  # column is no longer in the header list
+            self.cover(header)
+            j = self.R[j]
+            if j == node:
+                return True
+
+    def search(self, limit: int = 1) -> list[list[int]]:
+        """Run Algorithm X and return up to limit solutions, each solution is a list of row ids."""
+        solutions = []
+        partial = []
+        self._search(partial, solutions, limit)
+        return solutions
+
+    def _search(self, partial: list[int], solutions: list[list[int]], limit: int) -> bool:
+        """Recursive search, returns True if the limit of solutions is reached."""
+        R, D, size = self.R, self.D, self.size
+        if R[0] == 0:
+            solutions.append(partial.copy())
+            return len(solutions) >= limit
+        # choose the column with the fewest rows (S heuristic)
+        header = R[0]
+        best = header
+        bestSize = size[header]
+        while header != 0:
+            if size[header] < bestSize:
+                best = header
+                bestSize = size[header]
+                if bestSize <= 1:
+                    break
+            header = R[header]
+        if bestSize == 0:
+            return False  # dead end
+        self.cover(best)
+        i = D[best]
+        while i != best:
+            partial.append(self.rowId[i])
+            j = R[i]
+            while j != i:
+                self.cover(self.C[j])
+                j = R[j]
+            done = self._search(partial, solutions, limit)
+            j = self.L[i]
+            while j != i:
+                self.uncover(self.C[j])
+                j = self.L[j]
+            partial.pop()
+            if done:
+                self.uncover(best)
+                return True
+            i = D[i]
+        self.uncover(best)
+        return False
+
+
+def sudoku_row_columns(cell: int, value: int, block: int) -> list[int]:
+    """Columns of the exact cover matrix row for value (1-9) placed in cell (0-80) of a block."""
+    row, col = divmod(cell, 9)
+    v = value - 1
+    return [cell, 81 + row * 9 + v, 162 + col * 9 + v, 243 + block * 9 + v]
+
+
+def _build_sudoku_matrix(layout: BlockLayout) -> DancingLinks:
+    """Build the full 729x324 Sudoku exact cover matrix, row id = cell*9 + value-1."""
+    matrix = DancingLinks(NUM_COLUMNS)
+    cellBlock = layout.cellBlock.reshape(81).tolist()
+    for cell in range(81):
+        for value in range(1, 10):
+            matrix.addRow(cell * 9 + value - 1, sudoku_row_columns(cell, value, cellBlock[cell]))
+    return matrix
+
+# exact cover matrix of each block layout, built on first use and keyed by BlockLayout.key,
+# the least recently used matrices are dropped beyond MAX_MATRICES layouts
+MAX_MATRICES = 16
+_sudoku_matrices: OrderedDict[str, DancingLinks] = OrderedDict()
+
+def get_sudoku_matrix(layout: BlockLayout) -> DancingLinks:
+    """Return the (shared, unmodified) exact cover matrix of a block layout."""
+    matrix = _sudoku_matrices.get(layout.key)
+    if matrix is None:
+        matrix = _build_sudoku_matrix(layout)
+        _sudoku_matrices[layout.key] = matrix
+        if len(_sudoku_matrices) > MAX_MATRICES:
+            _sudoku_matrices.popitem(last=False)
+    _sudoku_matrices.move_to_end(layout.key)
+    return matrix
+
+
+def solve_exact_cover(grid: np.ndarray, limit: int = 1, layout: BlockLayout | None = None) -> list[np.ndarray]:
+    """Solve a 9x9 Sudoku grid with dancing links, the given clues are pre-selected rows.
+    Returns a list with up to limit solved 9x9 grids (empty list if there is no solution)."""
+    if layout is None:
+        layout = get_block_layout()
+    matrix = get_sudoku_matrix(layout).copy()
+    values = np.asarray(grid).reshape(81).tolist()
+    for cell, value in enumerate(values):
+        if value != 0 and not matrix.selectRow(cell * 9 + value - 1):
+            return []  # the clues contradict each other
+    solutions = []
+    for rows in matrix.search(limit):
+        solution = np.array(values, dtype=int)
+        for rowId in rows:
+            cell, v = divmod(rowId, 9)
+            solution[cell] = v + 1
+        solutions.append(solution.reshape(9, 9))
+    return solutions
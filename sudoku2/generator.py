@@ -0,0 +1,139 @@
+# generator.py
+
+# random puzzle generator with uniqueness guarantee
+# - a random complete grid is found by the search engine with randomized value order
+# - clues are removed in random order (in symmetric groups of cells) as long as the
+#   puzzle keeps a unique solution, until the target number of clues is reached
+# - generate_batch runs in parallel worker processes, every puzzle has its own seed
+#   derived from the batch seed, so the result does not depend on the number of workers
+# the puzzles are 81 character strings like in the data/*.txt files ('0': empty cell)
+
+# Werner Schoegler, 25-Nov-2025
+
+# pylint: disable=invalid-name
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from block import get_block_layout, BlockLayout
+from search import get_search_engine
+
+# symmetry of the removed clues: cell -> partner cell (cell = row*9 + col)
+SYMMETRIES = {
+    "none": lambda cell: cell,
+    "rotational": lambda cell: 80 - cell,                         # 180 degree rotation
+    "horizontal": lambda cell: (8 - cell // 9) * 9 + cell % 9,    # mirror at the middle row
+    "vertical": lambda cell: cell // 9 * 9 + 8 - cell % 9,        # mirror at the middle column
+    "diagonal": lambda cell: cell % 9 * 9 + cell // 9,            # mirror at the main diagonal
+}
+
+
+def _cell_groups(symmetry: str) -> list[tuple[int, ...]]:
+    """Split the 81 cells into the groups of cells that are removed together."""
+    if symmetry not in SYMMETRIES:
+        raise ValueError(f"Unknown symmetry '{symmetry}', use one of {list(SYMMETRIES)}")
+    partner = SYMMETRIES[symmetry]
+    return sorted({tuple(sorted({cell, partner(cell)})) for cell in range(81)})
+
+
+def generate_full_grid(rng: random.Random, layout: BlockLayout | None = None) -> list[int]:
+    """Return a random complete grid as flat value list (81 entries)."""
+    return get_search_engine(layout).search([0] * 81, rng=rng)[0]
+
+
+def generate_puzzle(numClues: int = 26, symmetry: str = "none", seed: int | None = None,
+                    attempts: int = 10, layout: str | BlockLayout = "block_norm_index_") -> tuple[str, str]:
+    """Generate a puzzle with a unique solution and return (puzzle, solution) as 81 character strings.
+    Clues are removed until numClues is reached, if a grid gets stuck above numClues another
+    random grid is tried (up to attempts grids) and the puzzle with the fewest clues is returned."""
+    if isinstance(layout, str):
+        layout = get_block_layout(layout)
+    rng = random.Random(seed)
+    engine = get_search_engine(layout)
+    groups = _cell_groups(symmetry)
+    best = None
+    for _ in range(max(1, attempts)):
+        solution = generate_full_grid(rng, layout)
+        values = solution.copy()
+        clues = 81
+        order = groups.copy()
+        rng.shuffle(order)
+        for group in order:
+            if clues - len(group) < numClues:
+                continue
+            removed = [values[cell] for cell in group]
+            for cell in group:
+                values[cell] = 0
+            if len(engine.search(values, limit=2)) == 1:
+                clues -= len(group)
+                if clues == numClues:
+                    break
+            else:
+                for cell, value in zip(group, removed):
+                    values[cell] = value
+        if best is None or clues < best[0]:
+            best = (clues, values, solution)
+        if clues == numClues:
+            break
+    return "".join(map(str, best[1])), "".join(map(str, best[2]))
+
+
+def _generate_chunk(seeds: list[int], numClues: int, symmetry: str, attempts: int, layout: str) -> list[tuple[str, str]]:
+    """Generate one puzzle per seed inside one worker process."""
+    return [generate_puzzle(numClues, symmetry, seed, attempts, layout) for seed in seeds]
+
+
+def generate_batch(count: int, numClues: int = 26, symmetry: str = "none", seed: int = 0, attempts: int = 10,
+                   workers: int | None = None, chunkSize: int | None = None,
+                   layout: str = "block_norm_index_") -> list[tuple[str, str]]:
+    """Generate count puzzles in parallel and return the list of (puzzle, solution) strings.
+    The puzzle seeds are a deterministic stream derived from seed, so the same seed gives the
+    same puzzles for any number of workers.
+    workers: number of worker processes (None: os.cpu_count(), 1: generate in this process)
+    chunkSize: number of puzzles sent to a worker at once (None: about 4 chunks per worker)"""
+    seeds = [int(child.generate_state(1)[0]) for child in np.random.SeedSequence(seed).spawn(count)]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or count <= 1:
+        return _generate_chunk(seeds, numClues, symmetry, attempts, layout)
+    if chunkSize is None:
+        chunkSize = max(1, count // (4 * workers))
+    chunks = [seeds[i:i + chunkSize] for i in range(0, count, chunkSize)]
+    n = len(chunks)
+    puzzles = []
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for chunkPuzzles in executor.map(_generate_chunk, chunks, [numClues] * n, [symmetry] * n,
+                                         [attempts] * n, [layout] * n):
+            puzzles.extend(chunkPuzzles)
+    return puzzles
+
+
+def write_puzzle_file(fileName: str, puzzles: list[tuple[str, str]]) -> None:
+    """Write the puzzles in the data/*.txt format (one puzzle per line, clue count as comment)."""
+    with open(fileName, "w") as fp:
+        for puzzle, _ in puzzles:
+            fp.write(f"{puzzle} // {81 - puzzle.count('0')} clues\n")
+
+
+if __name__ == '__main__':
+    import time
+
+    # User settings
+    NUM_PUZZLES = 100
+    NUM_CLUES = 26
+    SYMMETRY = "rotational"
+    SEED = 0
+    NUM_WORKERS = None  # None: os.cpu_count()
+    OUTPUT_FILE = "data/generated.txt"
+
+    start_time = time.time()
+    puzzles = generate_batch(NUM_PUZZLES, NUM_CLUES, SYMMETRY, SEED, workers=NUM_WORKERS)
+    elapsed = time.time() - start_time
+    write_puzzle_file(OUTPUT_FILE, puzzles)
+    clues = np.array([81 - puzzle.count("0") for puzzle, _ in puzzles])
+    print(f"Generated {len(puzzles)} puzzles in {elapsed:.2f}s ({len(puzzles) / elapsed:.1f} puzzles/s)")
+    print(f"Clues: min {clues.min()}, mean {clues.mean():.1f}, max {clues.max()}, target {NUM_CLUES}")
+    print(f"Written to {OUTPUT_FILE}")
@@ -0,0 +1,170 @@
+# rater.py
+
+# difficulty rater based on a ladder of logical techniques
+# - in each step the cheapest technique of the ladder that makes progress is applied,
+#   after progress the ladder starts again at the bottom
+# - the rating is the hardest technique that was needed and the number of steps,
+#   if no technique makes progress the puzzle is finished by backtracking
+# - the ratings are cached in a JSON file keyed by the canonical puzzle hash (see canonical.py),
+#   so re-rating a corpus only rates the new puzzles, also symmetric copies of a rated puzzle are
+#   found in the cache; the raw puzzle hash is stored as alias of the canonical hash, so known
+#   puzzles need no canonicalization (the cache is dropped if the ladder changes)
+# - the order in which the techniques find their progress depends on the orientation of the grid,
+#   so steps and counts of a cached rating are those of the first rated copy of a symmetry class
+#   (another copy can need a different number of steps)
+
+# Werner Schoegler, 25-Nov-2025
+
+# pylint: disable=invalid-name
+
+import json
+import os
+
+from sudoku2 import Sudoku
+from canonical import canonical_hash, puzzle_hash
+from util.string2array import string2array
+
+# technique ladder, cheapest first: (name, Sudoku method returning True on progress, difficulty)
+TECHNIQUE_LADDER = [
+    ("naked single", "solveSingles", "easy"),
+    ("hidden single", "solveHiddenSingles", "medium"),
+    ("locked candidates", "solveLockedCandidates", "hard"),
+    ("naked subset", "solveNakedSubsets", "hard"),
+    ("hidden subset", "solveHiddenSubsets", "hard"),
+    ("fish", "solveFish", "evil"),
+]
+# fallback if no technique of the ladder makes progress
+GUESS_TECHNIQUE = ("backtracking", "solveBacktrackOptimized", "evil")
+# version of the cache file format (2: canonical keys with raw hash aliases)
+CACHE_FORMAT = 2
+
+# one Sudoku instance per process, reused for all ratings
+_sudoku = None
+
+
+def rate_puzzle(grid_str: str, layout: str = "block_norm_index_") -> dict:
+    """Solve a puzzle with the technique ladder and return its rating:
+    technique/difficulty: hardest technique needed, level: its index in the ladder
+    (len(TECHNIQUE_LADDER) for backtracking), steps: number of technique applications,
+    counts: applications per technique, solved: puzzle solved."""
+    global _sudoku
+    grid = string2array(grid_str)
+    if _sudoku is None:
+        _sudoku = Sudoku(grid, layout)
+    sudoku = _sudoku
+    if sudoku.layout.name != layout:
+        sudoku.setLayout(layout)
+    sudoku.setGrid(grid)
+    sudoku.debugLevel = 0
+    counts = {}
+    level = -1
+    while not sudoku.isSolved():
+        for index, (name, method, _) in enumerate(TECHNIQUE_LADDER):
+            if getattr(sudoku, method)():
+                break
+        else:
+            index = len(TECHNIQUE_LADDER)
+            name, method, _ = GUESS_TECHNIQUE
+            if not getattr(sudoku, method)():
+                break  # no solution
+        counts[name] = counts.get(name, 0) + 1
+        level = max(level, index)
+    ladder = TECHNIQUE_LADDER + [GUESS_TECHNIQUE]
+    return {
+        "technique": ladder[level][0] if level >= 0 else "none",
+        "difficulty": ladder[level][2] if level >= 0 else "easy",
+        "level": level,
+        "steps": sum(counts.values()),
+        "counts": counts,
+        "solved": bool(sudoku.isSolved()),
+    }
+
+
+class RatingCache:
+    """Ratings on disk (JSON), keyed by canonical puzzle hash, only valid for the current technique ladder.
+    All symmetric copies of a puzzle share the rating of the first rated copy (steps and counts depend on the orientation)."""
+
+    def __init__(self, fileName: str):
+        self.fileName = fileName
+        self.ladder = [name for name, _, _ in TECHNIQUE_LADDER + [GUESS_TECHNIQUE]]
+        self.ratings = {}
+        self.aliases = {}  # raw puzzle hash -> canonical hash
+        self.modified = False
+        if os.path.exists(fileName):
+            with open(fileName, "r") as fp:
+                data = json.load(fp)
+            if data.get("format") == CACHE_FORMAT and data.get("ladder") == self.ladder:
+                self.ratings = data["ratings"]
+                self.aliases = data["aliases"]
+
+    def get(self, key: str) -> dict | None:
+        return self.ratings.get(key)
+
+    def lookup(self, grid_str: str, layout: str = "block_norm_index_") -> tuple[str, dict | None]:
+        """Return the cache key of a puzzle and its cached rating (None if not cached).
+        The canonical form is only computed for puzzles whose raw hash is not known yet,
+        puzzles of other block layouts are keyed by layout name and raw hash."""
+        rawKey = puzzle_hash(grid_str)
+        if layout != "block_norm_index_":
+            key = f"{layout}:{rawKey}"
+            return key, self.ratings.get(key)
+        key = self.aliases.get(rawKey)
+        if key is None:
+            key = canonical_hash(grid_str)
+            self.aliases[rawKey] = key
+            self.modified = True
+        return key, self.ratings.get(key)
+
+    def put(self, key: str, rating: dict) -> None:
+        self.ratings[key] = rating
+        self.modified = True
+
+    def save(self) -> None:
+        """Write the cache file if it was modified (written to a temporary file and renamed)."""
+        if not self.modified:
+            return
+        tmpName = self.fileName + ".tmp"
+        with open(tmpName, "w") as fp:
+            json.dump({"format": CACHE_FORMAT, "ladder": self.ladder, "ratings": self.ratings,
+                       "aliases": self.aliases}, fp)
+        os.replace(tmpName, self.fileName)
+        self.modified = False
+
+
+def rate_puzzles(puzzles: dict[str, str], cacheFile: str | None = None,
+                 layout: str = "block_norm_index_") -> dict[str, dict]:
+    """Rate all puzzles of a dict (like data/test_data.py) and return a dict level -> rating.
+    With cacheFile the ratings of known puzzles are taken from the cache and new ratings are added,
+    a symmetric copy of a cached puzzle gets the cached rating with the steps and counts of the rated copy."""
+    cache = RatingCache(cacheFile) if cacheFile is not None else None
+    ratings = {}
+    for level, grid_str in puzzles.items():
+        if cache is None:
+            rating = rate_puzzle(grid_str, layout)
+        else:
+            key, rating = cache.lookup(grid_str, layout)
+            if rating is None:
+                rating = rate_puzzle(grid_str, layout)
+                cache.put(key, rating)
+        ratings[level] = rating
+    if cache is not None:
+        cache.save()
+    return ratings
+
+
+if __name__ == '__main__':
+    import time
+    from runner import load_puzzle_file
+
+    # User settings
+    DATA_FILES = ["data/easy_50.txt", "data/sudoku_1.txt", "data/top95.txt", "data/hardest.txt"]
+    CACHE_FILE = "data/ratings.json"
+
+    for fileName in DATA_FILES:
+        start_time = time.time()
+        ratings = rate_puzzles(load_puzzle_file(fileName), CACHE_FILE)
+        elapsed = time.time() - start_time
+        techniques = {}
+        for rating in ratings.values():
+            techniques[rating["technique"]] = techniques.get(rating["technique"], 0) + 1
+        print(f"{fileName:24} | {len(ratings):5} puzzles | {elapsed:8.3f}s | {techniques}")
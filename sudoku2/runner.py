@@ -0,0 +1,213 @@
+# runner.py
+
+# batch runner that solves many Sudokus in parallel worker processes
+# each puzzle is solved with the same cascade as used in tests/sudoku_test2.py:
+#   solver1 without hidden singles -> solver1 with hidden singles
+#   -> solver1 with eliminations (locked candidates, naked/hidden subsets, fish) -> optimized backtracking
+# and the result table (status, algorithm, time) is returned per puzzle
+# the puzzles can be given as dict (e.g. from data/test_data.py) or read from the data/*.txt files
+# with a solution store (see solution_store.py) puzzles solved in earlier runs are not solved again
+
+# Werner Schoegler, 22-Nov-2025
+
+# pylint: disable=invalid-name
+
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from sudoku2 import Sudoku
+from solution_cache import SolutionCache
+from solution_store import SolutionStore
+from util.string2array import string2array
+
+# Some color definitions for terminal with ANSI support
+GREEN = '\033[92m'
+RED = '\033[91m'
+RESET = '\033[0m'
+
+# one Sudoku instance per (worker) process, reused for all puzzles of that process
+_sudoku = None
+# optional solution cache per (worker) process, see solve_puzzle(cacheEntries)
+_cache = None
+
+
+def load_puzzle_file(fileName: str) -> dict[str, str]:
+    """Read a data/*.txt file with one 81 character puzzle per line, comments start with // or #.
+    Returns a dict like the ones in data/test_data.py, the keys are '<file name> <line number>'."""
+    name = os.path.splitext(os.path.basename(fileName))[0]
+    puzzles = {}
+    with open(fileName, "r") as fp:
+        for lineNumber, line in enumerate(fp, start=1):
+            puzzle = re.split(r"//|#", line, maxsplit=1)[0].strip()
+            if len(puzzle) == 81:
+                puzzles[f"{name} {lineNumber}"] = puzzle
+    return puzzles
+
+
+def solve_puzzle(level: str, grid_str: str, debugLevel: int = 0, layout: str = "block_norm_index_",
+                 enableStats: bool = False, cacheEntries: int | None = None, cacheCanonical: bool = False) -> dict:
+    """Solve one puzzle with the solver cascade and return its result entry.
+    With enableStats the entry also holds the solver statistics (see Sudoku.stats()).
+    With cacheEntries the puzzle is first looked up in the solution cache of this process
+    (LRU with cacheEntries entries), a cached puzzle is reported with algorithm 'cache'.
+    The cache finds repeated puzzles only, with cacheCanonical also symmetric copies: that costs
+    a canonicalization per miss (about 15 ms, several times the solve time of an easy puzzle)."""
+    global _sudoku, _cache
+    grid = string2array(grid_str)
+    if _sudoku is None:
+        _sudoku = Sudoku(grid, layout)
+    sudoku = _sudoku
+    if sudoku.layout.name != layout:
+        sudoku.setLayout(layout)
+    sudoku.setGrid(grid)
+    sudoku.debugLevel = debugLevel
+    if enableStats != (sudoku.stats() is not None):
+        sudoku.enableStats(enableStats)
+    elif enableStats:
+        sudoku.resetStats()
+    result = {"level": level, "emptyCells": int(sudoku.count_empty_cells())}
+    if cacheEntries is not None and (_cache is None or _cache.maxEntries != cacheEntries
+                                     or _cache.canonical != cacheCanonical):
+        _cache = SolutionCache(maxEntries=cacheEntries, canonical=cacheCanonical)
+    cache = _cache if cacheEntries is not None else None
+    # the time of a successful solver stage is reported (failed solver1 trials are not counted)
+    start_time = time.time()
+    solution = cache.get(grid, layout) if cache is not None else None
+    if solution is not None:
+        sudoku.setGrid(solution)
+        algorithm = "cache"
+    elif sudoku.solver1(enableHiddenSingles=False):
+        algorithm = "solver1"
+    else:
+        sudoku.setGrid(string2array(grid_str))
+        start_time = time.time()
+        if sudoku.solver1(enableHiddenSingles=True):
+            algorithm = "solver1 HS"
+        elif sudoku.contradiction is None and sudoku.solver1(enableHiddenSingles=True, enableSubsets=True,
+                                                             enableLockedCandidates=True, enableFish=True):
+            algorithm = "solver1 advanced"
+        elif sudoku.contradiction is not None:
+            # singles and eliminations never remove the value of a solution: the puzzle has no solution
+            algorithm = "contradiction"
+        elif sudoku.solveBacktrackOptimized():
+            algorithm = "backtracking"
+        else:
+            algorithm = "Backtracking failed"
+    result["time"] = time.time() - start_time
+    result["solved"] = bool(sudoku.isSolved())
+    if cache is not None and solution is None and result["solved"]:
+        cache.put(grid, sudoku.grid, layout)
+    result["status"] = "solved" if result["solved"] else "unsolved"
+    result["algorithm"] = algorithm
+    result["grid"] = sudoku.grid.copy()
+    if enableStats:
+        result["stats"] = sudoku.stats()
+    return result
+
+
+def _solve_chunk(items: list[tuple[str, str]], debugLevel: int = 0, layout: str = "block_norm_index_",
+                 enableStats: bool = False, cacheEntries: int | None = None, cacheCanonical: bool = False) -> list[dict]:
+    """Solve a list of (level, puzzle string) items inside one worker process."""
+    return [solve_puzzle(level, grid_str, debugLevel, layout, enableStats, cacheEntries, cacheCanonical)
+            for level, grid_str in items]
+
+
+def run_batch(puzzles: dict[str, str], workers: int | None = None, chunkSize: int | None = None,
+              debugLevel: int = 0, layout: str = "block_norm_index_", enableStats: bool = False,
+              cacheEntries: int | None = None, storeFile: str | None = None,
+              cacheCanonical: bool = False) -> dict[str, dict]:
+    """Solve all puzzles of a dict and return a dict level -> result entry (in input order).
+    workers: number of worker processes (None: os.cpu_count(), 1: solve in this process)
+    chunkSize: number of puzzles sent to a worker at once (None: about 4 chunks per worker)
+    layout: name of the block layout of all puzzles (see block.BLOCK_LAYOUTS)
+    enableStats: add the solver statistics to each result entry (key 'stats')
+    cacheEntries: size of the solution cache of each worker process (None: no cache)
+    cacheCanonical: the cache also finds symmetric copies of a cached puzzle, costs a canonicalization
+               per miss (about 15 ms), so only worth it for input with many symmetric copies
+    storeFile: SQLite solution store, stored puzzles are reported with algorithm 'store' and
+               the new solutions are added to the store (lookup and writes in this process)"""
+    items = list(puzzles.items())
+    stored = {}
+    if storeFile is not None:
+        store = SolutionStore(storeFile)
+        entries = store.getMany([grid_str for _, grid_str in items], layout)
+        for (level, grid_str), entry in zip(items, entries):
+            if entry is not None:
+                stored[level] = _stored_result(level, grid_str, entry)
+        items = [item for item in items if item[0] not in stored]
+    if workers is None:
+        workers = os.cpu_count() or 1
+    if workers <= 1 or len(items) <= 1:
+        results = _solve_chunk(items, debugLevel, layout, enableStats, cacheEntries, cacheCanonical)
+    else:
+        if chunkSize is None:
+            chunkSize = max(1, len(items) // (4 * workers))
+        chunks = [items[i:i + chunkSize] for i in range(0, len(items), chunkSize)]
+        results = []
+        n = len(chunks)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            for chunkResults in executor.map(_solve_chunk, chunks, [debugLevel] * n, [layout] * n, [enableStats] * n,
+                                             [cacheEntries] * n, [cacheCanonical] * n):
+                results.extend(chunkResults)
+    if storeFile is not None:
+        for (_, grid_str), result in zip(items, results):
+            if result["solved"]:
+                trace = {"algorithm": result["algorithm"]}
+                if enableStats:
+                    trace["stats"] = result["stats"]
+                store.put(grid_str, result["grid"], solveTime=result["time"], trace=trace, layout=layout)
+        store.close()
+    results = {result["level"]: result for result in results}
+    return {level: stored[level] if level in stored else results[level] for level in puzzles}
+
+
+def _stored_result(level: str, grid_str: str, entry: dict) -> dict:
+    """Result entry of a puzzle taken from the solution store."""
+    grid = string2array(grid_str)
+    return {
+        "level": level,
+        "emptyCells": int(np.count_nonzero(grid == 0)),
+        "time": 0.0,
+        "solved": True,
+        "status": "solved",
+        "algorithm": "store",
+        "grid": string2array(entry["solution"]),
+        "storedTime": entry["time"],
+        "trace": entry["trace"],
+    }
+
+
+def print_results(results: dict[str, dict]) -> None:
+    """Print the summary and the table of solving status, algorithm and time."""
+    counts = {}
+    for result in results.values():
+        counts[result["algorithm"]] = counts.get(result["algorithm"], 0) + 1
+    print("="*80 + "\nSummary of solving status:")
+    print(f"Total puzzles processed: {len(results)}")
+    print(f"Total solved by solver1 without hidden singles: {counts.get('solver1', 0)}")
+    print(f"Total solved by solver1 with hidden singles: {counts.get('solver1 HS', 0)}")
+    print(f"Total solved by solver1 with eliminations: {counts.get('solver1 advanced', 0)}")
+    print(f"Total solved by backtracking: {counts.get('backtracking', 0)}")
+    if counts.get("cache", 0) > 0:
+        print(f"Total taken from the solution cache: {counts['cache']}")
+    if counts.get("store", 0) > 0:
+        print(f"Total taken from the solution store: {counts['store']}")
+    if counts.get("Backtracking failed", 0) > 0:
+        print(f"Total backtracking failures: {counts['Backtracking failed']}")
+
+    print(f"{'Level':12} | {'Empty':6} | {'Status':12} | {'Algorithm':24} | {'Time [seconds   ]':24}")
+    print("-"*80)
+    for level, result in results.items():
+        color = GREEN if result["status"] == "solved" else RED
+        print(f"{color}{level:12} | {result['emptyCells']:6} | {result['status']:12} | "
+              f"{result['algorithm']:24} | {result['time']:<24.4f}{RESET}")
+    print("-"*80)
+
+    # average time calculation
+    times = np.array([result["time"] for result in results.values()])
+    if len(times) > 0:
+        print(f"\nTotal time: {times.sum():.4f}s | Average: {times.mean():.4f}s")
@@ -0,0 +1,177 @@
+# search.py
+
+# iterative backtracking search engine (no recursion)
+# - the grid is kept as flat python lists: values[81], candidate masks cand[81] and
+#   candidate counts count[81], placing a value removes it from the masks of all peers,
+#   peers left with a single candidate are placed right away (naked singles)
+# - every change of a candidate mask is written to a trail, so undo is popping the trail
+#   back to the mark stored in the decision stack
+# - the next cell is the empty cell with minimum remaining values (MRV), taken from the
+#   incrementally maintained counts instead of rescanning the grid
+# - the decision stack is preallocated (81 frames, at most one decision per empty cell) and
+#   reused by every search, the trail only grows with the number of empty cells, there is no
+#   python frame per filled cell
+
+# Werner Schoegler, 24-Nov-2025
+
+# pylint: disable=invalid-name
+
+import random
+from collections import OrderedDict
+
+from block import get_block_layout, BlockLayout
+
+ALL_VALUES_MASK = 0x1FF
+MASK_VALUES = [[val for val in range(1, 10) if mask & (1 << (val - 1))] for mask in range(512)]
+MASK_POPCOUNT = [len(values) for values in MASK_VALUES]
+# value of a single bit mask (only used for masks with exactly one bit set)
+BIT_VALUE = {1 << (val - 1): val for val in range(1, 10)}
+
+
+class SearchEngine:
+    """Iterative MRV backtracking on flat candidate masks for one block layout."""
+
+    def __init__(self, layout: BlockLayout):
+        self.layout = layout
+        self.peers = [tuple(peers.tolist()) for peers in layout.peers]
+        self.cellHouses = [tuple(houses) for houses in layout.cellHouses.tolist()]
+        self.nodes = 0  # number of placed guesses in the last search
+        # decision stack: [cell, untried value mask, trail mark] per depth, at most one decision per cell
+        self.frames = [[0, 0, 0] for _ in range(81)]
+
+    def _setup(self, values: list[int], eliminated: list[int] | None = None) -> bool:
+        """Initialize the candidate masks from the given values (without the eliminated candidate masks
+        per cell, if given), returns False for conflicting clues."""
+        houseMask = [0] * 27
+        for cell, value in enumerate(values):
+            if value != 0:
+                bit = 1 << (value - 1)
+                for house in self.cellHouses[cell]:
+                    if houseMask[house] & bit:
+                        return False  # value used twice in a house
+                    houseMask[house] |= bit
+        self.values = list(values)
+        self.cand = [0] * 81
+        self.count = [0] * 81
+        self.empty = []
+        self.trail = []
+        ok = True
+        for cell, value in enumerate(values):
+            if value == 0:
+                h0, h1, h2 = self.cellHouses[cell]
+                mask = ~(houseMask[h0] | houseMask[h1] | houseMask[h2]) & ALL_VALUES_MASK
+                if eliminated is not None:
+                    mask &= ~eliminated[cell]
+                self.cand[cell] = mask
+                self.count[cell] = MASK_POPCOUNT[mask]
+                self.empty.append(cell)
+                if mask == 0:
+                    ok = False
+        return ok
+
+    def _place(self, cell: int, value: int) -> bool:
+        """Place a value and remove it from the peers, peers that are left with a single
+        candidate are placed as well (naked singles). Returns False if a cell has no candidate left.
+        All changes are written to the trail (also in case of a contradiction)."""
+        cand, count, values, trail, empty, peers = self.cand, self.count, self.values, self.trail, self.empty, self.peers
+        queue = [(cell, 1 << (value - 1))]
+        while queue:
+            cell, bit = queue.pop()
+            if values[cell] != 0:
+                continue  # already placed
+            if not cand[cell] & bit:
+                return False  # the forced value was removed by another placement
+            trail.append((~cell, cand[cell]))  # negative entry: placement of a value
+            values[cell] = BIT_VALUE[bit]
+            cand[cell] = 0
+            empty[empty.index(cell)] = empty[-1]
+            empty.pop()
+            for peer in peers[cell]:
+                mask = cand[peer]
+                if mask & bit:
+                    trail.append((peer, mask))
+                    mask ^= bit
+                    cand[peer] = mask
+                    count[peer] -= 1
+                    if count[peer] <= 1:
+                        if mask == 0:
+                            return False
+                        queue.append((peer, mask))
+        return True
+
+    def _undo(self, mark: int) -> None:
+        """Undo all changes on the trail back to mark."""
+        cand, count, values, trail = self.cand, self.count, self.values, self.trail
+        while len(trail) > mark:
+            cell, mask = trail.pop()
+            if cell < 0:
+                cell = ~cell
+                values[cell] = 0
+                self.empty.append(cell)
+            cand[cell] = mask
+            count[cell] = MASK_POPCOUNT[mask]
+
+    def search(self, values: list[int], limit: int = 1, rng: random.Random | None = None,
+               mrv: bool = True, eliminated: list[int] | None = None) -> list[list[int]]:
+        """Search up to limit solutions of the flat value list (81 entries, 0: empty cell).
+        With rng the values of each decision are tried in random order (e.g. for puzzle generation),
+        with mrv=False the empty cells are filled in row order instead of fewest candidates first,
+        eliminated: candidate masks per cell that are already ruled out (e.g. Sudoku.eliminated)."""
+        self.nodes = 0
+        solutions = []
+        if not self._setup(values, eliminated):
+            return solutions
+        count, frames = self.count, self.frames
+        depth = 0  # number of decisions on the stack
+        dead = False
+        while True:
+            if not dead:
+                if len(self.empty) == 0:
+                    solutions.append(self.values.copy())
+                    if len(solutions) >= limit:
+                        break
+                else:
+                    cell = min(self.empty, key=count.__getitem__) if mrv else min(self.empty)
+                    frame = frames[depth]
+                    frame[0], frame[1], frame[2] = cell, self.cand[cell], len(self.trail)
+                    depth += 1
+            # try the next untried value of the top decision, backtrack if there is none
+            dead = True
+            while depth > 0:
+                frame = frames[depth - 1]
+                self._undo(frame[2])
+                mask = frame[1]
+                if mask == 0:
+                    depth -= 1
+                    continue
+                if rng is None:
+                    bit = mask & -mask
+                else:
+                    bit = 1 << (rng.choice(MASK_VALUES[mask]) - 1)
+                frame[1] = mask ^ bit
+                self.nodes += 1
+                dead = not self._place(frame[0], BIT_VALUE[bit])
+                break
+            else:
+                break  # search space exhausted
+        self._undo(0)
+        return solutions
+
+
+# one search engine per block layout, keyed by BlockLayout.key (also unnamed layouts are reused),
+# the least recently used engines are dropped beyond MAX_ENGINES layouts
+MAX_ENGINES = 16
+_engines: OrderedDict[str, SearchEngine] = OrderedDict()
+
+def get_search_engine(layout: BlockLayout | None = None) -> SearchEngine:
+    """Return the search engine of a block layout (default: standard 3x3 blocks)."""
+    if layout is None:
+        layout = get_block_layout()
+    engine = _engines.get(layout.key)
+    if engine is None:
+        engine = SearchEngine(layout)
+        _engines[layout.key] = engine
+        if len(_engines) > MAX_ENGINES:
+            _engines.popitem(last=False)
+    _engines.move_to_end(layout.key)
+    return engine
@@ -0,0 +1,137 @@
+# solution_cache.py
+
+# in-process LRU cache of solved puzzles
+# - raw entries: the exact puzzle (layout key + 81 cell bytes) -> its solution, a repeated puzzle
+#   is answered with a dict lookup (microseconds)
+# - canonical entries: canonical hash -> solution of the canonical form (see canonical.py),
+#   a symmetric copy of a cached puzzle is answered by mapping the canonical solution back
+#   through the transform of the copy (standard 3x3 block layout only)
+# - the cache holds at most maxEntries entries and/or maxBytes bytes, the least recently used
+#   entries are evicted first
+# - the solvers of the Sudoku class use the cache after Sudoku.setSolutionCache(cache),
+#   batch.solve_batch takes a cache as argument, runner.run_batch(cacheEntries) uses one cache per process
+#   (raw keys only, symmetric copies with run_batch(cacheCanonical=True))
+# - a canonical lookup costs a canonicalization per miss (about 15 ms, several times the solve time
+#   of an easy puzzle), SolutionCache(canonical=False) is faster for input without symmetric copies
+
+# Werner Schoegler, 29-Nov-2025
+
+# pylint: disable=invalid-name
+
+from collections import OrderedDict
+
+import numpy as np
+
+from canonical import canonicalize, grid_hash
+
+STANDARD_LAYOUT = "block_norm_index_"
+# estimated memory of one entry on top of its key and solution bytes (dict slot, tuple, bytes headers)
+ENTRY_OVERHEAD_BYTES = 150
+
+
+class SolutionCache:
+    """LRU cache puzzle -> solution with raw and canonical keys and hit/miss counters.
+    The layout argument of get/put is the key of the block layout (BlockLayout.key: its name,
+    or its block definition for unnamed layouts)."""
+
+    def __init__(self, maxEntries: int | None = 100000, maxBytes: int | None = None, canonical: bool = True):
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.canonical = canonical   # also look up symmetric copies (costs a canonicalization per miss)
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lastCanonical = None   # (raw key, canonical key, transform) of the last canonical lookup
+        self.clearStats()
+
+    def clearStats(self) -> None:
+        self.rawHits = 0
+        self.canonicalHits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def clear(self) -> None:
+        """Remove all entries (the counters are kept)."""
+        self._entries.clear()
+        self._bytes = 0
+        self._lastCanonical = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def stats(self) -> dict:
+        """Hit/miss counters and size of the cache."""
+        lookups = self.rawHits + self.canonicalHits + self.misses
+        return {
+            "hits": self.rawHits + self.canonicalHits,
+            "rawHits": self.rawHits,
+            "canonicalHits": self.canonicalHits,
+            "misses": self.misses,
+            "hitRate": (self.rawHits + self.canonicalHits) / lookups if lookups > 0 else 0.0,
+            "evictions": self.evictions,
+            "entries": len(self._entries),
+            "bytes": self._bytes,
+        }
+
+    @staticmethod
+    def _rawKey(grid: np.ndarray, layout: str) -> tuple[str, bytes]:
+        return ("raw:" + layout, np.asarray(grid, dtype=np.uint8).tobytes())
+
+    def _canonicalKey(self, grid: np.ndarray, rawKey: tuple[str, bytes]):
+        """Canonical key and transform of a grid, the result of the last call is reused (get + put)."""
+        if self._lastCanonical is None or self._lastCanonical[0] != rawKey:
+            canonicalGrid, transform = canonicalize(grid)
+            self._lastCanonical = (rawKey, ("canonical", grid_hash(canonicalGrid)), transform)
+        return self._lastCanonical[1], self._lastCanonical[2]
+
+    def _useCanonical(self, layout: str) -> bool:
+        return self.canonical and layout == STANDARD_LAYOUT
+
+    def get(self, grid: np.ndarray, layout: str = STANDARD_LAYOUT) -> np.ndarray | None:
+        """Return the cached 9x9 solution of a puzzle or None."""
+        rawKey = self._rawKey(grid, layout)
+        value = self._entries.get(rawKey)
+        if value is not None:
+            self._entries.move_to_end(rawKey)
+            self.rawHits += 1
+            return np.frombuffer(value, dtype=np.uint8).astype(int).reshape(9, 9)
+        if self._useCanonical(layout):
+            key, transform = self._canonicalKey(grid, rawKey)
+            value = self._entries.get(key)
+            if value is not None:
+                self._entries.move_to_end(key)
+                self.canonicalHits += 1
+                solution = transform.invert(np.frombuffer(value, dtype=np.uint8).reshape(9, 9))
+                self._store(rawKey, solution)  # the next lookup of this puzzle is a raw hit
+                return solution
+        self.misses += 1
+        return None
+
+    def put(self, grid: np.ndarray, solution: np.ndarray, layout: str = STANDARD_LAYOUT) -> None:
+        """Store the solution of a puzzle."""
+        rawKey = self._rawKey(grid, layout)
+        self._store(rawKey, solution)
+        if self._useCanonical(layout):
+            key, transform = self._canonicalKey(grid, rawKey)
+            self._store(key, transform.apply(np.asarray(solution)))
+
+    def _store(self, key, solution: np.ndarray) -> None:
+        value = np.asarray(solution, dtype=np.uint8).tobytes()
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= self._entrySize(key, old)
+        self._entries[key] = value
+        self._bytes += self._entrySize(key, value)
+        self._evict()
+
+    @staticmethod
+    def _entrySize(key, value: bytes) -> int:
+        return len(key[0]) + len(key[1]) + len(value) + ENTRY_OVERHEAD_BYTES
+
+    def _evict(self) -> None:
+        """Remove the least recently used entries until the cache is within its budget."""
+        while len(self._entries) > 0 and (
+                (self.maxEntries is not None and len(self._entries) > self.maxEntries)
+                or (self.maxBytes is not None and self._bytes > self.maxBytes)):
+            key, value = self._entries.popitem(last=False)
+            self._bytes -= self._entrySize(key, value)
+            self.evictions += 1
@@ -0,0 +1,200 @@
+# solution_store.py
+
+# persistent solution store (SQLite) shared by runs and processes
+# - table solutions: canonical puzzle hash (see canonical.py) -> solution of the canonical form,
+#   rating, solve time and technique trace (rating and trace as JSON)
+# - table aliases: raw puzzle hash -> canonical hash and the solution of the raw puzzle,
+#   so a known puzzle needs no canonicalization, a symmetric copy of a known puzzle is found
+#   by its canonical hash and the canonical solution is mapped back through its transform
+# - puzzles of other block layouts are keyed by layout name and raw hash (no canonical form)
+# - the canonical keys of looked up puzzles are kept for their put() in an LRU memo of at most
+#   maxCanonical entries (an evicted puzzle is canonicalized again by put())
+# - new entries are written in batches (one transaction per batchSize puzzles, flush/close writes the rest)
+# - the database runs in WAL mode: readers in other processes are not blocked by a writer,
+#   writers of parallel runs wait for each other (timeout)
+
+# Werner Schoegler, 30-Nov-2025
+
+# pylint: disable=invalid-name
+
+import json
+import sqlite3
+import time
+from collections import OrderedDict
+
+import numpy as np
+
+from canonical import Transform, canonicalize_batch, grid_hash, puzzle_hash
+from util.string2array import string2array
+
+STANDARD_LAYOUT = "block_norm_index_"
+# number of hashes per SELECT ... IN (...) query (below the SQLite limit of bound variables)
+QUERY_CHUNK_SIZE = 500
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS solutions (
+    hash TEXT PRIMARY KEY,
+    solution TEXT NOT NULL,
+    rating TEXT,
+    time REAL,
+    trace TEXT,
+    created REAL
+);
+CREATE TABLE IF NOT EXISTS aliases (
+    raw_hash TEXT PRIMARY KEY,
+    hash TEXT NOT NULL,
+    solution TEXT NOT NULL
+);
+"""
+
+
+def grid_to_string(grid: np.ndarray) -> str:
+    """81 character string of a 9x9 grid ('0': empty cell)."""
+    return "".join(map(str, np.asarray(grid).reshape(81).tolist()))
+
+
+class SolutionStore:
+    """SQLite store puzzle -> solution, rating, time and trace, keyed by canonical puzzle hash."""
+
+    def __init__(self, fileName: str, batchSize: int = 100, timeout: float = 30.0, maxCanonical: int = 10000):
+        self.fileName = fileName
+        self.batchSize = batchSize
+        self.maxCanonical = maxCanonical
+        self.connection = sqlite3.connect(fileName, timeout=timeout)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        self.connection.commit()
+        self._pendingSolutions = []
+        self._pendingAliases = []
+        self._canonical = OrderedDict()  # raw key -> (canonical key, transform) of looked up puzzles, used by put()
+
+    def __enter__(self) -> "SolutionStore":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        self.flush()
+        return self.connection.execute("SELECT COUNT(*) FROM solutions").fetchone()[0]
+
+    @staticmethod
+    def _rawKey(grid_str: str, layout: str) -> str:
+        rawKey = puzzle_hash(grid_str)
+        return rawKey if layout == STANDARD_LAYOUT else f"{layout}:{rawKey}"
+
+    def _select(self, query: str, keys: list[str]) -> list[tuple]:
+        rows = []
+        for start in range(0, len(keys), QUERY_CHUNK_SIZE):
+            chunk = keys[start:start + QUERY_CHUNK_SIZE]
+            rows.extend(self.connection.execute(query.format(",".join("?" * len(chunk))), chunk).fetchall())
+        return rows
+
+    @staticmethod
+    def _entry(solution: str, rating: str | None, solveTime: float | None, trace: str | None) -> dict:
+        return {
+            "solution": solution,
+            "rating": json.loads(rating) if rating is not None else None,
+            "time": solveTime,
+            "trace": json.loads(trace) if trace is not None else None,
+        }
+
+    def getMany(self, puzzles: list[str], layout: str = STANDARD_LAYOUT) -> list[dict | None]:
+        """Look up many puzzle strings at once, returns per puzzle None or a dict with
+        solution (81 character string), rating, time and trace.
+        Only the puzzles without raw hash alias are canonicalized (in one batch)."""
+        self.flush()
+        rawKeys = [self._rawKey(grid_str, layout) for grid_str in puzzles]
+        results = [None] * len(puzzles)
+        if layout != STANDARD_LAYOUT:
+            rows = {row[0]: row[1:] for row in self._select(
+                "SELECT hash, solution, rating, time, trace FROM solutions WHERE hash IN ({})", rawKeys)}
+            for i, rawKey in enumerate(rawKeys):
+                if rawKey in rows:
+                    results[i] = self._entry(*rows[rawKey])
+            return results
+        rows = {row[0]: row[1:] for row in self._select(
+            "SELECT a.raw_hash, a.solution, s.rating, s.time, s.trace FROM aliases a "
+            "JOIN solutions s ON s.hash = a.hash WHERE a.raw_hash IN ({})", rawKeys)}
+        canonicalKeys = {}  # puzzle index -> (canonical key, transform) of the puzzles without alias
+        unknown = []
+        for i, rawKey in enumerate(rawKeys):
+            if rawKey in rows:
+                results[i] = self._entry(*rows[rawKey])
+            elif rawKey in self._canonical:
+                canonicalKeys[i] = self._canonical[rawKey]
+            else:
+                unknown.append(i)
+        if len(unknown) > 0:
+            canonical, transforms = canonicalize_batch([puzzles[i] for i in unknown])
+            for i, grid, transform in zip(unknown, canonical, transforms):
+                canonicalKeys[i] = (grid_hash(grid), transform)
+        rows = {row[0]: row[1:] for row in self._select(
+            "SELECT hash, solution, rating, time, trace FROM solutions WHERE hash IN ({})",
+            list({key for key, _ in canonicalKeys.values()}))}
+        for i, (key, transform) in canonicalKeys.items():
+            if key in rows:
+                # symmetric copy of a stored puzzle: map the canonical solution back, add the raw alias
+                solution = grid_to_string(transform.invert(string2array(rows[key][0])))
+                results[i] = self._entry(solution, *rows[key][1:])
+                self._pendingAliases.append((rawKeys[i], key, solution))
+                self._canonical.pop(rawKeys[i], None)
+            else:
+                self._remember(rawKeys[i], key, transform)
+        return results
+
+    def _remember(self, rawKey: str, key: str, transform: Transform) -> None:
+        """Keep the canonical key of an unknown puzzle for its put(), the least recently
+        looked up puzzles are dropped beyond maxCanonical entries."""
+        self._canonical[rawKey] = (key, transform)
+        self._canonical.move_to_end(rawKey)
+        while len(self._canonical) > self.maxCanonical:
+            self._canonical.popitem(last=False)
+
+    def get(self, grid_str: str, layout: str = STANDARD_LAYOUT) -> dict | None:
+        """Look up one puzzle string, see getMany()."""
+        return self.getMany([grid_str], layout)[0]
+
+    def put(self, grid_str: str, solution: np.ndarray | str, rating: dict | None = None,
+            solveTime: float | None = None, trace=None, layout: str = STANDARD_LAYOUT) -> None:
+        """Add the solution of a puzzle (written with the next batch), the given rating, time and trace
+        replace the ones of an existing entry (None keeps the stored value)."""
+        if not isinstance(solution, str):
+            solution = grid_to_string(solution)
+        rawKey = self._rawKey(grid_str, layout)
+        values = (json.dumps(rating) if rating is not None else None, solveTime,
+                  json.dumps(trace) if trace is not None else None, time.time())
+        if layout != STANDARD_LAYOUT:
+            self._pendingSolutions.append((rawKey, solution) + values)
+        else:
+            if rawKey not in self._canonical:
+                canonical, transforms = canonicalize_batch([grid_str])
+                self._canonical[rawKey] = (grid_hash(canonical[0]), transforms[0])
+            key, transform = self._canonical.pop(rawKey)
+            canonicalSolution = grid_to_string(transform.apply(string2array(solution)))
+            self._pendingSolutions.append((key, canonicalSolution) + values)
+            self._pendingAliases.append((rawKey, key, solution))
+        if len(self._pendingSolutions) >= self.batchSize:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write the pending entries in one transaction."""
+        if len(self._pendingSolutions) == 0 and len(self._pendingAliases) == 0:
+            return
+        with self.connection:
+            self.connection.executemany(
+                "INSERT INTO solutions (hash, solution, rating, time, trace, created) VALUES (?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(hash) DO UPDATE SET rating = COALESCE(excluded.rating, rating), "
+                "time = COALESCE(excluded.time, time), trace = COALESCE(excluded.trace, trace)",
+                self._pendingSolutions)
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO aliases (raw_hash, hash, solution) VALUES (?, ?, ?)", self._pendingAliases)
+        self._pendingSolutions = []
+        self._pendingAliases = []
+
+    def close(self) -> None:
+        """Write the pending entries and close the database."""
+        if self.connection is not None:
+            self.flush()
+            self.connection.close()
+            self.connection = None
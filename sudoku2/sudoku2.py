@@ -13,72 +13,163 @@
 # - finds and solves single candidates
 # - checks if the Sudoku is completely solved
 # - basic framework for further solving techniques
+# - bitmask candidate engine: used digits of every row, column and block are kept
+#   as 9-bit masks that are updated incrementally by setValue/setGrid
+# - exact cover solver (dancing links, see dlx.py)
+# - jiggsaw support: all solvers work on a compiled block layout (see block.py),
+#   the standard 3x3 blocks are just the default layout
+# - backtracking runs on the iterative search engine (see search.py)
+# - opt-in statistics (enableStats/stats): the solve methods are wrapped per instance only
+#   while stats are enabled, so there is no cost when they are disabled
+# - optional solution cache (setSolutionCache, see solution_cache.py) in front of the full solvers
+# - persistent candidate eliminations (eliminated masks per cell, reset by setGrid), used by
+#   naked and hidden subsets (pairs, triples, quads) found with popcount and subset mask tables
+# - locked candidates (pointing pairs, box-line reduction) on per-digit 81-bit candidate bitboards
+# - fish (X-Wing, Swordfish, Jellyfish) on the same bitboards: row/column occurrence masks per digit
+#   and enumeration of row/column sets with the subset mask tables
 
 # Werner Schoegler, 11-Nov-2025
 
 # pylint: disable=invalid-name
 
+import time
+import functools
 import numpy as np
 from io import StringIO  
 from collections import Counter
-from block import get_block_indices
+from block import get_block_layout, BlockLayout
+from dlx import solve_exact_cover
+from solution_cache import SolutionCache
+
+# bit (value-1) of a mask is set if the value is used, so 0x1FF means all values 1-9 are used
+# MASK_VALUES and MASK_POPCOUNT: precomputed sorted list of values and number of values for each 9-bit mask
+from search import ALL_VALUES_MASK, MASK_VALUES, MASK_POPCOUNT, get_search_engine
+# all 9-bit masks with 2, 3 and 4 bits set: value sets (naked subsets) or house positions (hidden subsets)
+SUBSET_MASKS = {size: [mask for mask in range(512) if MASK_POPCOUNT[mask] == size] for size in range(2, 5)}
+# 9-bit set of rows/columns -> 81-bit mask of their cells (bit row*9+col)
+ROW_SET_BITS = [sum(ALL_VALUES_MASK << (9 * (line - 1)) for line in MASK_VALUES[mask]) for mask in range(512)]
+COLUMN_SET_BITS = [sum(1 << (9 * row + line - 1) for row in range(9) for line in MASK_VALUES[mask]) for mask in range(512)]
+# fish names by size
+FISH_NAMES = {2: "X-Wing", 3: "Swordfish", 4: "Jellyfish"}
+
+# solve methods that feed the statistics (wrapped per instance while stats are enabled)
+STATS_METHODS = ["solver1", "solveSingles", "solveHiddenSingles", "solveLockedCandidates", "solveNakedSubsets",
+                 "solveHiddenSubsets", "solveFish", "solveBacktrack", "solveBacktrackOptimized", "countSolutions",
+                 "solveExactCover"]
+# methods whose calls are recorded as single passes, and methods that run the search engine
+STATS_PASS_METHODS = ("solveSingles", "solveHiddenSingles")
+STATS_SEARCH_METHODS = ("solveBacktrack", "solveBacktrackOptimized", "countSolutions")
+
+def _cachedSolve(method):
+    """Decorator for the full solve methods: answer from the solution cache (if set) and
+    store new solutions in it."""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        cache = self._solutionCache
+        if cache is None:
+            return method(self, *args, **kwargs)
+        solution = cache.get(self.grid, self.layout.key)
+        if solution is not None:
+            self.grid[:, :] = solution
+            self.setGrid(self.grid)
+            return True
+        puzzle = self.grid.copy()
+        if method(self, *args, **kwargs):
+            cache.put(puzzle, self.grid, self.layout.key)
+            return True
+        return False
+    return wrapper
+
+def _find_subsets(masks: list[int], size: int):
+    """Yield (subset, members) for all subset masks of the given size that contain exactly size
+    of the non-empty masks (members: bit i is set for masks[i]). The masks are read while iterating,
+    so the caller can apply eliminations in between."""
+    union = 0
+    for mask in masks:
+        union |= mask
+    for subset in SUBSET_MASKS[size]:
+        if subset & ~union:
+            continue
+        members = 0
+        count = 0
+        for i, mask in enumerate(masks):
+            if mask and not mask & ~subset:
+                members |= 1 << i
+                count += 1
+        if count == size:
+            yield subset, members
 
 class Sudoku:
-    def __init__(self, grid: np.ndarray):
-        self.grid = grid
+    def __init__(self, grid: np.ndarray, layout: str | BlockLayout = "block_norm_index_"):
         self.debugLevel = 0  # global debug level for printing debug information
+        self._stats = None   # statistics, see enableStats()
+        self._solutionCache = None  # see setSolutionCache()
+        self.setLayout(layout)
+        self.setGrid(grid)
+
+    def setLayout(self, layout: str | BlockLayout) -> None:
+        """Set the block layout, either by name (see block.BLOCK_LAYOUTS) or as compiled BlockLayout."""
+        self.layout = get_block_layout(layout) if isinstance(layout, str) else layout
+        # python copy of the cell->block table, faster than numpy indexing in the solver loops
+        self._cellBlock = self.layout.cellBlock.tolist()
+        if hasattr(self, "grid"):
+            self.setGrid(self.grid)
 
     def count_empty_cells(self) -> int:
         return np.sum(self.grid == 0)
 
     def isValid(self) -> bool:
-        """Check if the current Sudoku grid is valid."""
-        for i in range(9):
-            if not self._is_valid_unit(self.grid[i, :]):  # Check rows
-                return False
-            if not self._is_valid_unit(self.grid[:, i]):  # Check columns
-                return False
-            if not self._is_valid_unit(self.grid[3*(i//3):3*(i//3)+3, 3*(i%3):3*(i%3)+3].flatten()):  # Check boxes
-                return False
-        return True
-    def _is_valid_unit(self, unit: np.ndarray) -> bool:
-        """Check if a row, column, or box contains no duplicates (ignoring zeros)."""
-        unit = unit[unit != 0]  # Remove zeros
-        return len(unit) == len(set(unit))
-    
-    def _getRowColFromBlockNumber(self, blockNumber: int) -> tuple[int, int]:
-        """Get the starting row and column for a given block number."""
-        block_row = (blockNumber // 3) * 3
-        block_col = (blockNumber % 3) * 3
-        return block_row, block_col
+        """Check if the current Sudoku grid is valid (no value twice in a row, column or block, zeros ignored)."""
+        return bool(np.all(self.layout.houseCounts(self.grid)[0, :, 1:] <= 1))
+
+    def findContradiction(self) -> str | None:
+        """Find a state that can not be solved any more: a value used twice in a house, an empty cell
+        without candidates or a value with no place left in a row, column or block.
+        Returns a description of the first contradiction found (None if there is none)."""
+        if not self.isValid():
+            return "value used twice in a house"
+        return self._findEmptyCandidates()
+
+    def _findEmptyCandidates(self) -> str | None:
+        """Find an empty cell without candidates or a value with no place left in a row, column or block
+        (a value is placed in a house or a candidate of one of its empty cells), see findContradiction()."""
+        rowCover = list(self.rowMask)
+        colCover = list(self.colMask)
+        blockCover = list(self.blockMask)
+        for cell, value in enumerate(self.grid.reshape(81).tolist()):
+            if value == 0:
+                row, col = divmod(cell, 9)
+                mask = self._getCandidateMask(row, col)
+                if mask == 0:
+                    return f"no candidate left at position {row, col}"
+                rowCover[row] |= mask
+                colCover[col] |= mask
+                blockCover[self._cellBlock[row][col]] |= mask
+        for houseName, covers in (("row", rowCover), ("column", colCover), ("block", blockCover)):
+            for i, cover in enumerate(covers):
+                if cover != ALL_VALUES_MASK:
+                    return f"no place left for value {MASK_VALUES[ALL_VALUES_MASK & ~cover][0]} in {houseName} {i}"
+        return None
     
     def getBlockNumber(self, row: int, col: int) -> int:
         """Get the block number (0-8) for a given cell."""
-        return (row // 3) * 3 + (col // 3)
+        return self._cellBlock[row][col]
     
     def getBlockNumberJiggsaw(self, row: int, col: int) -> int:
         """Get the block number (0-8) for a given cell with jiggsaw support."""
-        # TODO: performance: this can be optimized with a precomputed mapping
-        for blockNumber in range(9):
-            block_indices = get_block_indices(blockNumber, "block_norm_index_")
-            if (row, col) in block_indices:
-                return blockNumber
-        raise ValueError(f"Cell ({row}, {col}) not found in any block.")
+        return self._cellBlock[row][col]
     
     def getBlock(self, row: int, col: int) -> np.ndarray:
-        """Get the 3x3 block for a given cell."""
-        block_row = (row // 3) * 3
-        block_col = (col // 3) * 3
-        return self.grid[block_row:block_row+3, block_col:block_col+3].flatten()
+        """Get the block for a given cell (3x3 block for the standard layout)."""
+        return self.grid.take(self.layout.blockCells[self._cellBlock[row][col]])
     
     def getBlockJiggsaw(self, row: int, col: int) -> np.ndarray:
         """Get the 3x3 block for a given cell with jiggsaw support."""
-        block_number = self.getBlockNumberJiggsaw(row, col)
-        block_indices = get_block_indices(block_number, "block_norm_index_")
-        block_values = []
-        for r, c in block_indices:
-            block_values.append(self.grid[r, c])
-        return np.array(block_values)
+        return self.getBlock(row, col)
+
+    def _getBlockCells(self, blockNumber: int) -> list[tuple[int, int]]:
+        """Get the (row, col) cells of a block."""
+        return [divmod(cell, 9) for cell in self.layout.blockCells[blockNumber].tolist()]
     
     def getRow(self, row: int) -> np.ndarray:
         """Get a specific row."""
@@ -92,69 +183,55 @@ class Sudoku:
         """Get possible candidate values for a specific cell."""
         if self.grid[row, col] != 0:
             return []  # Cell is already filled
-        # a set has the property of unique values only, so we can use it to find used values
-        used_values = set(self.getRow(row)) | set(self.getCol(col)) | set(self.getBlock(row, col))
-        return [val for val in range(1, 10) if val not in used_values]
+        return list(MASK_VALUES[self._getCandidateMask(row, col)])
+
+    def _getCandidateMask(self, row: int, col: int) -> int:
+        """Get the candidates of a cell as 9-bit mask (values not used in row, column and block)."""
+        used = self.rowMask[row] | self.colMask[col] | self.blockMask[self._cellBlock[row][col]]
+        return ~(used | self.eliminated[row * 9 + col]) & ALL_VALUES_MASK
+
+    def _getCandidatesInCells(self, cells) -> np.ndarray:
+        """Get the sorted candidates of all empty cells in a list of (row, col) cells."""
+        candidates = []
+        for row, col in cells:
+            if self.grid[row, col] == 0:
+                candidates.extend(MASK_VALUES[self._getCandidateMask(row, col)])
+        return np.sort(np.array(candidates, dtype=int))
     
     def getCandidatesInRow(self, row: int) -> list[int]:
         """Get candidates for all empty cells in a specific row."""
-        candidates = np.array([], dtype=int)
-        for col in range(9):
-            if self.grid[row, col] == 0:
-                candidates = np.append(candidates, self.getCandidates(row, col))
-        return np.sort(candidates)
+        return self._getCandidatesInCells([(row, col) for col in range(9)])
     
     def findFirstCandidateInRow(self, row: int, candidate: int) -> tuple[int, int, int] | None:
         """Find the first occurrence of a specific candidate in a row."""
         for col in range(9):
             if self.grid[row, col] == 0:
-                candidates = self.getCandidates(row, col)
-                if candidate in candidates:
+                if self._getCandidateMask(row, col) & (1 << (int(candidate) - 1)):
                     return (row, col, int(candidate))
         return None
 
     def getCandidatesInCol(self, col: int) -> list[int]:
         """Get candidates for all empty cells in a specific column."""
-        candidates = np.array([], dtype=int)
-        for row in range(9):
-            if self.grid[row, col] == 0:
-                candidates = np.append(candidates, self.getCandidates(row, col))
-        return np.sort(candidates)
+        return self._getCandidatesInCells([(row, col) for row in range(9)])
     
     def findFirstCandidateInCol(self, col: int, candidate: int)  -> tuple[int, int, int] | None:
         """Find the first occurrence of a specific candidate in a column."""
         for row in range(9):
             if self.grid[row, col] == 0:
-                candidates = self.getCandidates(row, col)
-                if candidate in candidates:
+                if self._getCandidateMask(row, col) & (1 << (int(candidate) - 1)):
                     return (row, col, int(candidate))
         return None
     
     def getCandidatesInBlock(self, blockNumber: int)  -> list[int]:
         """Get candidates for all empty cells in a specific block."""
-        candidates = np.array([], dtype=int)
-        block_row = (blockNumber // 3) * 3
-        block_col = (blockNumber % 3) * 3
-        for i in range(3):
-            for j in range(3):
-                row = block_row + i
-                col = block_col + j
-                if self.grid[row, col] == 0:
-                    candidates = np.append(candidates, self.getCandidates(row, col))
-        return np.sort(candidates)
+        return self._getCandidatesInCells(self._getBlockCells(blockNumber))
     
     def findFirstCandidateInBlock(self, blockNumber: int, candidate: int) -> tuple[int, int, int] | None:
         """Find the first occurrence of a specific candidate in a block."""
-        block_row = (blockNumber // 3) * 3
-        block_col = (blockNumber % 3) * 3
-        for i in range(3):
-            for j in range(3):
-                row = block_row + i
-                col = block_col + j
-                if self.grid[row, col] == 0:
-                    candidates = self.getCandidates(row, col)
-                    if candidate in candidates:
-                        return (row, col, int(candidate))
+        for row, col in self._getBlockCells(blockNumber):
+            if self.grid[row, col] == 0:
+                if self._getCandidateMask(row, col) & (1 << (int(candidate) - 1)):
+                    return (row, col, int(candidate))
         return None
     
     def findHiddenSingle(self, candidates: list[int]) -> int | None:
@@ -169,21 +246,68 @@ class Sudoku:
         """Set a value in the Sudoku grid."""
         if self.debugLevel >= 1:
             print(f"    {description} set at position: {row, col}: {value}")
+        oldValue = int(self.grid[row, col])
         self.grid[row, col] = value
+        if oldValue != 0:
+            # the old value may still be used by another cell of an (invalid) house, so rebuild the masks,
+            # the eliminations were derived from the old value and are dropped
+            self.eliminated = [0] * 81
+            block = self._cellBlock[row][col]
+            self.rowMask[row] = self._unitMask(self.getRow(row))
+            self.colMask[col] = self._unitMask(self.getCol(col))
+            self.blockMask[block] = self._unitMask(self.getBlock(row, col))
+        elif value != 0:
+            self._placeBits(row, col, value)
 
     def setGrid(self, grid: np.ndarray) -> None:
         """Set the entire Sudoku grid."""
         self.grid = grid
+        self.rowMask = [self._unitMask(self.getRow(i)) for i in range(9)]
+        self.colMask = [self._unitMask(self.getCol(i)) for i in range(9)]
+        self.blockMask = [self._unitMask(grid.take(cells)) for cells in self.layout.blockCells]
+        # candidates removed by the subset techniques (9-bit mask per flat cell index)
+        self.eliminated = [0] * 81
+        # contradiction found by the last solver1 run (None: no contradiction)
+        self.contradiction = None
+
+    @staticmethod
+    def _unitMask(unit: np.ndarray) -> int:
+        """Get the 9-bit mask of all values used in a row, column or block."""
+        mask = 0
+        for value in unit.tolist():
+            if value != 0:
+                mask |= 1 << (value - 1)
+        return mask
+
+    def _placeBits(self, row: int, col: int, value: int) -> None:
+        """Mark value as used in the row, column and block masks of a cell."""
+        bit = 1 << (value - 1)
+        self.rowMask[row] |= bit
+        self.colMask[col] |= bit
+        self.blockMask[self._cellBlock[row][col]] |= bit
 
     def __str__(self) -> str:
-        """Print the Sudoku grid in a nicely readable format."""
+        """Print the Sudoku grid in a nicely readable format, the block borders are taken from the
+        block layout ('|' between cells of different blocks, '-' below a cell of another block)."""
+        cellBlock = self.layout.cellBlock
+        vertical = cellBlock[:, 1:] != cellBlock[:, :-1]     # (row, col - 1): border left of the cell
+        horizontal = cellBlock[1:, :] != cellBlock[:-1, :]   # (row - 1, col): border above the cell
+        # columns with a border in any row get a separator slot, so that all rows stay aligned
+        slots = [col for col in range(1, 9) if vertical[:, col - 1].any()]
         buf = StringIO()
         for row in range(9):
-            if row % 3 == 0 and row != 0:
-                buf.write("-" * 21 + "\n")
+            if row != 0 and horizontal[row - 1].any():
+                border = horizontal[row - 1]
+                line = ""
+                for col in range(9):
+                    if col in slots:
+                        line += "--" if border[col - 1] or border[col] else "  "
+                    line += "-" if border[col] else " "
+                    line += "-" if border[col] and col < 8 and (border[col + 1] or col + 1 in slots) else " "
+                buf.write(line.rstrip() + "\n")
             for col in range(9):
-                if col % 3 == 0 and col != 0:
-                    buf.write("| ")
+                if col in slots:
+                    buf.write("| " if vertical[row, col - 1] else "  ")
                 buf.write(str(self.grid[row, col]) if self.grid[row, col] != 0 else ".")
                 buf.write(" ")
             buf.write("\n")
@@ -208,23 +332,45 @@ class Sudoku:
                         singles.append((row, col, candidates[0]))
         return singles
     
-    def solver1(self, enableHiddenSingles: bool = True) -> bool:
-        # Simple solver that repeatedly applies hidden singles and singles until no more can be found
+    @_cachedSolve
+    def solver1(self, enableHiddenSingles: bool = True, enableSubsets: bool = False,
+                enableLockedCandidates: bool = False, enableFish: bool = False) -> bool:
+        # Simple solver that repeatedly applies hidden singles and singles until no more can be found,
+        # if no (hidden) single is found the enabled elimination techniques are tried
+        # (locked candidates first, then naked and hidden subsets, then fish)
         if self.debugLevel >= 1:
             print("="*10 + f" solver1 started")
+        # a contradiction stops the solver at once (self.contradiction describes it, see findContradiction),
+        # the placed values are checked once: the techniques only place candidates
+        self.contradiction = "value used twice in a house" if not self.isValid() else None
         foundHiddenSingles = False
         foundSingles = True
+        foundSubsets = False
         i = 0
-        while foundHiddenSingles or foundSingles:
+        while foundHiddenSingles or foundSingles or foundSubsets:
             i += 1
             if self.debugLevel >= 1:
                 print("="*10 + f" solver1 iteration {i}")
+            if self.contradiction is None:
+                self.contradiction = self._findEmptyCandidates()
+            if self.contradiction is not None:
+                if self.debugLevel >= 1:
+                    print("="*10 + f" solver1 finished: contradiction, {self.contradiction}")
+                return False
             foundSingles = self.solveSingles()
             # search for hidden singles only if no singles were found
             if not foundSingles and enableHiddenSingles:
                 foundHiddenSingles = self.solveHiddenSingles()
             else:
                 foundHiddenSingles = False
+            foundSubsets = False
+            if not foundSingles and not foundHiddenSingles:
+                if enableLockedCandidates:
+                    foundSubsets = self.solveLockedCandidates()
+                if not foundSubsets and enableSubsets:
+                    foundSubsets = self.solveNakedSubsets() or self.solveHiddenSubsets()
+                if not foundSubsets and enableFish:
+                    foundSubsets = self.solveFish()
         if self.isSolved():
             if self.debugLevel >= 1:
                 print("="*10 + f" solver1 finished: Sudoku is solved")
@@ -243,7 +389,9 @@ class Sudoku:
             return False
         while numOfSingles > 0:
             for row, col, value in singles:
-                self.setValue(row, col, value, description="Single candidate")
+                # a single of the same pass may have taken the value (contradiction, left to findContradiction)
+                if self._getCandidateMask(row, col) & (1 << (value - 1)):
+                    self.setValue(row, col, value, description="Single candidate")
             singles = self.findSingleCandidates()
             numOfSingles = len(singles)
         return True
@@ -285,54 +433,250 @@ class Sudoku:
                     returnValue = True
         return returnValue
 
+    def _houseCandidates(self, house: np.ndarray) -> tuple[list[int], list[int]]:
+        """Get the empty cells (flat index) of a house and their candidate masks."""
+        cells = [cell for cell in house.tolist() if self.grid.flat[cell] == 0]
+        return cells, [self._getCandidateMask(cell // 9, cell % 9) for cell in cells]
+
+    def _eliminate(self, cell: int, mask: int, description: str) -> None:
+        """Remove the candidates of a mask from an empty cell."""
+        if self.debugLevel >= 1:
+            print(f"    {description} removes {MASK_VALUES[mask]} at position: {divmod(cell, 9)}")
+        self.eliminated[cell] |= mask
+
+    def _digitBoards(self) -> list[int]:
+        """Get the candidates as 9 bitboards: bit cell of board value-1 is set if value is a candidate of cell."""
+        boards = [0] * 9
+        for cell in np.flatnonzero(self.grid == 0).tolist():
+            for value in MASK_VALUES[self._getCandidateMask(cell // 9, cell % 9)]:
+                boards[value - 1] |= 1 << cell
+        return boards
+
+    def _eliminateBits(self, bits: int, value: int, description: str) -> None:
+        """Remove a value from all cells of a bitboard."""
+        while bits:
+            low = bits & -bits
+            self._eliminate(low.bit_length() - 1, 1 << (value - 1), description)
+            bits ^= low
+
+    def solveLockedCandidates(self) -> bool:
+        """Remove candidates with locked candidates (intersection removal): if a value of a block
+        is only in one row/column of the block, it is removed from the rest of that row/column
+        (pointing), and if a value of a row/column is only in one block, it is removed from
+        the rest of that block (box-line reduction). Each check is a few ANDs of 81-bit bitboards."""
+        returnValue = False
+        houseBits = self.layout.houseBits
+        for index, board in enumerate(self._digitBoards()):
+            for block, line, inter in self.layout.intersections:
+                blockBits, lineBits = houseBits[block], houseBits[line]
+                inBlock = board & blockBits
+                inLine = board & lineBits
+                removed = 0
+                if inBlock and not inBlock & ~inter:
+                    removed |= inLine & ~blockBits
+                if inLine and not inLine & ~inter:
+                    removed |= inBlock & ~lineBits
+                if removed:
+                    self._eliminateBits(removed, index + 1, f"Locked candidate {index + 1} in houses {block}/{line}")
+                    board &= ~removed
+                    returnValue = True
+        return returnValue
+
+    def solveFish(self, maxSize: int = 4) -> bool:
+        """Remove candidates with fish (X-Wing, Swordfish, Jellyfish): if a value of size base rows
+        is only in size columns, it is removed from the other rows of these columns (and the same
+        with columns as base). Rows/columns with 2 to size occurrences of the value are combined."""
+        returnValue = False
+        for index, board in enumerate(self._digitBoards()):
+            for byRows in (True, False):
+                # occurrence masks of the value: base line -> 9-bit mask of the cover lines
+                rowOccurrences = [(board >> (9 * row)) & ALL_VALUES_MASK for row in range(9)]
+                if byRows:
+                    occurrences = rowOccurrences
+                else:
+                    occurrences = [sum(((rowOccurrences[row] >> col) & 1) << row for row in range(9)) for col in range(9)]
+                baseBits, coverBits = (ROW_SET_BITS, COLUMN_SET_BITS) if byRows else (COLUMN_SET_BITS, ROW_SET_BITS)
+                for size in range(2, maxSize + 1):
+                    eligible = 0
+                    for line, mask in enumerate(occurrences):
+                        if 2 <= MASK_POPCOUNT[mask] <= size:
+                            eligible |= 1 << line
+                    if MASK_POPCOUNT[eligible] < size:
+                        continue
+                    for baseSet in SUBSET_MASKS[size]:
+                        if baseSet & ~eligible:
+                            continue
+                        coverSet = 0
+                        for line in MASK_VALUES[baseSet]:
+                            coverSet |= occurrences[line - 1]
+                        if MASK_POPCOUNT[coverSet] != size:
+                            continue
+                        removed = board & coverBits[coverSet] & ~baseBits[baseSet]
+                        if removed:
+                            self._eliminateBits(removed, index + 1, f"{FISH_NAMES[size]} of {index + 1}")
+                            board &= ~removed
+                            returnValue = True
+        return returnValue
+
+    def solveNakedSubsets(self, maxSize: int = 4) -> bool:
+        """Remove candidates with naked subsets: if the candidates of size cells of a house
+        are size values, these values are removed from the other cells of the house (size 2-maxSize)."""
+        returnValue = False
+        for house in self.layout.houses:
+            cells, masks = self._houseCandidates(house)
+            for size in range(2, min(maxSize, len(cells) - 1) + 1):
+                for subset, members in _find_subsets(masks, size):
+                    for i, cell in enumerate(cells):
+                        if not members & (1 << i) and masks[i] & subset:
+                            self._eliminate(cell, masks[i] & subset, f"Naked subset {MASK_VALUES[subset]}")
+                            masks[i] &= ~subset
+                            returnValue = True
+        return returnValue
+
+    def solveHiddenSubsets(self, maxSize: int = 4) -> bool:
+        """Remove candidates with hidden subsets: if size values of a house can only be placed
+        in the same size cells, all other candidates are removed from these cells (size 2-maxSize)."""
+        returnValue = False
+        for house in self.layout.houses:
+            cells, masks = self._houseCandidates(house)
+            # positions of each value in the house as mask over the empty cells
+            positions = [0] * 9
+            for i, mask in enumerate(masks):
+                for value in MASK_VALUES[mask]:
+                    positions[value - 1] |= 1 << i
+            for size in range(2, min(maxSize, len(cells) - 1) + 1):
+                for subset, members in _find_subsets(positions, size):
+                    for i, cell in enumerate(cells):
+                        if subset & (1 << i) and masks[i] & ~members:
+                            removed = masks[i] & ~members
+                            self._eliminate(cell, removed, f"Hidden subset {MASK_VALUES[members]}")
+                            masks[i] &= members
+                            for value in MASK_VALUES[removed]:
+                                positions[value - 1] &= ~(1 << i)
+                            returnValue = True
+        return returnValue
+
     def isSolved(self) -> bool:
         """Check if the Sudoku is completely solved."""
         # test that there are no zeros and that it is valid
         return np.all(self.grid != 0) and self.isValid()
     
     # Basic backtracking solver (not optimized)
+    @_cachedSolve
     def solveBacktrack(self) -> bool:
-        """Solve using recursive backtracking algorithm."""
-        # Find empty cell
-        for row in range(9):
-            for col in range(9):
-                if self.grid[row, col] == 0:
-                    candidates = self.getCandidates(row, col)
-                    for value in candidates:
-                        self.grid[row, col] = value
-                        if self.solveBacktrack():  # Recursive call
-                            return True
-                        self.grid[row, col] = 0  # Backtrack
-                    return False
-        return True  # No empty cells, solved!
+        """Solve with backtracking, the empty cells are filled in row order.
+        Runs on the iterative search engine (explicit decision stack and undo trail)."""
+        return self._solveSearch(mrv=False)
     
     # Optimized backtracking that always fills the cell with the fewest candidates first
+    @_cachedSolve
     def solveBacktrackOptimized(self) -> bool:
-        """Optimized backtracking: always fill cell with fewest candidates first."""
-        # Find cell with minimum candidates
-        min_candidates = 10
-        best_cell = None
-        best_candidates = []
-        
-        for row in range(9):
-            for col in range(9):
-                if self.grid[row, col] == 0:
-                    candidates = self.getCandidates(row, col)
-                    if len(candidates) == 0:
-                        return False  # Dead end
-                    if len(candidates) < min_candidates:
-                        min_candidates = len(candidates)
-                        best_cell = (row, col)
-                        best_candidates = candidates
-        
-        if best_cell is None:
-            return True  # Solved!
-        
-        row, col = best_cell
-        for value in best_candidates:
-            self.grid[row, col] = value
-            if self.solveBacktrackOptimized():  # Still recursive but MUCH faster
-                return True
-            self.grid[row, col] = 0
-        
-        return False
+        """Optimized backtracking: always fill cell with fewest candidates first.
+        Runs on the iterative search engine (explicit decision stack and undo trail)."""
+        return self._solveSearch(mrv=True)
+
+    def _solveSearch(self, mrv: bool) -> bool:
+        """Solve with the search engine of the block layout and copy the solution into the grid.
+        The candidates eliminated by the logical techniques are not tried."""
+        engine = get_search_engine(self.layout)
+        solutions = engine.search(self.grid.reshape(81).tolist(), mrv=mrv, eliminated=self.eliminated)
+        if len(solutions) == 0:
+            return False
+        self.grid[:, :] = np.array(solutions[0]).reshape(9, 9)
+        self.setGrid(self.grid)
+        return True
+
+    # Solution counting on the search engine, the search stops as soon as limit solutions are found
+    def countSolutions(self, limit: int = 2) -> int:
+        """Return the number of solutions of the current grid, counted up to limit.
+        The grid is not changed."""
+        engine = get_search_engine(self.layout)
+        return len(engine.search(self.grid.reshape(81).tolist(), limit=limit))
+
+    def hasUniqueSolution(self) -> bool:
+        """Return True if the current grid has exactly one solution."""
+        return self.countSolutions(limit=2) == 1
+
+    # Exact cover solver: Dancing Links (Algorithm X) on the 324-column exact cover matrix
+    @_cachedSolve
+    def solveExactCover(self) -> bool:
+        """Solve with dancing links, the filled cells are used as pre-selected rows."""
+        solutions = solve_exact_cover(self.grid, layout=self.layout)
+        if len(solutions) == 0:
+            return False
+        self.grid[:, :] = solutions[0]
+        self.setGrid(self.grid)
+        return True
+
+    # Statistics: counters and timers of the solve methods, only collected while enabled
+    def enableStats(self, enable: bool = True) -> None:
+        """Enable (and reset) or disable the statistics. While enabled the solve methods and
+        getCandidates are replaced by counting wrappers on this instance, disabling removes them again."""
+        for name in STATS_METHODS + ["getCandidates", "_getCandidatesInCells"]:
+            self.__dict__.pop(name, None)
+        if not enable:
+            self._stats = None
+            return
+        self.resetStats()
+        for name in STATS_METHODS:
+            setattr(self, name, self._statsWrapper(name, getattr(Sudoku, name).__get__(self)))
+        getCandidates = Sudoku.getCandidates.__get__(self)
+        getCandidatesInCells = Sudoku._getCandidatesInCells.__get__(self)
+
+        def countingGetCandidates(row: int, col: int) -> list[int]:
+            self._stats["getCandidates"] += 1
+            return getCandidates(row, col)
+
+        def countingGetCandidatesInCells(cells) -> np.ndarray:
+            self._stats["getCandidatesInHouse"] += 1
+            return getCandidatesInCells(cells)
+        self.getCandidates = countingGetCandidates
+        self._getCandidatesInCells = countingGetCandidatesInCells
+
+    def resetStats(self) -> None:
+        """Clear all counters and timers (e.g. before the next puzzle)."""
+        self._stats = {"getCandidates": 0, "getCandidatesInHouse": 0, "nodes": 0, "methods": {}, "passes": []}
+
+    def stats(self) -> dict | None:
+        """Return a copy of the statistics (None if disabled):
+        getCandidates/getCandidatesInHouse: number of candidate lookups, nodes: search engine guesses,
+        methods: calls, progress (calls returning True), placed values and time [s] per solve method,
+        passes: technique, placed values and time [s] of each singles / hidden singles pass."""
+        stats = self._stats
+        if stats is None:
+            return None
+        result = dict(stats)
+        result["methods"] = {name: dict(entry) for name, entry in stats["methods"].items()}
+        result["passes"] = [dict(entry) for entry in stats["passes"]]
+        return result
+
+    def _statsWrapper(self, name: str, method):
+        """Return a wrapper of a bound solve method that records calls, placed values and time."""
+        def wrapper(*args, **kwargs):
+            stats = self._stats
+            emptyCells = int(self.count_empty_cells())
+            if name in STATS_SEARCH_METHODS:
+                # a cache hit runs no search: start from zero so stale nodes of an earlier search are not counted
+                engine = get_search_engine(self.layout)
+                engine.nodes = 0
+            start_time = time.perf_counter()
+            result = method(*args, **kwargs)
+            elapsed = time.perf_counter() - start_time
+            placed = emptyCells - int(self.count_empty_cells())
+            entry = stats["methods"].setdefault(name, {"calls": 0, "progress": 0, "placed": 0, "time": 0.0})
+            entry["calls"] += 1
+            entry["progress"] += int(bool(result))
+            entry["placed"] += placed
+            entry["time"] += elapsed
+            if name in STATS_PASS_METHODS:
+                stats["passes"].append({"technique": name, "placed": placed, "time": elapsed})
+            if name in STATS_SEARCH_METHODS:
+                stats["nodes"] += engine.nodes
+            return result
+        return wrapper
+
+    # Solution cache: shared by the full solvers (solver1, backtracking, exact cover)
+    def setSolutionCache(self, cache: SolutionCache | None) -> None:
+        """Set the solution cache used by the full solvers (None: no cache).
+        A cache can be shared by many Sudoku instances."""
+        self._solutionCache = cache
@@ -1,5 +1,10 @@
 # Tester.py
 
+import numpy as np
+from sudoku2 import Sudoku
+from dlx import solve_exact_cover
+
+
 class Tester:
     """Simple test framework for tracking pass/fail counts."""
     
@@ -28,3 +33,16 @@ class Tester:
         line2 = "PASS: All tests passed!" if self.fail_count == 0 else "ERROR: Some tests failed."
         return line1 + "\n" + line2
 
+
+def solver1_keeps_solution(grid: np.ndarray, **options) -> tuple[bool, bool]:
+    """Run solver1 with the given options on a copy of a puzzle with a unique solution and compare
+    with the exact cover reference solution. Returns (solved, sound): sound is True if every placed
+    value is the reference value and no eliminated candidate of an empty cell is the reference value."""
+    reference = solve_exact_cover(grid)[0]
+    sudoku = Sudoku(grid.copy())
+    solved = sudoku.solver1(**options)
+    filled = sudoku.grid != 0
+    sound = np.array_equal(sudoku.grid[filled], reference[filled]) and all(
+        not sudoku.eliminated[cell] & (1 << (reference.flat[cell] - 1)) for cell in range(81) if grid.flat[cell] == 0)
+    return solved, sound
+
@@ -0,0 +1,89 @@
+# batch_tests.py
+# Tests for the batch solver
+# Werner Schoegler, 21-Nov-2025
+
+import sys
+import os
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from sudoku2 import Sudoku
+from tester import Tester
+from batch import propagate_batch, solve_batch, solved_batch, valid_batch, candidates_batch
+from dlx import solve_exact_cover
+from block import get_block_layout
+from util.string2array import string2array, strings2array
+from data.test_data import trialSudokus1, hardTrialSudokus
+
+if __name__ == '__main__':
+    tester = Tester()
+    testSudokus = trialSudokus1 | hardTrialSudokus
+    levels = list(testSudokus.keys())
+    grids = strings2array(list(testSudokus.values()))
+
+    tester.setTestGroup("strings2array() Tests")
+    for i, level in enumerate(levels):
+        tester.test_checker(np.array_equal(grids[i], string2array(testSudokus[level])), f"strings2array equals string2array for {level}")
+
+    tester.setTestGroup("propagate_batch() Tests")
+    singles, dead = propagate_batch(grids)
+    tester.test_checker(not dead.any(), "No contradiction found in valid puzzles")
+    solvedBySingles = solved_batch(singles)
+    for i, level in enumerate(levels):
+        sudoku = Sudoku(string2array(testSudokus[level]))
+        solved = sudoku.solver1(enableHiddenSingles=True)
+        tester.test_checker(solved == solvedBySingles[i], f"Batch singles result equals solver1 for {level}")
+    # unsolvable puzzles: one wrong candidate of a hard puzzle added as clue (no rule broken by the clue itself)
+    wrong = []
+    for grid_str in list(hardTrialSudokus.values())[:10]:
+        grid = string2array(grid_str)
+        reference = solve_exact_cover(grid)[0]
+        candidates = candidates_batch(grid[None])[0]
+        for row, col in np.argwhere(grid == 0).tolist():
+            for value in (np.flatnonzero(candidates[row, col]) + 1).tolist():
+                if value != reference[row, col]:
+                    puzzle = grid.copy()
+                    puzzle[row, col] = value
+                    wrong.append(puzzle)
+    wrong = np.array(wrong)
+    results, dead = propagate_batch(wrong)
+    tester.test_checker(valid_batch(results).all(), "Conflicting singles of one pass are not placed")
+    tester.test_checker(not np.any(solved_batch(results) & ~dead), "No unsolvable puzzle is solved by singles")
+    tester.test_checker(np.all(dead | (results == 0).any(axis=(1, 2))), "Unsolvable puzzles are dead or left open")
+    noPlace = np.zeros((1, 9, 9), dtype=int)
+    noPlace[0, 1, 0] = noPlace[0, 2, 4] = noPlace[0, 4, 8] = 5  # 5 is ruled out in row 0, blocks 0 and 1 and column 8
+    noPlace[0, 0, 6], noPlace[0, 0, 7] = 1, 2
+    tester.test_checker(candidates_batch(noPlace).any(axis=3)[noPlace == 0].all(), "Every empty cell has a candidate")
+    results, dead = propagate_batch(noPlace)
+    tester.test_checker(dead[0] and np.array_equal(results, noPlace), "Value without place in a row is a contradiction")
+
+    tester.setTestGroup("valid_batch() Tests")
+    tester.test_checker(valid_batch(grids).all(), "All puzzles are valid")
+    counts = get_block_layout().houseCounts(grids)
+    tester.test_checker(counts.shape == (len(levels), 27, 10) and np.all(counts.sum(axis=2) == 9), "houseCounts() counts 9 cells per house")
+    invalid = grids.copy()
+    invalid[0, 0, 0] = invalid[0, 0, 1] = 5  # duplicate in row 0
+    invalid[1, 0, 0] = invalid[1, 8, 0] = 7  # duplicate in column 0
+    invalid[2] = 0
+    invalid[2, 0, 0] = invalid[2, 1, 1] = 3  # duplicate in block 0 only
+    valid = valid_batch(invalid)
+    tester.test_checker(not valid[:3].any() and valid[3:].all(), "Duplicates in a row, column or block are found per grid")
+    tester.test_checker(all(valid[i] == Sudoku(invalid[i].copy()).isValid() for i in range(len(levels))), "valid_batch equals Sudoku.isValid")
+
+    tester.setTestGroup("solve_batch() Tests")
+    results, solved = solve_batch(grids)
+    tester.test_checker(solved.all() and solved_batch(results).all(), "All puzzles solved by solve_batch")
+    tester.test_checker(np.all((grids == 0) | (grids == results)), "Given clues are unchanged")
+    contradiction = np.zeros((1, 9, 9), dtype=int)
+    contradiction[0, 0, :8] = np.arange(1, 9)
+    contradiction[0, 1, 8] = 9  # cell (0,8) has no candidate left
+    results, solved = solve_batch(contradiction)
+    tester.test_checker(not solved[0], "Puzzle with contradiction is not solved")
+
+    print("\n" + "="*50)
+    print(tester)
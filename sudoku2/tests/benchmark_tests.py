@@ -0,0 +1,50 @@
+# benchmark_tests.py
+# Tests for the benchmark of all solver generations
+# Werner Schoegler, 26-Nov-2025
+
+import sys
+import os
+import copy
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+from tester import Tester
+from benchmark import load_dataset, time_stats, run_benchmark, compare_reports, SOLVER_FACTORIES, DATASETS
+
+if __name__ == '__main__':
+    tester = Tester()
+
+    tester.setTestGroup("load_dataset() Tests")
+    for dataset in DATASETS:
+        puzzles = load_dataset(dataset)
+        tester.test_checker(len(puzzles) > 0 and all(len(puzzle) == 81 for puzzle in puzzles), f"Dataset {dataset} has {len(puzzles)} puzzles")
+
+    tester.setTestGroup("time_stats() Tests")
+    stats = time_stats([float(t) for t in range(1, 101)])
+    tester.test_checker(stats["median_ms"] == 50.5 and stats["max_ms"] == 100.0, "Median and max of 1..100")
+    tester.test_checker(abs(stats["p95_ms"] - 95.05) < 1e-9 and abs(stats["p99_ms"] - 99.01) < 1e-9, "p95 and p99 of 1..100")
+
+    tester.setTestGroup("Solver generation Tests")
+    puzzle = load_dataset("easy_50")[0]
+    for generation, factory in SOLVER_FACTORIES.items():
+        tester.test_checker(factory()(puzzle), f"Generation {generation} solves the first easy puzzle")
+
+    tester.setTestGroup("run_benchmark() / compare_reports() Tests")
+    report = run_benchmark(["sudoku2"], ["easy_50", "hardest"], repeats=2, warmup=1, maxPuzzles=3, verbose=False)
+    result = report["results"]["sudoku2"]["hardest"]
+    tester.test_checker(result["count"] == 3 and result["solved"] == 3, "Benchmark solves the first 3 hardest puzzles")
+    tester.test_checker(result["median_ms"] <= result["p95_ms"] <= result["p99_ms"] <= result["max_ms"], "Time metrics are ordered")
+    tester.test_checker(compare_reports(report, report) == [], "Report has no regressions against itself")
+    slower = copy.deepcopy(report)
+    slower["results"]["sudoku2"]["easy_50"]["p99_ms"] *= 1.5
+    tester.test_checker(len(compare_reports(slower, report, tolerance=0.2)) == 1, "50% slower p99 is a regression with 20% tolerance")
+    tester.test_checker(len(compare_reports(slower, report, tolerance=0.6)) == 0, "50% slower p99 is no regression with 60% tolerance")
+    slower["results"]["sudoku2"]["hardest"]["solved"] -= 1
+    tester.test_checker(any("solved" in regression for regression in compare_reports(slower, report, tolerance=0.6)), "Fewer solved puzzles is a regression")
+
+    print("\n" + "="*50)
+    print(tester)
@@ -11,8 +11,47 @@ if python_dir not in sys.path:
 
 import numpy as np
 from tester import Tester
-from block import get_block_indices
+from block import get_block_indices, get_block_layout, BlockLayout
+from sudoku2 import Sudoku
+from util.string2array import string2array
 
 if __name__ == "__main__":
+    tester = Tester()
     blockIndices = get_block_indices(0, "block_norm_index_")
     print(blockIndices)
+
+    tester.setTestGroup("BlockLayout Tests for standard blocks")
+    layout = get_block_layout("block_norm_index_")
+    tester.test_checker(get_block_layout("block_norm_index_") is layout, "Layout is compiled only once")
+    for row in range(9):
+        for col in range(9):
+            tester.test_checker(layout.getBlockNumber(row, col) == (row // 3) * 3 + (col // 3),
+                                f"Block number for cell ({row},{col})")
+    tester.test_checker(all(len(peers) == 20 for peers in layout.peers), "Each cell has 20 peers")
+    tester.test_checker(np.all(np.bincount(layout.houses.reshape(-1)) == 3), "Each cell is in 3 houses")
+    for block_number in range(9):
+        tester.test_checker(layout.getBlockIndices(block_number) == get_block_indices(block_number, "block_norm_index_"),
+                            f"Block indices of block {block_number}")
+
+    tester.setTestGroup("BlockLayout Tests for jiggsaw blocks")
+    layout = get_block_layout("block_alt1_index_")
+    for block_number in range(9):
+        for row, col in get_block_indices(block_number, "block_alt1_index_"):
+            tester.test_checker(layout.getBlockNumber(row, col) == block_number,
+                                f"Jiggsaw block number for cell ({row},{col})")
+    tester.test_checker(all(len(peers) >= 18 for peers in layout.peers), "Each jiggsaw cell has at least 18 peers")
+    try:
+        BlockLayout([get_block_indices(0, "block_norm_index_")] * 9, "invalid")
+        tester.test_checker(False, "Overlapping blocks raise ValueError")
+    except ValueError:
+        tester.test_checker(True, "Overlapping blocks raise ValueError")
+
+    tester.setTestGroup("Sudoku jiggsaw lookup Tests")
+    sudoku = Sudoku(string2array("003020600900305001001806400008102900700000008006708200002609500800203009005010300"))
+    for row in range(9):
+        for col in range(9):
+            tester.test_checker(np.array_equal(sudoku.getBlockJiggsaw(row, col), sudoku.getBlock(row, col)),
+                                f"Jiggsaw block equals block for cell ({row},{col})")
+
+    print("\n" + "="*50)
+    print(tester)
@@ -0,0 +1,83 @@
+# canonical_tests.py
+# Tests for the canonical form of puzzles under the Sudoku symmetry group
+# Werner Schoegler, 28-Nov-2025
+
+import sys
+import os
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import time
+import tracemalloc
+import numpy as np
+from tester import Tester
+from canonical import canonicalize, canonicalize_batch, canonical_hash, canonical_hash_batch, dedupe_puzzles
+from dlx import solve_exact_cover
+from util.string2array import string2array
+from data.test_data import trialSudokus2, hardTrialSudokus
+
+def random_symmetry(grid: np.ndarray, rng: np.random.Generator) -> np.ndarray:
+    """Apply a random transform of the symmetry group to a grid."""
+    rows = np.concatenate([3 * band + rng.permutation(3) for band in rng.permutation(3)])
+    cols = np.concatenate([3 * stack + rng.permutation(3) for stack in rng.permutation(3)])
+    relabel = np.concatenate([[0], rng.permutation(9) + 1])
+    result = relabel[grid[rows][:, cols]]
+    return result.T if rng.random() < 0.5 else result
+
+if __name__ == '__main__':
+    tester = Tester()
+    rng = np.random.default_rng(3)
+    puzzles = list(hardTrialSudokus.items())[:12]
+
+    tester.setTestGroup("canonicalize() Tests")
+    for level, grid_str in puzzles:
+        grid = string2array(grid_str)
+        canonical, transform = canonicalize(grid)
+        tester.test_checker(np.array_equal(transform.apply(grid), canonical), f"Transform maps {level} to its canonical form")
+        tester.test_checker(np.array_equal(transform.invert(canonical), grid), f"Inverse transform maps the canonical form back to {level}")
+        copy = random_symmetry(grid, rng)
+        tester.test_checker(np.array_equal(canonicalize(copy)[0], canonical), f"Symmetric copy of {level} has the same canonical form")
+        tester.test_checker(canonical_hash(copy) == canonical_hash(grid_str), f"Symmetric copy of {level} has the same hash")
+        # the solution of the canonical puzzle maps back to the solution of the copy
+        copyCanonical, copyTransform = canonicalize(copy)
+        solution = copyTransform.invert(solve_exact_cover(copyCanonical)[0])
+        tester.test_checker(np.array_equal(solution, solve_exact_cover(copy)[0]), f"Canonical solution maps back to the solution of the copy of {level}")
+    tester.test_checker(canonical_hash(puzzles[0][1]) != canonical_hash(puzzles[1][1]), "Different puzzles have different hashes")
+    canonical, transform = canonicalize(puzzles[0][1])
+    tester.test_checker(sorted(transform.relabel.tolist()) == list(range(10)), "Relabeling is a permutation of the values")
+
+    tester.setTestGroup("canonicalize_batch() Tests")
+    grids = np.array([string2array(grid_str) for _, grid_str in puzzles])
+    canonical, transforms = canonicalize_batch(grids)
+    tester.test_checker(all(np.array_equal(canonical[i], canonicalize(grids[i])[0]) for i in range(len(grids))), "Batch equals single canonical forms")
+    tester.test_checker(canonical_hash_batch([grid_str for _, grid_str in puzzles]) == [canonical_hash(grid_str) for _, grid_str in puzzles], "Batch hashes equal single hashes")
+    tester.test_checker(len(canonicalize_batch([])[1]) == 0, "Empty batch")
+
+    tester.setTestGroup("Sparse grid Tests")
+    oneClue = np.zeros((9, 9), dtype=int)
+    oneClue[4, 4] = 5
+    for name, grid in (("empty grid", np.zeros((9, 9), dtype=int)), ("one-clue grid", oneClue)):
+        tracemalloc.start()
+        start_time = time.time()
+        canonical, transform = canonicalize(grid)
+        elapsed = time.time() - start_time
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        tester.test_checker(elapsed < 1.0 and peak < 100e6, f"Canonical form of the {name} is bounded ({elapsed:.3f}s, {peak / 1e6:.1f} MB)")
+        tester.test_checker(np.array_equal(canonical, grid) and np.array_equal(transform.invert(canonical), grid),
+                            f"The {name} keeps its raw grid")
+    tester.test_checker(canonical_hash(oneClue) != canonical_hash(np.roll(oneClue, 1)), "Sparse grids are not merged by symmetry")
+
+    tester.setTestGroup("dedupe_puzzles() Tests")
+    unique = dedupe_puzzles(trialSudokus2)
+    tester.test_checker("easy 1" in unique and "easy 5" not in unique, "Literal duplicate easy 5 of easy 1 is removed")
+    copies = {level: "".join(map(str, random_symmetry(string2array(grid_str), rng).reshape(81))) for level, grid_str in puzzles}
+    tester.test_checker(len(dedupe_puzzles({**dict(puzzles), **{"copy " + level: s for level, s in copies.items()}})) == len(dedupe_puzzles(dict(puzzles))),
+                        "Symmetric copies are removed")
+
+    print("\n" + "="*50)
+    print(tester)
@@ -0,0 +1,81 @@
+# contradiction_tests.py
+# Tests for the contradiction detection of solver1 (empty candidate set, value without place in a house)
+# Werner Schoegler, 05-Dec-2025
+
+import sys
+import os
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from sudoku2 import Sudoku
+from tester import Tester
+from dlx import solve_exact_cover
+from runner import solve_puzzle
+from util.string2array import string2array
+from data.test_data import hardTrialSudokus, evelTrialSudokus
+
+if __name__ == '__main__':
+    tester = Tester()
+
+    tester.setTestGroup("findContradiction() Tests")
+    for level, grid_str in hardTrialSudokus.items():
+        tester.test_checker(Sudoku(string2array(grid_str)).findContradiction() is None, f"No contradiction in {level}")
+    grid = np.zeros((9, 9), dtype=int)
+    grid[0, 0] = grid[0, 5] = 7
+    tester.test_checker(Sudoku(grid).findContradiction() == "value used twice in a house", "Value used twice in a row")
+    grid = np.zeros((9, 9), dtype=int)
+    grid[0, :8] = np.arange(1, 9)
+    grid[1, 8] = 9
+    tester.test_checker(Sudoku(grid).findContradiction() == "no candidate left at position (0, 8)", "Empty cell without candidates")
+    sudoku = Sudoku(np.zeros((9, 9), dtype=int))
+    for col in range(9):
+        sudoku.eliminated[4 * 9 + col] = 1 << 4
+    tester.test_checker(sudoku.findContradiction() == "no place left for value 5 in row 4", "Value without place in a row")
+    sudoku = Sudoku(np.zeros((9, 9), dtype=int))
+    for cell in [30, 31, 32, 39, 40, 41, 48, 49, 50]:
+        sudoku.eliminated[cell] = 1 << 8
+    tester.test_checker(sudoku.findContradiction() == "no place left for value 9 in block 4", "Value without place in a block")
+
+    tester.setTestGroup("solver1() contradiction Tests")
+    grid = np.zeros((9, 9), dtype=int)
+    grid[0, :8] = np.arange(1, 9)
+    grid[1, 8] = 9
+    sudoku = Sudoku(grid)
+    tester.test_checker(not sudoku.solver1() and sudoku.contradiction is not None, "solver1 reports the contradiction")
+    tester.test_checker(np.array_equal(sudoku.grid, grid), "solver1 stops before placing a value")
+    stopped = wrongSolved = 0
+    for level, grid_str in (hardTrialSudokus | evelTrialSudokus).items():
+        grid = string2array(grid_str)
+        sudoku = Sudoku(grid.copy())
+        tester.test_checker(sudoku.solver1() or sudoku.contradiction is None, f"No contradiction without guess in {level}")
+        # guess a wrong candidate in the first empty cell
+        reference = solve_exact_cover(grid)[0]
+        row, col = divmod(int(np.flatnonzero(grid == 0)[0]), 9)
+        for value in sudoku.getCandidates(row, col) if sudoku.grid[row, col] == 0 else []:
+            if value != reference[row, col]:
+                guess = Sudoku(sudoku.grid.copy())
+                guess.setValue(row, col, value)
+                solved = guess.solver1(enableLockedCandidates=True, enableSubsets=True)
+                wrongSolved += solved
+                stopped += guess.contradiction is not None
+    tester.test_checker(wrongSolved == 0, "A wrong guess never solves the puzzle")
+    tester.test_checker(stopped > 0, f"Wrong guesses are stopped by a contradiction ({stopped})")
+    sudoku = Sudoku(string2array(next(iter(hardTrialSudokus.values()))))
+    sudoku.contradiction = "old"
+    sudoku.setGrid(sudoku.grid)
+    tester.test_checker(sudoku.contradiction is None, "setGrid() clears the contradiction")
+
+    tester.setTestGroup("Runner Tests")
+    grid_str = "12345678" + "0" * 9 + "9" + "0" * 63
+    result = solve_puzzle("contradiction", grid_str)
+    tester.test_checker(result["algorithm"] == "contradiction" and not result["solved"], "Runner skips the search for a puzzle without solution")
+    result = solve_puzzle("hard", next(iter(hardTrialSudokus.values())))
+    tester.test_checker(result["solved"] and result["algorithm"] != "contradiction", "Runner solves a valid puzzle")
+
+    print("\n" + "="*50)
+    print(tester)
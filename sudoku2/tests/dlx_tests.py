@@ -0,0 +1,39 @@
+# dlx_tests.py
+# Tests for the dancing links exact cover solver
+# Werner Schoegler, 20-Nov-2025
+
+import sys
+import os
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from sudoku2 import Sudoku
+from tester import Tester
+from dlx import solve_exact_cover
+from util.string2array import string2array
+from data.test_data import hardTrialSudokus
+
+if __name__ == '__main__':
+    tester = Tester()
+
+    tester.setTestGroup("solveExactCover() Tests")
+    for level, grid_str in hardTrialSudokus.items():
+        sudoku = Sudoku(string2array(grid_str))
+        tester.test_checker(sudoku.solveExactCover() and sudoku.isSolved(), f"Sudoku {level} solved by dancing links")
+        reference = Sudoku(string2array(grid_str))
+        reference.solveBacktrackOptimized()
+        tester.test_checker(np.array_equal(sudoku.grid, reference.grid), f"Dancing links solution equals backtracking solution for {level}")
+
+    tester.setTestGroup("solve_exact_cover() Tests")
+    grid = np.zeros((9, 9), dtype=int)
+    grid[0, 0] = grid[0, 5] = 7  # two equal clues in a row
+    tester.test_checker(len(solve_exact_cover(grid)) == 0, "Conflicting clues give no solution")
+    tester.test_checker(len(solve_exact_cover(np.zeros((9, 9), dtype=int), limit=3)) == 3, "Empty grid gives the requested number of solutions")
+
+    print("\n" + "="*50)
+    print(tester)
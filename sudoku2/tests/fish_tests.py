@@ -0,0 +1,75 @@
+# fish_tests.py
+# Tests for fish patterns (X-Wing, Swordfish, Jellyfish) on per-digit bitboards
+# Werner Schoegler, 03-Dec-2025
+
+import sys
+import os
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from sudoku2 import Sudoku, ROW_SET_BITS, COLUMN_SET_BITS, FISH_NAMES
+from tester import Tester, solver1_keeps_solution
+from rater import rate_puzzle
+from util.string2array import string2array
+from data.test_data import hardTrialSudokus, evelTrialSudokus
+
+def fish_sudoku(value: int, baseLines: list[int], coverLines: list[int], byRows: bool = True) -> Sudoku:
+    """Empty grid where value is only a candidate of the cover lines in the base lines."""
+    sudoku = Sudoku(np.zeros((9, 9), dtype=int))
+    for base in baseLines:
+        for other in range(9):
+            if other not in coverLines:
+                cell = base * 9 + other if byRows else other * 9 + base
+                sudoku.eliminated[cell] |= 1 << (value - 1)
+    return sudoku
+
+if __name__ == '__main__':
+    tester = Tester()
+
+    tester.setTestGroup("Row/column set table Tests")
+    tester.test_checker(ROW_SET_BITS[0b101] == (0x1FF | (0x1FF << 18)), "Row set bits of rows 0 and 2")
+    tester.test_checker(bin(COLUMN_SET_BITS[0b11]).count("1") == 18 and COLUMN_SET_BITS[0b1] & 1 and COLUMN_SET_BITS[0b1] >> 72 & 1,
+                        "Column set bits of columns 0 and 1")
+
+    tester.setTestGroup("solveFish() Tests")
+    for size, (baseLines, coverLines) in {2: ([0, 4], [1, 6]), 3: ([1, 4, 7], [0, 4, 8]), 4: ([0, 2, 5, 8], [1, 3, 5, 7])}.items():
+        for byRows in (True, False):
+            direction = "rows" if byRows else "columns"
+            sudoku = fish_sudoku(5, baseLines, coverLines, byRows)
+            tester.test_checker(sudoku.solveFish(maxSize=size), f"{FISH_NAMES[size]} on {direction} found")
+            others = [line for line in range(9) if line not in baseLines]
+            removed = all(5 not in (sudoku.getCandidates(other, cover) if byRows else sudoku.getCandidates(cover, other))
+                          for other in others for cover in coverLines)
+            tester.test_checker(removed, f"{FISH_NAMES[size]} on {direction} removes the value from the cover lines")
+            kept = all(5 in (sudoku.getCandidates(base, cover) if byRows else sudoku.getCandidates(cover, base))
+                       for base in baseLines for cover in coverLines)
+            tester.test_checker(kept, f"{FISH_NAMES[size]} on {direction} keeps the value in the fish cells")
+            tester.test_checker(all(4 in sudoku.getCandidates(other, 0) for other in range(9)), f"Other values are unchanged ({FISH_NAMES[size]})")
+    sudoku = fish_sudoku(5, [1, 4, 7], [0, 4, 8])
+    tester.test_checker(not sudoku.solveFish(maxSize=2), "Swordfish is not found with maxSize=2")
+    tester.test_checker(not Sudoku(np.zeros((9, 9), dtype=int)).solveFish(), "No fish in an empty grid")
+
+    tester.setTestGroup("solver1(enableFish=True) Tests")
+    puzzles = hardTrialSudokus | evelTrialSudokus
+    solved = [0, 0]
+    valid = True
+    for level, grid_str in puzzles.items():
+        grid = string2array(grid_str)
+        solved[0] += Sudoku(grid.copy()).solver1(enableLockedCandidates=True, enableSubsets=True)
+        solvedFish, sound = solver1_keeps_solution(grid, enableLockedCandidates=True, enableSubsets=True, enableFish=True)
+        solved[1] += solvedFish
+        valid = valid and sound
+    tester.test_checker(valid, "Fish never remove the value of the solution")
+    tester.test_checker(solved[1] > solved[0], f"More puzzles solved logically with fish ({solved[1]} > {solved[0]})")
+
+    tester.setTestGroup("Rater Tests")
+    techniques = {rate_puzzle(grid_str)["technique"] for grid_str in puzzles.values()}
+    tester.test_checker("fish" in techniques, "Rater uses fish")
+
+    print("\n" + "="*50)
+    print(tester)
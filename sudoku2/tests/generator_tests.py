@@ -0,0 +1,48 @@
+# generator_tests.py
+# Tests for the random puzzle generator
+# Werner Schoegler, 25-Nov-2025
+
+import sys
+import os
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+from sudoku2 import Sudoku
+from tester import Tester
+from generator import generate_puzzle, generate_batch, SYMMETRIES
+from util.string2array import string2array
+
+NUM_CLUES = 28
+
+if __name__ == '__main__':
+    tester = Tester()
+
+    tester.setTestGroup("generate_puzzle() Tests")
+    for symmetry, partner in SYMMETRIES.items():
+        puzzle, solution = generate_puzzle(NUM_CLUES, symmetry, seed=11)
+        sudoku = Sudoku(string2array(puzzle))
+        tester.test_checker(81 - puzzle.count("0") == NUM_CLUES, f"Puzzle with {symmetry} symmetry has {NUM_CLUES} clues")
+        tester.test_checker(sudoku.hasUniqueSolution(), f"Puzzle with {symmetry} symmetry has a unique solution")
+        tester.test_checker(all(puzzle[cell] in ("0", solution[cell]) for cell in range(81)), f"Clues of the {symmetry} puzzle are taken from its solution")
+        tester.test_checker(all((puzzle[cell] == "0") == (puzzle[partner(cell)] == "0") for cell in range(81)), f"Empty cells follow the {symmetry} symmetry")
+        tester.test_checker(sudoku.solveBacktrackOptimized() and "".join(map(str, sudoku.grid.reshape(81))) == solution, f"Solution of the {symmetry} puzzle is found")
+    tester.test_checker(generate_puzzle(NUM_CLUES, seed=3) == generate_puzzle(NUM_CLUES, seed=3), "Same seed gives the same puzzle")
+    tester.test_checker(generate_puzzle(NUM_CLUES, seed=3) != generate_puzzle(NUM_CLUES, seed=4), "Different seeds give different puzzles")
+    puzzle, solution = generate_puzzle(NUM_CLUES, seed=2, layout="block_alt1_index_")
+    sudoku = Sudoku(string2array(puzzle), "block_alt1_index_")
+    tester.test_checker(sudoku.hasUniqueSolution(), "Jiggsaw puzzle has a unique solution")
+    tester.test_checker(Sudoku(string2array(solution), "block_alt1_index_").isSolved(), "Jiggsaw solution is valid for its layout")
+
+    tester.setTestGroup("generate_batch() Tests")
+    puzzles = generate_batch(8, NUM_CLUES, "rotational", seed=7, workers=1)
+    tester.test_checker(len(puzzles) == 8, "Batch has the requested number of puzzles")
+    tester.test_checker(len(set(puzzles)) == 8, "Batch puzzles are distinct")
+    tester.test_checker(puzzles == generate_batch(8, NUM_CLUES, "rotational", seed=7, workers=2, chunkSize=3), "Batch does not depend on the number of workers")
+    tester.test_checker(all(Sudoku(string2array(puzzle)).hasUniqueSolution() for puzzle, _ in puzzles), "Batch puzzles have a unique solution")
+
+    print("\n" + "="*50)
+    print(tester)
@@ -0,0 +1,90 @@
+# jiggsaw_tests.py
+# Tests for solving jiggsaw Sudokus with an irregular block layout
+# Werner Schoegler, 23-Nov-2025
+
+import sys
+import os
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from sudoku2 import Sudoku
+from tester import Tester
+from block import get_block_layout, BlockLayout, BLOCK_LAYOUTS
+from dlx import solve_exact_cover, get_sudoku_matrix, MAX_MATRICES
+from search import get_search_engine, MAX_ENGINES
+import dlx
+import search
+from batch import solve_batch, solved_batch
+
+LAYOUT = "block_alt1_index_"
+
+if __name__ == '__main__':
+    tester = Tester()
+    layout = get_block_layout(LAYOUT)
+
+    # a complete jiggsaw grid: first solution of the empty grid
+    solution = solve_exact_cover(np.zeros((9, 9), dtype=int), layout=layout)[0]
+    sudoku = Sudoku(solution.copy(), LAYOUT)
+    tester.setTestGroup("Jiggsaw validity Tests")
+    tester.test_checker(sudoku.isSolved(), "Complete jiggsaw grid is solved")
+    tester.test_checker(not Sudoku(solution.copy()).isValid(), "Complete jiggsaw grid is not valid for standard blocks")
+    for block_number in range(9):
+        cells = layout.blockCells[block_number]
+        tester.test_checker(sorted(solution.reshape(81)[cells].tolist()) == list(range(1, 10)),
+                            f"Jiggsaw block {block_number} holds the values 1-9")
+
+    # remove values in a fixed pattern and solve again with all solvers
+    puzzle = solution.copy()
+    rng = np.random.default_rng(5)
+    puzzle.reshape(81)[rng.choice(81, 40, replace=False)] = 0
+    tester.setTestGroup("Jiggsaw solver Tests")
+    for name in ["solver1", "solveBacktrack", "solveBacktrackOptimized", "solveExactCover"]:
+        sudoku = Sudoku(puzzle.copy(), LAYOUT)
+        solved = getattr(sudoku, name)()
+        tester.test_checker(solved and sudoku.isSolved() and np.all((puzzle == 0) | (sudoku.grid == puzzle)),
+                            f"Jiggsaw puzzle solved by {name}")
+    for row in range(9):
+        for col in range(9):
+            if puzzle[row, col] == 0:
+                sudoku = Sudoku(puzzle.copy(), LAYOUT)
+                tester.test_checker(solution[row, col] in sudoku.getCandidates(row, col),
+                                    f"Solution value is candidate of cell ({row},{col})")
+
+    results, solved = solve_batch(puzzle[None], layout=LAYOUT)
+    tester.test_checker(solved[0] and solved_batch(results, LAYOUT)[0], "Jiggsaw puzzle solved by solve_batch")
+
+    tester.setTestGroup("Unnamed layout Tests")
+    unnamed = [BlockLayout(BLOCK_LAYOUTS[LAYOUT]) for _ in range(2)]
+    tester.test_checker(get_search_engine(unnamed[0]) is get_search_engine(unnamed[1]) and
+                        get_sudoku_matrix(unnamed[0]) is get_sudoku_matrix(unnamed[1]), "Unnamed layouts with equal blocks share engine and matrix")
+    sudoku = Sudoku(puzzle.copy(), unnamed[0])
+    tester.test_checker(sudoku.solveBacktrackOptimized() and sudoku.isSolved() and np.all((puzzle == 0) | (sudoku.grid == puzzle)),
+                        "Unnamed jiggsaw layout solves the puzzle")
+    for shift in range(MAX_ENGINES + MAX_MATRICES):
+        # degenerate layouts (blocks of 9 consecutive cells) only to fill the caches
+        blocks = [[divmod((block * 9 + k + shift) % 81, 9) for k in range(9)] for block in range(9)]
+        filler = BlockLayout(blocks)
+        get_search_engine(filler)
+        get_sudoku_matrix(filler)
+    tester.test_checker(len(search._engines) <= MAX_ENGINES and len(dlx._sudoku_matrices) <= MAX_MATRICES,
+                        "Engine and matrix caches are bounded")
+
+    tester.setTestGroup("Jiggsaw print Tests")
+    text = str(Sudoku(puzzle.copy(), LAYOUT))
+    valueRows = [line for line in text.splitlines() if any(ch.isdigit() or ch == "." for ch in line)]
+    tester.test_checker(len(valueRows) == 9 and len(set(map(len, valueRows))) == 1, "Printed rows are aligned")
+    tester.test_checker(all(line.count("|") == int((layout.cellBlock[row, 1:] != layout.cellBlock[row, :-1]).sum())
+                            for row, line in enumerate(valueRows)), "'|' is drawn between cells of different blocks")
+    tester.test_checker(len(text.splitlines()) - 9 == int((layout.cellBlock[1:] != layout.cellBlock[:-1]).any(axis=1).sum()),
+                        "'-' lines are drawn between rows with block borders")
+    standard = str(Sudoku(solution.copy())).splitlines()
+    tester.test_checker(standard[3] == "-" * 21 and all(line.count("|") == 2 for line in standard if "-" not in line),
+                        "Standard layout keeps its 3x3 borders")
+
+    print("\n" + "="*50)
+    print(tester)
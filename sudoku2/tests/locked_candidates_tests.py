@@ -0,0 +1,90 @@
+# locked_candidates_tests.py
+# Tests for locked candidates (pointing pairs, box-line reduction) on per-digit bitboards
+# Werner Schoegler, 02-Dec-2025
+
+import sys
+import os
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from sudoku2 import Sudoku
+from tester import Tester, solver1_keeps_solution
+from block import get_block_layout
+from search import get_search_engine
+from dlx import solve_exact_cover
+from rater import rate_puzzle
+from util.string2array import string2array
+from data.test_data import hardTrialSudokus
+
+if __name__ == '__main__':
+    tester = Tester()
+
+    tester.setTestGroup("BlockLayout bitboard table Tests")
+    layout = get_block_layout()
+    tester.test_checker(all(bin(bits).count("1") == 9 for bits in layout.houseBits), "Every house has 9 cell bits")
+    tester.test_checker(len(layout.intersections) == 54, "Standard layout: 9 blocks x 3 rows + 3 columns")
+    tester.test_checker(all(bin(inter).count("1") == 3 for _, _, inter in layout.intersections), "Standard intersections have 3 cells")
+    jiggsaw = get_block_layout("block_alt1_index_")
+    tester.test_checker(sum(bin(inter).count("1") for _, _, inter in jiggsaw.intersections) == 2 * 81,
+                        "Jiggsaw intersections cover every cell once per row and once per column")
+
+    tester.setTestGroup("solveLockedCandidates() Tests")
+    # pointing: value 1 of block 0 only in row 0 -> removed from row 0 outside block 0
+    sudoku = Sudoku(np.zeros((9, 9), dtype=int))
+    for cell in [9, 10, 11, 18, 19, 20]:
+        sudoku.eliminated[cell] = 0b1
+    tester.test_checker(sudoku.solveLockedCandidates(), "Pointing candidate found")
+    tester.test_checker(all(1 not in sudoku.getCandidates(0, col) for col in range(3, 9)), "Pointing removes the value from the row")
+    tester.test_checker(1 in sudoku.getCandidates(0, 0) and 1 in sudoku.getCandidates(3, 0), "Cells outside the row keep the value")
+    # pointing in a column: value 2 of block 4 only in column 4
+    sudoku = Sudoku(np.zeros((9, 9), dtype=int))
+    for row in range(3, 6):
+        for col in [3, 5]:
+            sudoku.eliminated[row * 9 + col] = 0b10
+    sudoku.solveLockedCandidates()
+    tester.test_checker(all(2 not in sudoku.getCandidates(row, 4) for row in [0, 1, 2, 6, 7, 8]), "Pointing removes the value from the column")
+    # box-line reduction: value 3 of row 0 only in block 0 -> removed from block 0 outside row 0
+    sudoku = Sudoku(np.zeros((9, 9), dtype=int))
+    for col in range(3, 9):
+        sudoku.eliminated[col] = 0b100
+    tester.test_checker(sudoku.solveLockedCandidates(), "Box-line reduction found")
+    tester.test_checker(all(3 not in sudoku.getCandidates(row, col) for row in [1, 2] for col in range(3)),
+                        "Box-line reduction removes the value from the block")
+    tester.test_checker(not sudoku.solveLockedCandidates(), "Second pass finds nothing new")
+    tester.test_checker(not Sudoku(np.zeros((9, 9), dtype=int)).solveLockedCandidates(), "Nothing to remove in an empty grid")
+
+    tester.setTestGroup("solver1(enableLockedCandidates=True) Tests")
+    solved = [0, 0, 0]
+    valid = True
+    nodes = [0, 0]
+    engine = get_search_engine()
+    for level, grid_str in hardTrialSudokus.items():
+        grid = string2array(grid_str)
+        reference = solve_exact_cover(grid)[0]
+        solved[0] += Sudoku(grid.copy()).solver1()
+        solvedLocked, sound = solver1_keeps_solution(grid, enableLockedCandidates=True)
+        solved[1] += solvedLocked
+        valid = valid and sound
+        sudoku = Sudoku(grid.copy())
+        solved[2] += sudoku.solver1(enableLockedCandidates=True, enableSubsets=True)
+        # search from the same grid with and without the eliminations
+        engine.search(sudoku.grid.reshape(81).tolist())
+        nodes[0] += engine.nodes
+        tester.test_checker(sudoku.solveBacktrackOptimized() and np.array_equal(sudoku.grid, reference), f"Backtracking with eliminations solves {level}")
+        nodes[1] += engine.nodes
+    tester.test_checker(valid, "Locked candidates never remove the value of the solution")
+    tester.test_checker(solved[1] > solved[0], f"More puzzles solved with locked candidates ({solved[1]} > {solved[0]})")
+    tester.test_checker(solved[2] >= solved[1], f"Locked candidates and subsets together ({solved[2]})")
+    tester.test_checker(nodes[1] <= nodes[0], f"Eliminations reduce the search tree ({nodes[1]} <= {nodes[0]} nodes)")
+
+    tester.setTestGroup("Rater Tests")
+    techniques = {rate_puzzle(grid_str)["technique"] for grid_str in hardTrialSudokus.values()}
+    tester.test_checker("locked candidates" in techniques, "Rater uses locked candidates")
+
+    print("\n" + "="*50)
+    print(tester)
@@ -0,0 +1,75 @@
+# packed_tests.py
+# Tests for the packed binary puzzle file
+# Werner Schoegler, 27-Nov-2025
+
+import sys
+import os
+import tempfile
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from tester import Tester
+from util.packed import pack_grids, unpack_records, write_packed, open_packed, convert_text_file, convert_dict_file, \
+    HEADER_SIZE, RECORD_SIZE
+from util.string2array import strings2array
+from runner import load_puzzle_file
+from batch import solve_batch
+
+DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+
+if __name__ == '__main__':
+    tester = Tester()
+    puzzles = list(load_puzzle_file(os.path.join(DATA_DIR, "top95.txt")).values())
+    grids = strings2array(puzzles)
+
+    tester.setTestGroup("pack_grids() / unpack_records() Tests")
+    records = pack_grids(grids)
+    tester.test_checker(records.shape == (len(grids), RECORD_SIZE) and records.dtype == np.uint8, "One 41 byte record per grid")
+    tester.test_checker(np.array_equal(unpack_records(records), grids), "Unpacked grids equal the packed grids")
+    tester.test_checker(np.all(records[:, -1] >> 4 == 0), "High nibble of the last byte is empty")
+    try:
+        pack_grids(np.full((1, 9, 9), 10))
+        tester.test_checker(False, "Values above 9 are rejected")
+    except ValueError:
+        tester.test_checker(True, "Values above 9 are rejected")
+
+    with tempfile.TemporaryDirectory() as tmpDir:
+        tester.setTestGroup("write_packed() / open_packed() Tests")
+        fileName = os.path.join(tmpDir, "top95.sdk4")
+        tester.test_checker(write_packed(fileName, grids) == len(grids), "All grids are written")
+        tester.test_checker(os.path.getsize(fileName) == HEADER_SIZE + RECORD_SIZE * len(grids), "File size is header + fixed size records")
+        packed = open_packed(fileName)
+        tester.test_checker(len(packed) == len(grids), "Packed file has the number of grids")
+        tester.test_checker(np.array_equal(packed[10], grids[10]), "Single record is a 9x9 grid")
+        tester.test_checker(np.array_equal(packed[20:30], grids[20:30]), "Slice of records gives the grids")
+        tester.test_checker(packed.strings(slice(0, 3)) == [p.replace(".", "0") for p in puzzles[:3]], "Records as puzzle strings")
+        results, solved = solve_batch(packed[:20])
+        tester.test_checker(bool(np.all(solved)), "Batch solver solves a slice of the packed file")
+        emptyFile = os.path.join(tmpDir, "empty.sdk4")
+        write_packed(emptyFile, np.zeros((0, 9, 9), dtype=int))
+        tester.test_checker(len(open_packed(emptyFile)) == 0, "Empty packed file")
+        try:
+            open_packed(os.path.join(DATA_DIR, "top95.txt"))
+            tester.test_checker(False, "Text file is not accepted as packed file")
+        except ValueError:
+            tester.test_checker(True, "Text file is not accepted as packed file")
+
+        tester.setTestGroup("Converter Tests")
+        for name in ["top95", "sudoku_1", "hardest", "easy_50"]:
+            outFile = os.path.join(tmpDir, name + ".sdk4")
+            count = convert_text_file(os.path.join(DATA_DIR, name + ".txt"), outFile)
+            expected = list(load_puzzle_file(os.path.join(DATA_DIR, name + ".txt")).values())
+            tester.test_checker(count == len(expected) and open_packed(outFile).strings() == [p.replace(".", "0") for p in expected],
+                                f"Text file {name}.txt is converted")
+            outFile = os.path.join(tmpDir, name + "_new.sdk4")
+            count = convert_dict_file(os.path.join(DATA_DIR, name + "_new.txt"), outFile)
+            tester.test_checker(count > 0 and set(open_packed(outFile).strings()) <= {p.replace(".", "0") for p in expected},
+                                f"Dict file {name}_new.txt is converted")
+
+    print("\n" + "="*50)
+    print(tester)
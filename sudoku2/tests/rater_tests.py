@@ -0,0 +1,74 @@
+# rater_tests.py
+# Tests for the technique ladder difficulty rater
+# Werner Schoegler, 25-Nov-2025
+
+import sys
+import os
+import tempfile
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+from tester import Tester
+import rater
+from rater import rate_puzzle, rate_puzzles, RatingCache, TECHNIQUE_LADDER
+from canonical import canonical_hash, puzzle_hash
+from data.test_data import easyTrialSudokus, hardTrialSudokus
+
+if __name__ == '__main__':
+    tester = Tester()
+
+    tester.setTestGroup("rate_puzzle() Tests")
+    for level, grid_str in easyTrialSudokus.items():
+        rating = rate_puzzle(grid_str)
+        tester.test_checker(rating["solved"], f"Sudoku {level} solved by the rater")
+        tester.test_checker(rating["steps"] == sum(rating["counts"].values()) and rating["technique"] in rating["counts"],
+                            f"Rating of {level} is consistent: {rating['technique']}, {rating['steps']} steps")
+    for level, grid_str in hardTrialSudokus.items():
+        rating = rate_puzzle(grid_str)
+        tester.test_checker(rating["solved"] and rating["level"] >= 1, f"Hard Sudoku {level} needs more than naked singles: {rating['technique']}")
+    solved = rate_puzzle("534678912672195348198342567859761423426853791713924856961537284287419635345286179")
+    tester.test_checker(solved["technique"] == "none" and solved["steps"] == 0, "Solved grid needs no technique")
+
+    tester.setTestGroup("puzzle_hash() Tests")
+    grid_str = next(iter(easyTrialSudokus.values()))
+    tester.test_checker(puzzle_hash(grid_str) == puzzle_hash(grid_str.replace("0", ".")), "'.' and '0' give the same hash")
+    tester.test_checker(puzzle_hash(grid_str) != puzzle_hash(next(iter(hardTrialSudokus.values()))), "Different puzzles give different hashes")
+
+    tester.setTestGroup("RatingCache Tests")
+    with tempfile.TemporaryDirectory() as tmpDir:
+        cacheFile = os.path.join(tmpDir, "ratings.json")
+        ratings = rate_puzzles(hardTrialSudokus, cacheFile)
+        tester.test_checker(os.path.exists(cacheFile), "Cache file is written")
+        cache = RatingCache(cacheFile)
+        tester.test_checker(len(cache.ratings) == len(set(map(canonical_hash, hardTrialSudokus.values()))), "Cache holds one rating per canonical puzzle")
+        tester.test_checker(len(cache.aliases) == len(set(map(puzzle_hash, hardTrialSudokus.values()))), "Cache holds one alias per puzzle")
+        # a cached rating is returned without rating the puzzle again
+        called = []
+        original = rater.rate_puzzle
+        rater.rate_puzzle = lambda *args: called.append(args) or original(*args)
+        tester.test_checker(rate_puzzles(hardTrialSudokus, cacheFile) == ratings, "Cached ratings equal the computed ratings")
+        tester.test_checker(len(called) == 0, "Cached puzzles are not rated again")
+        rate_puzzles({"new": next(iter(easyTrialSudokus.values())), **hardTrialSudokus}, cacheFile)
+        tester.test_checker(len(called) == 1, "Only the new puzzle is rated")
+        rater.rate_puzzle = original
+        # a different technique ladder invalidates the cache
+        TECHNIQUE_LADDER.append(("dummy", "solveSingles", "hard"))
+        tester.test_checker(len(RatingCache(cacheFile).ratings) == 0, "Cache is dropped for a different technique ladder")
+        TECHNIQUE_LADDER.pop()
+        # a symmetric copy of a rated puzzle is found by its canonical hash
+        grid_str = next(iter(hardTrialSudokus.values()))
+        copy_str = "".join(grid_str[col * 9 + row] for row in range(9) for col in range(9))  # transposed
+        rated = rate_puzzles({"hard": grid_str}, cacheFile)["hard"]
+        rater.rate_puzzle = lambda *args: called.append(args) or original(*args)
+        called.clear()
+        ratings = rate_puzzles({"transposed": copy_str}, cacheFile)
+        rater.rate_puzzle = original
+        tester.test_checker(len(called) == 0 and ratings["transposed"]["solved"], "Transposed copy is taken from the cache")
+        tester.test_checker(ratings["transposed"] == rated, "Copy gets the rating of the first rated copy (with its steps)")
+
+    print("\n" + "="*50)
+    print(tester)
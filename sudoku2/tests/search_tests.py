@@ -0,0 +1,61 @@
+# search_tests.py
+# Tests for the iterative backtracking search engine
+# Werner Schoegler, 24-Nov-2025
+
+import sys
+import os
+import random
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from sudoku2 import Sudoku
+from tester import Tester
+from search import get_search_engine
+from dlx import solve_exact_cover
+from util.string2array import string2array
+from data.test_data import hardTrialSudokus
+
+if __name__ == '__main__':
+    tester = Tester()
+
+    tester.setTestGroup("solveBacktrack() / solveBacktrackOptimized() Tests")
+    for level, grid_str in hardTrialSudokus.items():
+        reference = solve_exact_cover(string2array(grid_str))[0]
+        for name in ["solveBacktrack", "solveBacktrackOptimized"]:
+            sudoku = Sudoku(string2array(grid_str))
+            tester.test_checker(getattr(sudoku, name)() and sudoku.isSolved(), f"Sudoku {level} solved by {name}")
+            tester.test_checker(np.array_equal(sudoku.grid, reference), f"{name} solution equals dancing links solution for {level}")
+
+    tester.setTestGroup("SearchEngine.search() Tests")
+    engine = get_search_engine()
+    values = [0] * 81
+    values[0] = values[5] = 7  # two equal clues in a row
+    tester.test_checker(len(engine.search(values)) == 0, "Conflicting clues give no solution")
+    solutions = engine.search([0] * 81, limit=3)
+    tester.test_checker(len(solutions) == 3, "Empty grid gives the requested number of solutions")
+    tester.test_checker(len({tuple(solution) for solution in solutions}) == 3, "Solutions of the empty grid are distinct")
+    tester.test_checker(all(Sudoku(np.array(solution).reshape(9, 9)).isSolved() for solution in solutions), "Solutions of the empty grid are valid")
+    solution = engine.search([0] * 81, rng=random.Random(7))[0]
+    tester.test_checker(solution == engine.search([0] * 81, rng=random.Random(7))[0], "Random value order is reproducible with the same seed")
+    tester.test_checker(engine.trail == [] and len(engine.empty) == 81, "Trail is fully undone after the search")
+
+    tester.setTestGroup("countSolutions() / hasUniqueSolution() Tests")
+    for level, grid_str in hardTrialSudokus.items():
+        sudoku = Sudoku(string2array(grid_str))
+        tester.test_checker(sudoku.hasUniqueSolution(), f"Sudoku {level} has a unique solution")
+        tester.test_checker(sudoku.count_empty_cells() == grid_str.count("0") + grid_str.count("."), f"Grid of {level} is not changed by the count")
+    sudoku = Sudoku(np.zeros((9, 9), dtype=int))
+    tester.test_checker(sudoku.countSolutions() == 2, "Empty grid count stops at the default limit 2")
+    tester.test_checker(sudoku.countSolutions(limit=5) == 5, "Empty grid count stops at limit 5")
+    tester.test_checker(not sudoku.hasUniqueSolution(), "Empty grid has no unique solution")
+    grid = solve_exact_cover(string2array(next(iter(hardTrialSudokus.values()))))[0].copy()
+    grid[0, 0] = grid[0, 1]  # conflicting clues
+    tester.test_checker(Sudoku(grid).countSolutions() == 0, "Conflicting grid has no solution")
+
+    print("\n" + "="*50)
+    print(tester)
@@ -0,0 +1,115 @@
+# solution_cache_tests.py
+# Tests for the LRU solution cache (raw and canonical keys, eviction, solver and batch integration)
+# Werner Schoegler, 29-Nov-2025
+
+import sys
+import os
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from tester import Tester
+from sudoku2 import Sudoku
+from block import BlockLayout, BLOCK_LAYOUTS
+from solution_cache import SolutionCache
+from batch import solve_batch
+from dlx import solve_exact_cover
+from runner import run_batch
+from util.string2array import string2array
+from data.test_data import hardTrialSudokus
+
+if __name__ == '__main__':
+    tester = Tester()
+    puzzles = list(hardTrialSudokus.items())[:6]
+    grids = [string2array(grid_str) for _, grid_str in puzzles]
+    solutions = [solve_exact_cover(grid)[0] for grid in grids]
+
+    tester.setTestGroup("SolutionCache get/put Tests")
+    cache = SolutionCache()
+    tester.test_checker(cache.get(grids[0]) is None, "Unknown puzzle is a miss")
+    cache.put(grids[0], solutions[0])
+    tester.test_checker(np.array_equal(cache.get(grids[0]), solutions[0]), "Stored puzzle is a raw hit")
+    copy = grids[0].T.copy()
+    copy = np.concatenate([[0], np.roll(np.arange(1, 10), 1)])[copy]  # transposed and relabeled
+    solution = cache.get(copy)
+    tester.test_checker(solution is not None and np.array_equal(solution, solve_exact_cover(copy)[0]),
+                        "Symmetric copy is answered from the canonical entry")
+    tester.test_checker(cache.get(copy) is not None and cache.rawHits == 2, "Second lookup of the copy is a raw hit")
+    stats = cache.stats()
+    tester.test_checker(stats["hits"] == 3 and stats["canonicalHits"] == 1 and stats["misses"] == 1, "Hit/miss counters")
+    tester.test_checker(abs(stats["hitRate"] - 0.75) < 1e-9, "Hit rate")
+    rawOnly = SolutionCache(canonical=False)
+    rawOnly.put(grids[0], solutions[0])
+    tester.test_checker(rawOnly.get(copy) is None and len(rawOnly) == 1, "Without canonical keys a copy is a miss")
+    other = SolutionCache()
+    other.put(grids[0], solutions[0], layout="block_jiggsaw_1")
+    tester.test_checker(other.get(grids[0]) is None and other.get(grids[0], "block_jiggsaw_1") is not None,
+                        "Entries are separated by layout")
+
+    tester.setTestGroup("SolutionCache LRU Tests")
+    cache = SolutionCache(maxEntries=4, canonical=False)
+    for grid, solution in zip(grids, solutions):
+        cache.put(grid, solution)
+    tester.test_checker(len(cache) == 4 and cache.evictions == 2, "Cache is limited to maxEntries")
+    tester.test_checker(cache.get(grids[0]) is None and cache.get(grids[2]) is not None, "Oldest entries are evicted first")
+    cache.put(grids[0], solutions[0])
+    tester.test_checker(cache.get(grids[2]) is not None and cache.get(grids[3]) is None, "Lookup marks an entry as recently used")
+    cache = SolutionCache(maxEntries=None, maxBytes=1000, canonical=False)
+    for grid, solution in zip(grids, solutions):
+        cache.put(grid, solution)
+    tester.test_checker(0 < len(cache) < len(grids) and cache.stats()["bytes"] <= 1000, "Cache is limited to maxBytes")
+    cache.clear()
+    tester.test_checker(len(cache) == 0 and cache.stats()["bytes"] == 0, "clear() removes all entries")
+
+    tester.setTestGroup("Sudoku.setSolutionCache() Tests")
+    cache = SolutionCache()
+    sudoku = Sudoku(grids[1].copy())
+    sudoku.setSolutionCache(cache)
+    for method in ["solveBacktrackOptimized", "solveBacktrack", "solveExactCover", "solver1"]:
+        sudoku.setGrid(grids[1].copy())
+        tester.test_checker(getattr(sudoku, method)() and np.array_equal(sudoku.grid, solutions[1]), f"{method}() solves with the cache")
+    tester.test_checker(cache.misses == 1 and cache.rawHits == 3, "Only the first solver call is a cache miss")
+    sudoku.setSolutionCache(None)
+    sudoku.setGrid(grids[1].copy())
+    tester.test_checker(sudoku.solveExactCover() and cache.rawHits == 3, "Solver without cache")
+    cache = SolutionCache()
+    unnamed = [BlockLayout(BLOCK_LAYOUTS[name]) for name in ["block_norm_index_", "block_alt1_index_"]]
+    tester.test_checker(unnamed[0].key != unnamed[1].key and unnamed[0].key == BlockLayout(BLOCK_LAYOUTS["block_norm_index_"]).key,
+                        "Unnamed layouts are keyed by their blocks")
+    for layout in unnamed:
+        sudoku = Sudoku(np.zeros((9, 9), dtype=int), layout)
+        sudoku.setSolutionCache(cache)
+        tester.test_checker(sudoku.solveExactCover() and sudoku.isValid() and sudoku.count_empty_cells() == 0,
+                            "Unnamed layouts do not share cache entries")
+    tester.test_checker(cache.misses == 2, "Every unnamed layout misses the cache once")
+
+    tester.setTestGroup("solve_batch() with cache Tests")
+    cache = SolutionCache()
+    batch = np.array(grids)
+    results, solved = solve_batch(batch.copy(), cache=cache)
+    tester.test_checker(np.all(solved) and all(np.array_equal(results[i], solutions[i]) for i in range(len(grids))), "First batch is solved")
+    tester.test_checker(cache.misses == len(grids), "First batch misses the cache")
+    results, solved = solve_batch(batch.copy(), cache=cache)
+    tester.test_checker(np.all(solved) and cache.rawHits == len(grids), "Second batch is taken from the cache")
+    tester.test_checker(all(np.array_equal(results[i], solutions[i]) for i in range(len(grids))), "Cached batch results")
+
+    tester.setTestGroup("run_batch(cacheEntries) Tests")
+    repeated = {**dict(puzzles), **{"copy " + level: grid_str for level, grid_str in puzzles}}
+    results = run_batch(repeated, workers=1, cacheEntries=100)
+    tester.test_checker(all(result["solved"] for result in results.values()), "All puzzles are solved")
+    tester.test_checker(all(results["copy " + level]["algorithm"] == "cache" for level, _ in puzzles), "Repeated puzzles are taken from the cache")
+    transposed = {**dict(puzzles), **{"transposed " + level: "".join(grid_str[col * 9 + row] for row in range(9) for col in range(9))
+                                      for level, grid_str in puzzles}}
+    results = run_batch(transposed, workers=1, cacheEntries=100)
+    tester.test_checker(not any(results["transposed " + level]["algorithm"] == "cache" for level, _ in puzzles),
+                        "Runner cache finds repeated puzzles only by default")
+    results = run_batch(transposed, workers=1, cacheEntries=100, cacheCanonical=True)
+    tester.test_checker(all(results["transposed " + level]["algorithm"] == "cache" and results["transposed " + level]["solved"]
+                            for level, _ in puzzles), "Symmetric copies are taken from the cache with cacheCanonical")
+
+    print("\n" + "="*50)
+    print(tester)
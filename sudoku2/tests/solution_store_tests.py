@@ -0,0 +1,89 @@
+# solution_store_tests.py
+# Tests for the SQLite solution store and its use by the batch runner
+# Werner Schoegler, 30-Nov-2025
+
+import sys
+import os
+import sqlite3
+import tempfile
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from tester import Tester
+from solution_store import SolutionStore, grid_to_string
+from dlx import solve_exact_cover
+from runner import run_batch
+from util.string2array import string2array
+from data.test_data import hardTrialSudokus
+
+if __name__ == '__main__':
+    tester = Tester()
+    puzzles = list(hardTrialSudokus.items())[:6]
+    solutions = [grid_to_string(solve_exact_cover(string2array(grid_str))[0]) for _, grid_str in puzzles]
+    unknownPuzzle = list(hardTrialSudokus.values())[len(puzzles)]  # a puzzle with clues that is never stored
+    with tempfile.TemporaryDirectory() as tmpDir:
+        storeFile = os.path.join(tmpDir, "solutions.db")
+
+        tester.setTestGroup("SolutionStore get/put Tests")
+        with SolutionStore(storeFile, batchSize=4) as store:
+            tester.test_checker(store.get(unknownPuzzle) is None, "Unknown puzzle is not found")
+            for (_, grid_str), solution in zip(puzzles, solutions):
+                store.put(grid_str, solution, rating={"technique": "backtracking"}, solveTime=0.5, trace={"algorithm": "backtracking"})
+            entry = store.get(puzzles[0][1])
+            tester.test_checker(entry is not None and entry["solution"] == solutions[0], "Stored puzzle is found with its solution")
+            tester.test_checker(entry["rating"] == {"technique": "backtracking"} and entry["time"] == 0.5
+                                and entry["trace"] == {"algorithm": "backtracking"}, "Rating, time and trace are stored")
+            tester.test_checker(len(store) == len(puzzles), "One entry per puzzle")
+            store.put(puzzles[0][1], solutions[0], trace={"algorithm": "solver1"})
+            entry = store.get(puzzles[0][1])
+            tester.test_checker(entry["trace"] == {"algorithm": "solver1"} and entry["rating"] is not None, "Update keeps the fields that are not given")
+            store.put(puzzles[0][1], solutions[0], layout="block_jiggsaw_1")
+            tester.test_checker(store.get(puzzles[0][1], "block_jiggsaw_1")["solution"] == solutions[0]
+                                and store.get(puzzles[1][1], "block_jiggsaw_1") is None, "Other layouts are keyed by layout and raw hash")
+        connection = sqlite3.connect(storeFile)
+        tester.test_checker(connection.execute("PRAGMA journal_mode").fetchone()[0] == "wal", "Database is in WAL mode")
+        connection.close()
+
+        tester.setTestGroup("SolutionStore canonical Tests")
+        grid = string2array(puzzles[1][1])
+        relabel = np.concatenate([[0], np.roll(np.arange(1, 10), 2)])
+        copy = grid_to_string(relabel[grid.T])
+        with SolutionStore(storeFile) as store:
+            entry = store.get(copy)
+            tester.test_checker(entry is not None and entry["solution"] == grid_to_string(solve_exact_cover(string2array(copy))[0]),
+                                "Symmetric copy is found in a new run with its own solution")
+            entries = store.getMany([grid_str for _, grid_str in puzzles] + [copy, unknownPuzzle])
+            tester.test_checker(all(entry is not None for entry in entries[:-1]) and entries[-1] is None, "getMany() finds the stored puzzles")
+        connection = sqlite3.connect(storeFile)
+        tester.test_checker(connection.execute("SELECT COUNT(*) FROM aliases").fetchone()[0] == len(puzzles) + 1,
+                            "Raw hash alias is added for the copy")
+        connection.close()
+        boundedFile = os.path.join(tmpDir, "bounded.db")
+        with SolutionStore(boundedFile, maxCanonical=2) as store:
+            tester.test_checker(all(entry is None for entry in store.getMany([grid_str for _, grid_str in puzzles])),
+                                "Puzzles of a new store are unknown")
+            tester.test_checker(len(store._canonical) == 2, "Canonical memo is bounded by maxCanonical")
+            for (_, grid_str), solution in zip(puzzles, solutions):
+                store.put(grid_str, solution)
+            tester.test_checker(len(store._canonical) == 0, "put() uses and drops the memo entries")
+            tester.test_checker(all(entry is not None and entry["solution"] == solution for entry, solution
+                                    in zip(store.getMany([grid_str for _, grid_str in puzzles]), solutions)),
+                                "Puzzles dropped from the memo are stored correctly")
+
+        tester.setTestGroup("run_batch(storeFile) Tests")
+        runFile = os.path.join(tmpDir, "run.db")
+        results = run_batch(dict(puzzles), workers=1, storeFile=runFile)
+        tester.test_checker(all(result["solved"] and result["algorithm"] != "store" for result in results.values()), "First run solves all puzzles")
+        again = run_batch({"copy": copy, **dict(puzzles)}, workers=1, storeFile=runFile)
+        tester.test_checker(all(result["algorithm"] == "store" for result in again.values()), "Second run takes all puzzles from the store")
+        tester.test_checker(list(again.keys()) == ["copy"] + [level for level, _ in puzzles], "Results are in input order")
+        tester.test_checker(all(np.array_equal(again[level]["grid"], results[level]["grid"]) for level, _ in puzzles), "Stored grids equal the solved grids")
+        tester.test_checker(again[puzzles[0][0]]["trace"]["algorithm"] == results[puzzles[0][0]]["algorithm"], "Trace holds the solving algorithm")
+
+    print("\n" + "="*50)
+    print(tester)
@@ -0,0 +1,79 @@
+# stats_tests.py
+# Tests for the opt-in solver statistics of the Sudoku class
+# Werner Schoegler, 26-Nov-2025
+
+import sys
+import os
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from sudoku2 import Sudoku, STATS_METHODS
+from tester import Tester
+from runner import solve_puzzle
+from solution_cache import SolutionCache
+from util.string2array import string2array
+from data.test_data import easyTrialSudokus, hardTrialSudokus
+
+if __name__ == '__main__':
+    tester = Tester()
+
+    tester.setTestGroup("Disabled stats Tests")
+    grid_str = next(iter(hardTrialSudokus.values()))
+    sudoku = Sudoku(string2array(grid_str))
+    tester.test_checker(sudoku.stats() is None, "Stats are disabled by default")
+    tester.test_checker(not any(name in sudoku.__dict__ for name in STATS_METHODS + ["getCandidates"]), "No wrappers without stats")
+    sudoku.enableStats()
+    sudoku.enableStats(False)
+    tester.test_checker(sudoku.stats() is None, "Stats are disabled again")
+    tester.test_checker(not any(name in sudoku.__dict__ for name in STATS_METHODS + ["getCandidates"]), "Wrappers are removed when disabled")
+
+    tester.setTestGroup("solver1 stats Tests")
+    for level, grid_str in easyTrialSudokus.items():
+        sudoku = Sudoku(string2array(grid_str))
+        reference = Sudoku(string2array(grid_str))
+        emptyCells = sudoku.count_empty_cells()
+        sudoku.enableStats()
+        solved = sudoku.solver1()
+        tester.test_checker(solved == reference.solver1() and np.array_equal(sudoku.grid, reference.grid), f"Same result with stats for {level}")
+        stats = sudoku.stats()
+        passes = stats["passes"]
+        tester.test_checker(stats["methods"]["solver1"]["calls"] == 1, f"One solver1 call for {level}")
+        tester.test_checker(sum(entry["placed"] for entry in passes) == emptyCells - sudoku.count_empty_cells(), f"Passes of {level} placed all values")
+        tester.test_checker(len(passes) == stats["methods"]["solveSingles"]["calls"] + stats["methods"].get("solveHiddenSingles", {"calls": 0})["calls"],
+                            f"One pass per singles / hidden singles call for {level}")
+        tester.test_checker(stats["getCandidates"] > 0 and stats["nodes"] == 0, f"Candidate lookups but no search nodes for {level}")
+
+    tester.setTestGroup("Search stats Tests")
+    for level, grid_str in hardTrialSudokus.items():
+        sudoku = Sudoku(string2array(grid_str))
+        sudoku.enableStats()
+        sudoku.solveBacktrackOptimized()
+        stats = sudoku.stats()
+        tester.test_checker(stats["nodes"] > 0 and stats["methods"]["solveBacktrackOptimized"]["progress"] == 1, f"Search nodes counted for {level}")
+        sudoku.resetStats()
+        tester.test_checker(sudoku.stats()["nodes"] == 0 and sudoku.stats()["methods"] == {}, f"Stats of {level} are reset")
+    grid_str = next(iter(hardTrialSudokus.values()))
+    cache = SolutionCache()
+    first = Sudoku(string2array(grid_str))
+    first.setSolutionCache(cache)
+    first.solveBacktrackOptimized()
+    sudoku = Sudoku(string2array(grid_str))
+    sudoku.setSolutionCache(cache)
+    sudoku.enableStats()
+    tester.test_checker(sudoku.solveBacktrackOptimized(), "Second solve is a cache hit")
+    tester.test_checker(sudoku.stats()["nodes"] == 0 and sudoku.stats()["methods"]["solveBacktrackOptimized"]["progress"] == 1,
+                        "No search nodes counted for a cache hit")
+
+    tester.setTestGroup("Runner stats Tests")
+    result = solve_puzzle("hard", next(iter(hardTrialSudokus.values())), enableStats=True)
+    tester.test_checker(result["solved"] and result["stats"]["methods"]["solver1"]["calls"] == 3, "Runner result holds the stats of the cascade")
+    result = solve_puzzle("hard", next(iter(hardTrialSudokus.values())))
+    tester.test_checker("stats" not in result, "Runner result has no stats when disabled")
+
+    print("\n" + "="*50)
+    print(tester)
@@ -0,0 +1,77 @@
+# subset_tests.py
+# Tests for the naked and hidden subsets (pairs, triples, quads) on the persistent candidate eliminations
+# Werner Schoegler, 01-Dec-2025
+
+import sys
+import os
+# Adjust the path to import sudoku2 module
+home_dir = os.path.expanduser("~")
+python_dir = home_dir + "/devel_wsc_py/"
+print(f"Adding {python_dir}/sudoku2 to sys.path for imports")
+if python_dir not in sys.path:
+    sys.path.append(python_dir + "/sudoku2")  # to allow import from sibling directory
+
+import numpy as np
+from sudoku2 import Sudoku, SUBSET_MASKS
+from tester import Tester, solver1_keeps_solution
+from search import ALL_VALUES_MASK
+from rater import rate_puzzle
+from util.string2array import string2array
+from data.test_data import hardTrialSudokus
+
+if __name__ == '__main__':
+    tester = Tester()
+
+    tester.setTestGroup("Subset mask table Tests")
+    tester.test_checker([len(SUBSET_MASKS[size]) for size in range(2, 5)] == [36, 84, 126], "Number of pairs, triples and quads")
+
+    tester.setTestGroup("solveNakedSubsets() Tests")
+    for size in range(2, 5):
+        subset = (1 << size) - 1  # values 1..size
+        sudoku = Sudoku(np.zeros((9, 9), dtype=int))
+        for col in range(size):
+            sudoku.eliminated[col] = ALL_VALUES_MASK & ~subset
+        tester.test_checker(sudoku.solveNakedSubsets(), f"Naked subset of size {size} found in row 0")
+        tester.test_checker(all(sudoku._getCandidateMask(0, col) & subset == 0 for col in range(size, 9)),
+                            f"Naked subset values of size {size} removed from the rest of row 0")
+        tester.test_checker(sudoku._getCandidateMask(1, 8) == ALL_VALUES_MASK, f"Cells outside the houses keep their candidates (size {size})")
+        tester.test_checker(not sudoku.solveNakedSubsets(), f"Second pass finds nothing new (size {size})")
+    sudoku = Sudoku(np.zeros((9, 9), dtype=int))
+    sudoku.eliminated[0] = sudoku.eliminated[1] = ALL_VALUES_MASK & ~0b11
+    sudoku.solveNakedSubsets()
+    tester.test_checker(all(sudoku._getCandidateMask(row, col) & 0b11 == 0 for row in range(3) for col in range(3) if row > 0),
+                        "Naked pair also removes its values from the block")
+
+    tester.setTestGroup("solveHiddenSubsets() Tests")
+    for size in range(2, 5):
+        subset = (1 << size) - 1  # values 1..size only in the first size cells of row 0
+        sudoku = Sudoku(np.zeros((9, 9), dtype=int))
+        for col in range(size, 9):
+            sudoku.eliminated[col] = subset
+        tester.test_checker(sudoku.solveHiddenSubsets(), f"Hidden subset of size {size} found in row 0")
+        tester.test_checker(all(sudoku._getCandidateMask(0, col) == subset for col in range(size)),
+                            f"Other candidates removed from the hidden subset cells (size {size})")
+        tester.test_checker(sudoku.getCandidates(0, 8) == list(range(size + 1, 10)), f"Other cells are unchanged (size {size})")
+    sudoku = Sudoku(np.zeros((9, 9), dtype=int))
+    sudoku.eliminated[0] = 0b11
+    sudoku.setGrid(np.zeros((9, 9), dtype=int))
+    tester.test_checker(sudoku.eliminated[0] == 0, "setGrid() drops the eliminations")
+
+    tester.setTestGroup("solver1(enableSubsets=True) Tests")
+    solvedSingles = solvedSubsets = 0
+    valid = True
+    for level, grid_str in hardTrialSudokus.items():
+        grid = string2array(grid_str)
+        solvedSingles += Sudoku(grid.copy()).solver1()
+        solved, sound = solver1_keeps_solution(grid, enableSubsets=True)
+        solvedSubsets += solved
+        valid = valid and sound
+    tester.test_checker(valid, "Subsets never remove the value of the solution")
+    tester.test_checker(solvedSubsets > solvedSingles, f"More hard puzzles solved logically with subsets ({solvedSubsets} > {solvedSingles})")
+
+    tester.setTestGroup("Rater Tests")
+    techniques = {rate_puzzle(grid_str)["technique"] for grid_str in hardTrialSudokus.values()}
+    tester.test_checker("naked subset" in techniques or "hidden subset" in techniques, "Rater uses the subset techniques")
+
+    print("\n" + "="*50)
+    print(tester)
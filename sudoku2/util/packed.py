@@ -0,0 +1,173 @@
+# packed.py
+# compact binary puzzle file: 4 bits per cell, one fixed size record of 41 bytes per puzzle
+# file layout (little endian):
+#   header: magic b"SUDOKU4\0" (8 bytes), uint32 version, uint32 number of puzzles
+#   records: 41 bytes each, byte j holds cell 2j in the low nibble and cell 2j+1 in the high nibble
+#            (cell = row*9 + col, 0: empty cell, the high nibble of the last byte is 0)
+# the records are read through np.memmap, so slicing a file does not parse or load the whole file
+# keys and comments of the text formats are not stored, a puzzle is addressed by its record index
+# Werner Schoegler, 27-Nov-2025
+
+import re
+import struct
+
+import numpy as np
+
+from util.string2array import strings2array
+
+MAGIC = b"SUDOKU4\0"
+VERSION = 1
+HEADER_FORMAT = "<8sII"
+HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+RECORD_SIZE = 41
+# number of puzzles converted at once by the converters (bounded memory for large files)
+CONVERT_BATCH_SIZE = 100000
+
+
+def pack_grids(grids: np.ndarray) -> np.ndarray:
+    """Pack (N,9,9) grids into (N,41) uint8 records."""
+    cells = np.asarray(grids).reshape(-1, 81)
+    if np.any((cells < 0) | (cells > 9)):
+        raise ValueError("Grid values must be in the range 0-9.")
+    padded = np.zeros((len(cells), 2 * RECORD_SIZE), dtype=np.uint8)
+    padded[:, :81] = cells
+    return padded[:, 0::2] | (padded[:, 1::2] << 4)
+
+
+def unpack_records(records: np.ndarray) -> np.ndarray:
+    """Unpack (N,41) uint8 records into (N,9,9) int grids."""
+    records = np.asarray(records, dtype=np.uint8).reshape(-1, RECORD_SIZE)
+    cells = np.empty((len(records), 2 * RECORD_SIZE), dtype=np.uint8)
+    cells[:, 0::2] = records & 0x0F
+    cells[:, 1::2] = records >> 4
+    return cells[:, :81].astype(int).reshape(-1, 9, 9)
+
+
+class PackedWriter:
+    """Write grids to a packed file in batches, the puzzle count in the header is set by close()."""
+
+    def __init__(self, fileName: str):
+        self.fileName = fileName
+        self.count = 0
+        self.fp = open(fileName, "wb")
+        self.fp.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, 0))
+
+    def write(self, grids: np.ndarray) -> None:
+        records = pack_grids(grids)
+        self.fp.write(records.tobytes())
+        self.count += len(records)
+
+    def close(self) -> None:
+        self.fp.seek(0)
+        self.fp.write(struct.pack(HEADER_FORMAT, MAGIC, VERSION, self.count))
+        self.fp.close()
+
+    def __enter__(self) -> "PackedWriter":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+
+def write_packed(fileName: str, grids: np.ndarray) -> int:
+    """Write (N,9,9) grids to a packed file, returns the number of puzzles."""
+    with PackedWriter(fileName) as writer:
+        writer.write(grids)
+    return writer.count
+
+
+class PackedPuzzles:
+    """Read access to a packed file through np.memmap, indexing and slicing return (9,9) / (N,9,9) grids."""
+
+    def __init__(self, fileName: str):
+        with open(fileName, "rb") as fp:
+            header = fp.read(HEADER_SIZE)
+        if len(header) < HEADER_SIZE:
+            raise ValueError(f"{fileName} is too short for a packed puzzle file.")
+        magic, version, count = struct.unpack(HEADER_FORMAT, header)
+        if magic != MAGIC or version != VERSION:
+            raise ValueError(f"{fileName} is not a packed puzzle file (version {VERSION}).")
+        self.fileName = fileName
+        if count == 0:
+            self.records = np.zeros((0, RECORD_SIZE), dtype=np.uint8)
+        else:
+            self.records = np.memmap(fileName, dtype=np.uint8, mode="r", offset=HEADER_SIZE, shape=(count, RECORD_SIZE))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __getitem__(self, index) -> np.ndarray:
+        grids = unpack_records(self.records[index])
+        return grids[0] if np.ndim(index) == 0 and not isinstance(index, slice) else grids
+
+    def strings(self, index=slice(None)) -> list[str]:
+        """Return puzzles as 81 character strings ('0': empty cell)."""
+        grids = unpack_records(self.records[index]).reshape(-1, 81) + ord("0")
+        return [row.astype(np.uint8).tobytes().decode("ascii") for row in grids]
+
+
+def open_packed(fileName: str) -> PackedPuzzles:
+    """Open a packed puzzle file for memory mapped read access."""
+    return PackedPuzzles(fileName)
+
+
+def iter_text_puzzles(fileName: str):
+    """Yield the puzzle strings of a text file with one 81 character puzzle per line
+    (comments start with // or #, reading stops at a STOP line)."""
+    with open(fileName, "r") as fp:
+        for line in fp:
+            if line.strip() == "STOP":
+                break
+            puzzle = re.split(r"//|#", line, maxsplit=1)[0].strip()
+            if len(puzzle) == 81:
+                yield puzzle
+
+
+def iter_dict_puzzles(fileName: str):
+    """Yield the puzzle strings of a python dict literal file like data/*_new.txt or data/test_data.py
+    (lines like '"hard 1" :  "52...6...",  # comment')."""
+    pattern = re.compile(r'^\s*"[^"]*"\s*:\s*"([^"]{81})"')
+    with open(fileName, "r") as fp:
+        for line in fp:
+            match = pattern.match(line)
+            if match is not None:
+                yield match.group(1)
+
+
+def _convert(puzzles, outFile: str) -> int:
+    """Pack an iterable of puzzle strings in batches of CONVERT_BATCH_SIZE."""
+    with PackedWriter(outFile) as writer:
+        batch = []
+        for puzzle in puzzles:
+            batch.append(puzzle)
+            if len(batch) >= CONVERT_BATCH_SIZE:
+                writer.write(strings2array(batch))
+                batch = []
+        if len(batch) > 0:
+            writer.write(strings2array(batch))
+    return writer.count
+
+
+def convert_text_file(inFile: str, outFile: str) -> int:
+    """Convert a text file with one puzzle per line (e.g. data/top95.txt) to a packed file."""
+    return _convert(iter_text_puzzles(inFile), outFile)
+
+
+def convert_dict_file(inFile: str, outFile: str) -> int:
+    """Convert a python dict literal file (e.g. data/top95_new.txt) to a packed file."""
+    return _convert(iter_dict_puzzles(inFile), outFile)
+
+
+if __name__ == '__main__':
+    import glob
+    import os
+
+    # convert all data files, *_new.txt are dict literal files, the others have one puzzle per line
+    data_dir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
+    for inFile in sorted(glob.glob(os.path.join(data_dir, "*.txt"))):
+        outFile = os.path.splitext(inFile)[0] + ".sdk4"
+        if inFile.endswith("_new.txt"):
+            count = convert_dict_file(inFile, outFile)
+        else:
+            count = convert_text_file(inFile, outFile)
+        print(f"{os.path.basename(inFile):24} -> {os.path.basename(outFile):24} {count:6} puzzles")
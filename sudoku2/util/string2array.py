@@ -20,4 +20,15 @@ def string2array(s: str) -> np.ndarray:
         if c == 9:
             c = 0
             r += 1
-    return grid
\ No newline at end of file
+    return grid
+
+def strings2array(strings: list[str]) -> np.ndarray:
+    """Convert a list of Sudoku strings to a (N, 9, 9) numpy array in one vectorized step."""
+    stripped = [s.strip() for s in strings]
+    for s in stripped:
+        if len(s) != 81:
+            raise ValueError("Each input string must have exactly 81 characters representing the Sudoku grid.")
+    data = np.frombuffer("".join(stripped).encode("ascii"), dtype=np.uint8) - ord("0")
+    # '.' and any other non digit character wraps around to a value > 9 and is an empty cell
+    data = np.where(data <= 9, data, 0).astype(int)
+    return data.reshape(len(stripped), 9, 9)